@@ -0,0 +1,121 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B1sB")
+BISTURI_PACKET_COOKIE = '26e1f606df8fa87315dac9aa5790c1fbe63dabcd'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'num' and 'bits'"
+      if pkt.bits & ~0xff:
+         raise ValueError("The value %i does not fit in 8 bits." % pkt.bits)
+      fragments.append(_struct_0.pack(pkt.num, pkt.data, pkt.bits))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "num"
+      if len(raw) - offset < 3:
+         raise _incomplete_data(len(raw) - offset, 3)
+
+
+
+      name = "between 'num' and 'bits'"
+      pkt.num, pkt.data, bits_2, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__bits = bits_2
+      pkt.bits = bits_2 & 0xff
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'num' and 'bits'"
+      if pkt.bits & ~0xff:
+         raise ValueError("The value %i does not fit in 8 bits." % pkt.bits)
+      _struct_0.pack_into(buffer, offset, pkt.num, pkt.data, pkt.bits)
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.num
+   except AttributeError:
+      pass
+   else:
+      new.num = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.bits
+   except AttributeError:
+      pass
+   else:
+      new.bits = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__bits
+   except AttributeError:
+      pass
+   else:
+      new._bits__bits = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.num = defaults.get('num', 0)
+   pkt.data = defaults.get('data', b'\x00')
+   pkt._bits__bits = 0
+   pkt.bits = defaults.get('bits', 0)
@@ -0,0 +1,196 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">1s")
+BISTURI_PACKET_COOKIE = '68e00469148463ae3e8264a0db3b362de6f848b8'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "a"
+      fragments.append(_struct_0.pack(pkt.a))
+
+
+
+      name = "b"
+      value = pkt.b
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + pkt._delimiter__b)
+
+
+      name = "c"
+      value = pkt.c
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + pkt._delimiter__c)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "a"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "a"
+      pkt.a, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "b"
+      field = fields[1][1]
+      match = field.until_marker.search(raw, offset)
+      if not match:
+         raise field._marker_not_found(raw, offset)
+      count = match.start() - offset
+      extra_count = match.end() - match.start()
+      pkt._delimiter__b = bytes(match.group())
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.b = chunk
+      offset = next_offset + extra_count
+
+
+      name = "c"
+      field = fields[2][1]
+      match = field.until_marker.search(raw, offset)
+      if not match:
+         raise field._marker_not_found(raw, offset)
+      count = match.start() - offset
+      extra_count = match.end() - match.start()
+      pkt._delimiter__c = bytes(match.group())
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.c = chunk
+      offset = next_offset + extra_count
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "a"
+      _struct_0.pack_into(buffer, offset, pkt.a)
+      offset += 1
+
+
+
+      name = "b"
+      value = pkt.b
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += pkt._delimiter__b
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "c"
+      value = pkt.c
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += pkt._delimiter__c
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.a
+   except AttributeError:
+      pass
+   else:
+      new.a = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.b
+   except AttributeError:
+      pass
+   else:
+      new.b = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__b
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__b = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.c
+   except AttributeError:
+      pass
+   else:
+      new.c = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__c
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__c = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.a = defaults.get('a', b'\x00')
+   pkt.b = defaults.get('b', b'')
+   pkt._delimiter__b = b''
+   pkt.c = defaults.get('c', b'')
+   pkt._delimiter__c = b''
@@ -0,0 +1,101 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">I")
+BISTURI_PACKET_COOKIE = 'f487df828d13e9684dba05c68beeb8d22ea55c0a'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "checksum"
+      fragments.append(_struct_0.pack(pkt.checksum))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "attributes"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "checksum"
+      next_offset = offset + 4
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 4)
+      pkt.checksum, = _struct_0.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.attributes
+   except AttributeError:
+      pass
+   else:
+      new.attributes = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__attributes
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__attributes = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.checksum
+   except AttributeError:
+      pass
+   else:
+      new.checksum = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   pkt.checksum = defaults.get('checksum', 0)
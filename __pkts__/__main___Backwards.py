@@ -0,0 +1,131 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+_struct_1 = Struct(">4s")
+BISTURI_PACKET_COOKIE = 'dc82439bcdbb76579b22e59a3ec8f819723a5737'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "i"
+      fragments.append(_struct_0.pack(pkt.i))
+
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "d"
+      fragments.append(_struct_1.pack(pkt.d))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+
+
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "i"
+      next_offset = offset + 1
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 1)
+      pkt.i, = _struct_0.unpack_from(raw, offset)
+      offset = next_offset
+
+
+
+      name, _, _, unpack = fields[2]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "d"
+      next_offset = offset + 4
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 4)
+      pkt.d, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt._shift_to_i
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_i = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.i
+   except AttributeError:
+      pass
+   else:
+      new.i = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_d
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_d = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.d
+   except AttributeError:
+      pass
+   else:
+      new.d = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   pkt.i = defaults.get('i', 0)
+   fields[2][1].init(pkt, defaults)
+   pkt.d = defaults.get('d', b'\x00\x00\x00\x00')
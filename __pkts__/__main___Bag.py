@@ -0,0 +1,104 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = 'c870c405a09639c6ee69a915d70863e91fb97ff4'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "num"
+      fragments.append(_struct_0.pack(pkt.num))
+
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "num"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "num"
+      pkt.num, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "objects"
+      sequence = []
+      pkt.objects = sequence
+      unpack = fields[1][1].prototype_field.unpack
+      count = pkt.num
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__objects)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.num
+   except AttributeError:
+      pass
+   else:
+      new.num = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.objects
+   except AttributeError:
+      pass
+   else:
+      new.objects = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__objects
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__objects = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.num = defaults.get('num', 0)
+   fields[1][1].init(pkt, defaults)
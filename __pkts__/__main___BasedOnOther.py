@@ -0,0 +1,178 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B2s")
+BISTURI_PACKET_COOKIE = '93612e6e37c436415fe0b37756960e2f37bff776'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'length' and 'a'"
+      fragments.append(_struct_0.pack(pkt.length, pkt.a))
+
+
+
+      name = "b"
+      value = pkt.b
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+
+      name = "c"
+      value = pkt.c
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "length"
+      if len(raw) - offset < 3:
+         raise _incomplete_data(len(raw) - offset, 3)
+
+
+
+      name = "between 'length' and 'a'"
+      pkt.length, pkt.a, = _struct_0.unpack_from(raw, offset)
+      offset += 3
+
+
+
+      name = "b"
+      byte_count = pkt.length
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.b = chunk
+      offset = next_offset
+
+
+      name = "c"
+      byte_count = (pkt.length * 2)
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.c = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'length' and 'a'"
+      _struct_0.pack_into(buffer, offset, pkt.length, pkt.a)
+      offset += 3
+
+
+
+      name = "b"
+      value = pkt.b
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "c"
+      value = pkt.c
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.a
+   except AttributeError:
+      pass
+   else:
+      new.a = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.b
+   except AttributeError:
+      pass
+   else:
+      new.b = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.c
+   except AttributeError:
+      pass
+   else:
+      new.c = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.length = defaults.get('length', 0)
+   pkt.a = defaults.get('a', b'\x00\x00')
+   pkt.b = defaults.get('b', b'')
+   pkt.c = defaults.get('c', b'')
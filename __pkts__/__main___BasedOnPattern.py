@@ -0,0 +1,253 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+BISTURI_PACKET_COOKIE = '774c7d4fb89e5c9485b359b8ee3efe0fd9ee6df1'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "a"
+      value = pkt.a
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+
+      name = "b"
+      value = pkt.b
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + b'fff')
+
+
+      name = "c"
+      value = pkt.c
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+
+      name = "d"
+      value = pkt.d
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + pkt._delimiter__d)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "a"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+
+      name = "a"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[0][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'\x00', offset)
+      if position < 0:
+         raise fields[0][1]._marker_not_found(raw, offset)
+      count = position - offset
+      count += 1
+      extra_count = 0
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.a = chunk
+      offset = next_offset + extra_count
+
+
+      name = "b"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[1][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'fff', offset)
+      if position < 0:
+         raise fields[1][1]._marker_not_found(raw, offset)
+      count = position - offset
+
+      extra_count = 3
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.b = chunk
+      offset = next_offset + extra_count
+
+
+      name = "c"
+      field = fields[2][1]
+      match = field.until_marker.search(raw, offset)
+      if not match:
+         raise field._marker_not_found(raw, offset)
+      count = match.end() - offset
+      extra_count = 0
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.c = chunk
+      offset = next_offset + extra_count
+
+
+      name = "d"
+      field = fields[3][1]
+      match = field.until_marker.search(raw, offset)
+      if not match:
+         raise field._marker_not_found(raw, offset)
+      count = match.start() - offset
+      extra_count = match.end() - match.start()
+      pkt._delimiter__d = bytes(match.group())
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.d = chunk
+      offset = next_offset + extra_count
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "a"
+      value = pkt.a
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "b"
+      value = pkt.b
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += b'fff'
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "c"
+      value = pkt.c
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "d"
+      value = pkt.d
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += pkt._delimiter__d
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.a
+   except AttributeError:
+      pass
+   else:
+      new.a = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.b
+   except AttributeError:
+      pass
+   else:
+      new.b = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.c
+   except AttributeError:
+      pass
+   else:
+      new.c = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.d
+   except AttributeError:
+      pass
+   else:
+      new.d = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__d
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__d = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.a = defaults.get('a', b'')
+   pkt.b = defaults.get('b', b'')
+   pkt.c = defaults.get('c', b'')
+   pkt.d = defaults.get('d', b'')
+   pkt._delimiter__d = b''
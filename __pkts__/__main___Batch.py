@@ -0,0 +1,148 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+_struct_1 = Struct(">H")
+BISTURI_PACKET_COOKIE = '385a53d7fc9bd0574597c37ef60c2735bc1b3f91'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "count"
+      fragments.append(_struct_0.pack(pkt.count))
+
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "checksum"
+      fragments.append(_struct_1.pack(pkt.checksum))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "first"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "count"
+      next_offset = offset + 1
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 1)
+      pkt.count, = _struct_0.unpack_from(raw, offset)
+      offset = next_offset
+
+
+
+      name = "rest"
+      sequence = []
+      pkt.rest = sequence
+      unpack = fields[2][1].prototype_field.unpack
+      count = pkt.count
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__rest)
+
+
+
+      name = "checksum"
+      next_offset = offset + 2
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 2)
+      pkt.checksum, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.first
+   except AttributeError:
+      pass
+   else:
+      new.first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.count
+   except AttributeError:
+      pass
+   else:
+      new.count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.rest
+   except AttributeError:
+      pass
+   else:
+      new.rest = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__rest
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__rest = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.checksum
+   except AttributeError:
+      pass
+   else:
+      new.checksum = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   pkt.count = defaults.get('count', 0)
+   fields[2][1].init(pkt, defaults)
+   pkt.checksum = defaults.get('checksum', 0)
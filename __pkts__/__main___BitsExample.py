@@ -0,0 +1,118 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">H")
+BISTURI_PACKET_COOKIE = '175972cbc0b1ccca30fa8433adcbc02389825ada'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'fragment_offset' and 'flags'"
+      if pkt.fragment_offset & ~0xfff:
+         raise ValueError("The value %i does not fit in 12 bits." % pkt.fragment_offset)
+      if pkt.flags & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags)
+      fragments.append(_struct_0.pack((pkt.fragment_offset << 4) | pkt.flags))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "fragment_offset"
+      if len(raw) - offset < 2:
+         raise _incomplete_data(len(raw) - offset, 2)
+
+
+
+      name = "between 'fragment_offset' and 'flags'"
+      bits_0, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__fragment_offset_flags = bits_0
+      pkt.fragment_offset = (bits_0 & 0xfff0) >> 4
+      pkt.flags = bits_0 & 0xf
+      offset += 2
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'fragment_offset' and 'flags'"
+      if pkt.fragment_offset & ~0xfff:
+         raise ValueError("The value %i does not fit in 12 bits." % pkt.fragment_offset)
+      if pkt.flags & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags)
+      _struct_0.pack_into(buffer, offset, (pkt.fragment_offset << 4) | pkt.flags)
+      offset += 2
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.fragment_offset
+   except AttributeError:
+      pass
+   else:
+      new.fragment_offset = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags
+   except AttributeError:
+      pass
+   else:
+      new.flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__fragment_offset_flags
+   except AttributeError:
+      pass
+   else:
+      new._bits__fragment_offset_flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__fragment_offset_flags = 0
+   pkt.fragment_offset = defaults.get('fragment_offset', 0)
+   pkt.flags = defaults.get('flags', 0)
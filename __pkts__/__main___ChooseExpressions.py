@@ -0,0 +1,153 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+BISTURI_PACKET_COOKIE = 'd1d900a51164b01c659b8593d2514314fc302c00'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "size_type"
+      value = pkt.size_type
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + b'\x00')
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "size_type"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "size_type"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[0][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'\x00', offset)
+      if position < 0:
+         raise fields[0][1]._marker_not_found(raw, offset)
+      count = position - offset
+
+      extra_count = 1
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.size_type = chunk
+      offset = next_offset + extra_count
+
+
+      name = "data"
+      byte_count = {b'small': 2, b'large': 4, b'extra_large': 8}[pkt.size_type]
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.data = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "size_type"
+      value = pkt.size_type
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += b'\x00'
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.size_type
+   except AttributeError:
+      pass
+   else:
+      new.size_type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.size_type = defaults.get('size_type', b'')
+   pkt.data = defaults.get('data', b'')
@@ -0,0 +1,157 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BBH4s")
+BISTURI_PACKET_COOKIE = '1a65689a23929477575278d07ce1b730936df1d2'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'version' and 'dst_ip'"
+      fragments.append(_struct_0.pack(pkt.version, pkt.command, pkt.dst_port, pkt.dst_ip))
+
+
+
+      name = "user_id"
+      value = pkt.user_id
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + b'\x00')
+
+
+      name, _, pack, _ = fields[5]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "version"
+      if len(raw) - offset < 9:
+         raise _incomplete_data(len(raw) - offset, 9)
+
+
+
+      name = "between 'version' and 'dst_ip'"
+      pkt.version, pkt.command, pkt.dst_port, pkt.dst_ip, = _struct_0.unpack_from(raw, offset)
+      offset += 8
+
+
+
+      name = "user_id"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[4][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'\x00', offset)
+      if position < 0:
+         raise fields[4][1]._marker_not_found(raw, offset)
+      count = position - offset
+
+      extra_count = 1
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.user_id = chunk
+      offset = next_offset + extra_count
+
+
+      name, _, _, unpack = fields[5]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.version
+   except AttributeError:
+      pass
+   else:
+      new.version = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.command
+   except AttributeError:
+      pass
+   else:
+      new.command = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.dst_port
+   except AttributeError:
+      pass
+   else:
+      new.dst_port = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.dst_ip
+   except AttributeError:
+      pass
+   else:
+      new.dst_ip = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.user_id
+   except AttributeError:
+      pass
+   else:
+      new.user_id = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.domain_name
+   except AttributeError:
+      pass
+   else:
+      new.domain_name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__domain_name
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__domain_name = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.version = defaults.get('version', 4)
+   pkt.command = defaults.get('command', 1)
+   pkt.dst_port = defaults.get('dst_port', 0)
+   pkt.dst_ip = defaults.get('dst_ip', b'\x00\x00\x00\x00')
+   pkt.user_id = defaults.get('user_id', b'')
+   fields[5][1].init(pkt, defaults)
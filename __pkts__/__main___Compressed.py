@@ -0,0 +1,99 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BB")
+BISTURI_PACKET_COOKIE = '7855fedb08b4c286a019fcb5d4ccbaf2d6ef594f'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'length' and 'level'"
+      fragments.append(_struct_0.pack(pkt.length, pkt.level))
+
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "length"
+      if len(raw) - offset < 2:
+         raise _incomplete_data(len(raw) - offset, 2)
+
+
+
+      name = "between 'length' and 'level'"
+      pkt.length, pkt.level, = _struct_0.unpack_from(raw, offset)
+      offset += 2
+
+
+
+      name, _, _, unpack = fields[2]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.level
+   except AttributeError:
+      pass
+   else:
+      new.level = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.length = defaults.get('length', 0)
+   pkt.level = defaults.get('level', 0)
+   fields[2][1].init(pkt, defaults)
@@ -0,0 +1,143 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = 'a45fef10fdd02fc475d7f71cf7687bbb0b743fd3'
+
+def pack_impl(pkt, fragments, **k):
+   sync_methods = pkt.get_sync_before_pack_methods()
+   sync_methods[0](pkt)
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "_described_length_in_bits"
+      fragments.append(_struct_0.pack(pkt._described_length_in_bits))
+
+
+
+      name = "a"
+      value = pkt.a
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "_described_length_in_bits"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "_described_length_in_bits"
+      pkt._described_length_in_bits, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "a"
+      byte_count = (pkt._described_length_in_bits // 8)
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.a = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+   sync_methods = pkt.get_sync_before_pack_methods()
+   sync_methods[0](pkt)
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "_described_length_in_bits"
+      _struct_0.pack_into(buffer, offset, pkt._described_length_in_bits)
+      offset += 1
+
+
+
+      name = "a"
+      value = pkt.a
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt._described_length_in_bits
+   except AttributeError:
+      pass
+   else:
+      new._described_length_in_bits = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.a
+   except AttributeError:
+      pass
+   else:
+      new.a = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._is_descriptor_length_in_bits_enabled
+   except AttributeError:
+      pass
+   else:
+      new._is_descriptor_length_in_bits_enabled = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._described_length_in_bits = defaults.get('_described_length_in_bits', 0)
+   if 'length_in_bits' in defaults:
+      pkt.length_in_bits = defaults['length_in_bits']
+   pkt.a = defaults.get('a', b'')
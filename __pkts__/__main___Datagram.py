@@ -0,0 +1,127 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = '771af36de7ecc7249ec30f1c9c7c284390704797'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "size"
+      fragments.append(_struct_0.pack(pkt.size))
+
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "size"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "size"
+      pkt.size, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "data"
+      byte_count = pkt.size
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.data = chunk
+      offset = next_offset
+
+
+      name, _, _, unpack = fields[2]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      name, _, _, unpack = fields[3]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.size
+   except AttributeError:
+      pass
+   else:
+      new.size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_tail
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_tail = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.size = defaults.get('size', 0)
+   pkt.data = defaults.get('data', b'')
+   fields[2][1].init(pkt, defaults)
+   fields[3][1].init(pkt, defaults)
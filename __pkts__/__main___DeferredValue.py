@@ -0,0 +1,185 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = 'bfe69e33672fe735f67516769f6ff3194282ace3'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "number"
+      fragments.append(_struct_0.pack(pkt.number))
+
+
+
+      name = "paylaod"
+      value = pkt.paylaod
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[4]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "number"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "number"
+      pkt.number, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "paylaod"
+      byte_count = pkt.number
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.paylaod = chunk
+      offset = next_offset
+
+
+      name = "elemens"
+      sequence = []
+      pkt.elemens = sequence
+      unpack = fields[2][1].prototype_field.unpack
+      count = pkt.number
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__elemens)
+
+
+      name = "msg"
+      if bool(pkt.number):
+         offset = fields[3][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.msg = pkt._opt_elem__msg
+      else:
+         pkt.msg = None
+
+
+      name = "author"
+      if bool(pkt.msg):
+         offset = fields[4][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.author = pkt._opt_elem__author
+      else:
+         pkt.author = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.number
+   except AttributeError:
+      pass
+   else:
+      new.number = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.paylaod
+   except AttributeError:
+      pass
+   else:
+      new.paylaod = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.elemens
+   except AttributeError:
+      pass
+   else:
+      new.elemens = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__elemens
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__elemens = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.msg
+   except AttributeError:
+      pass
+   else:
+      new.msg = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__msg
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__msg = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.author
+   except AttributeError:
+      pass
+   else:
+      new.author = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__author
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__author = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.number = defaults.get('number', 0)
+   pkt.paylaod = defaults.get('paylaod', b'')
+   fields[2][1].init(pkt, defaults)
+   fields[3][1].init(pkt, defaults)
+   fields[4][1].init(pkt, defaults)
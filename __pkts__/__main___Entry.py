@@ -0,0 +1,161 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">H3sB")
+_struct_1 = Struct("<BH")
+BISTURI_PACKET_COOKIE = '4c179969ad011ec691f81beb0fb0f8ae8778fad2'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'id' and 'perms'"
+      if pkt.is_dir & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.is_dir)
+      if pkt.perms & ~0x7f:
+         raise ValueError("The value %i does not fit in 7 bits." % pkt.perms)
+      fragments.append(_struct_0.pack(pkt.id, pkt.name, (pkt.is_dir << 7) | pkt.perms))
+
+
+
+      name = "size"
+      fragments.append(_struct_1.pack(pkt.size & 0xff, pkt.size >> 8))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "id"
+      if len(raw) - offset < 9:
+         raise _incomplete_data(len(raw) - offset, 9)
+
+
+
+      name = "between 'id' and 'perms'"
+      pkt.id, pkt.name, bits_2, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__is_dir_perms = bits_2
+      pkt.is_dir = (bits_2 & 0x80) >> 7
+      pkt.perms = bits_2 & 0x7f
+      offset += 6
+
+
+
+      name = "size"
+      int_4_0, int_4_1, = _struct_1.unpack_from(raw, offset)
+      pkt.size = int_4_0 | (int_4_1 << 8)
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'id' and 'perms'"
+      if pkt.is_dir & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.is_dir)
+      if pkt.perms & ~0x7f:
+         raise ValueError("The value %i does not fit in 7 bits." % pkt.perms)
+      _struct_0.pack_into(buffer, offset, pkt.id, pkt.name, (pkt.is_dir << 7) | pkt.perms)
+      offset += 6
+
+
+
+      name = "size"
+      _struct_1.pack_into(buffer, offset, pkt.size & 0xff, pkt.size >> 8)
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.id
+   except AttributeError:
+      pass
+   else:
+      new.id = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name
+   except AttributeError:
+      pass
+   else:
+      new.name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.is_dir
+   except AttributeError:
+      pass
+   else:
+      new.is_dir = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.perms
+   except AttributeError:
+      pass
+   else:
+      new.perms = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__is_dir_perms
+   except AttributeError:
+      pass
+   else:
+      new._bits__is_dir_perms = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size
+   except AttributeError:
+      pass
+   else:
+      new.size = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.id = defaults.get('id', 0)
+   pkt.name = defaults.get('name', b'\x00\x00\x00')
+   pkt._bits__is_dir_perms = 0
+   pkt.is_dir = defaults.get('is_dir', 0)
+   pkt.perms = defaults.get('perms', 0)
+   pkt.size = defaults.get('size', 0)
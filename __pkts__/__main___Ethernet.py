@@ -0,0 +1,136 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = '8838710d0288b9337033df9fdd79c5e632c1c56f'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "size"
+      fragments.append(_struct_0.pack(pkt.size))
+
+
+
+      name = "payload"
+      value = pkt.payload
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "destination"
+      if len(raw) - offset < 13:
+         raise _incomplete_data(len(raw) - offset, 13)
+
+
+
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      name, _, _, unpack = fields[1]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "size"
+      pkt.size, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "payload"
+      byte_count = fields[3][1].byte_count(pkt=pkt, raw=raw, offset=offset, **k)
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.payload = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.destination
+   except AttributeError:
+      pass
+   else:
+      new.destination = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.source
+   except AttributeError:
+      pass
+   else:
+      new.source = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size
+   except AttributeError:
+      pass
+   else:
+      new.size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.payload
+   except AttributeError:
+      pass
+   else:
+      new.payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   fields[1][1].init(pkt, defaults)
+   pkt.size = defaults.get('size', 0)
+   pkt.payload = defaults.get('payload', b'')
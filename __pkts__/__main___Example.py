@@ -0,0 +1,129 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = 'd7c493006891898371b9d60512b52bb38577c17a'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "type"
+      fragments.append(_struct_0.pack(pkt.type))
+
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "type"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "type"
+      pkt.type, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "nonzero_msg"
+      if bool(pkt.type):
+         offset = fields[1][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.nonzero_msg = pkt._opt_elem__nonzero_msg
+      else:
+         pkt.nonzero_msg = None
+
+
+      name = "typeone_msg"
+      if (pkt.type == 1):
+         offset = fields[2][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.typeone_msg = pkt._opt_elem__typeone_msg
+      else:
+         pkt.typeone_msg = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.type
+   except AttributeError:
+      pass
+   else:
+      new.type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.nonzero_msg
+   except AttributeError:
+      pass
+   else:
+      new.nonzero_msg = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__nonzero_msg
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__nonzero_msg = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.typeone_msg
+   except AttributeError:
+      pass
+   else:
+      new.typeone_msg = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__typeone_msg
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__typeone_msg = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.type = defaults.get('type', 0)
+   fields[1][1].init(pkt, defaults)
+   fields[2][1].init(pkt, defaults)
@@ -0,0 +1,122 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B8s")
+_struct_1 = Struct(">4s")
+BISTURI_PACKET_COOKIE = '408bf8f05b6a309fd19b5bae68b8789017d0910f'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'offset_of_file' and 'payload'"
+      fragments.append(_struct_0.pack(pkt.offset_of_file, pkt.payload))
+
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "file_data"
+      fragments.append(_struct_1.pack(pkt.file_data))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "offset_of_file"
+      if len(raw) - offset < 9:
+         raise _incomplete_data(len(raw) - offset, 9)
+
+
+
+      name = "between 'offset_of_file' and 'payload'"
+      pkt.offset_of_file, pkt.payload, = _struct_0.unpack_from(raw, offset)
+      offset += 9
+
+
+
+      name, _, _, unpack = fields[2]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "file_data"
+      next_offset = offset + 4
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 4)
+      pkt.file_data, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.offset_of_file
+   except AttributeError:
+      pass
+   else:
+      new.offset_of_file = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.payload
+   except AttributeError:
+      pass
+   else:
+      new.payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_file_data
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_file_data = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.file_data
+   except AttributeError:
+      pass
+   else:
+      new.file_data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.offset_of_file = defaults.get('offset_of_file', 0)
+   pkt.payload = defaults.get('payload', b'\x00\x00\x00\x00\x00\x00\x00\x00')
+   fields[2][1].init(pkt, defaults)
+   pkt.file_data = defaults.get('file_data', b'\x00\x00\x00\x00')
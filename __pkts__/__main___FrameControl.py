@@ -0,0 +1,172 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">H")
+BISTURI_PACKET_COOKIE = '7108dc04c2ed5c9d20dcf2ddb966921e5fc8382d'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'length' and 'fragment_offset'"
+      if pkt.length & ~0x3f:
+         raise ValueError("The value %i does not fit in 6 bits." % pkt.length)
+      if pkt.more_fragments & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.more_fragments)
+      if pkt.fragment_offset & ~0x1ff:
+         raise ValueError("The value %i does not fit in 9 bits." % pkt.fragment_offset)
+      fragments.append(_struct_0.pack((pkt.length << 10) | (pkt.more_fragments << 9) | pkt.fragment_offset))
+
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "length"
+      if len(raw) - offset < 2:
+         raise _incomplete_data(len(raw) - offset, 2)
+
+
+
+      name = "between 'length' and 'fragment_offset'"
+      bits_0, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__length_more_fragments_fragment_offset = bits_0
+      pkt.length = (bits_0 & 0xfc00) >> 10
+      pkt.more_fragments = (bits_0 & 0x200) >> 9
+      pkt.fragment_offset = bits_0 & 0x1ff
+      offset += 2
+
+
+
+      name = "data"
+      byte_count = pkt.length
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.data = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'length' and 'fragment_offset'"
+      if pkt.length & ~0x3f:
+         raise ValueError("The value %i does not fit in 6 bits." % pkt.length)
+      if pkt.more_fragments & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.more_fragments)
+      if pkt.fragment_offset & ~0x1ff:
+         raise ValueError("The value %i does not fit in 9 bits." % pkt.fragment_offset)
+      _struct_0.pack_into(buffer, offset, (pkt.length << 10) | (pkt.more_fragments << 9) | pkt.fragment_offset)
+      offset += 2
+
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.more_fragments
+   except AttributeError:
+      pass
+   else:
+      new.more_fragments = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.fragment_offset
+   except AttributeError:
+      pass
+   else:
+      new.fragment_offset = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__length_more_fragments_fragment_offset
+   except AttributeError:
+      pass
+   else:
+      new._bits__length_more_fragments_fragment_offset = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__length_more_fragments_fragment_offset = 0
+   pkt.length = defaults.get('length', 0)
+   pkt.more_fragments = defaults.get('more_fragments', 0)
+   pkt.fragment_offset = defaults.get('fragment_offset', 0)
+   pkt.data = defaults.get('data', b'')
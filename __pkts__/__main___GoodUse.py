@@ -0,0 +1,161 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HIB")
+BISTURI_PACKET_COOKIE = '9585abc8a42faefd93ea18c6bd367cf27579a084'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'fragment_offset' and 'flags4'"
+      if pkt.fragment_offset & ~0xfff:
+         raise ValueError("The value %i does not fit in 12 bits." % pkt.fragment_offset)
+      if pkt.flags1 & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags1)
+      if pkt.flags3 & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags3)
+      if pkt.flags4 & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags4)
+      fragments.append(_struct_0.pack((pkt.fragment_offset << 4) | pkt.flags1, pkt.i, (pkt.flags3 << 4) | pkt.flags4))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "fragment_offset"
+      if len(raw) - offset < 7:
+         raise _incomplete_data(len(raw) - offset, 7)
+
+
+
+      name = "between 'fragment_offset' and 'flags4'"
+      bits_0, pkt.i, bits_3, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__fragment_offset_flags1 = bits_0
+      pkt.fragment_offset = (bits_0 & 0xfff0) >> 4
+      pkt.flags1 = bits_0 & 0xf
+      pkt._bits__flags3_flags4 = bits_3
+      pkt.flags3 = (bits_3 & 0xf0) >> 4
+      pkt.flags4 = bits_3 & 0xf
+      offset += 7
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'fragment_offset' and 'flags4'"
+      if pkt.fragment_offset & ~0xfff:
+         raise ValueError("The value %i does not fit in 12 bits." % pkt.fragment_offset)
+      if pkt.flags1 & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags1)
+      if pkt.flags3 & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags3)
+      if pkt.flags4 & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags4)
+      _struct_0.pack_into(buffer, offset, (pkt.fragment_offset << 4) | pkt.flags1, pkt.i, (pkt.flags3 << 4) | pkt.flags4)
+      offset += 7
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.fragment_offset
+   except AttributeError:
+      pass
+   else:
+      new.fragment_offset = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags1
+   except AttributeError:
+      pass
+   else:
+      new.flags1 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__fragment_offset_flags1
+   except AttributeError:
+      pass
+   else:
+      new._bits__fragment_offset_flags1 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.i
+   except AttributeError:
+      pass
+   else:
+      new.i = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags3
+   except AttributeError:
+      pass
+   else:
+      new.flags3 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags4
+   except AttributeError:
+      pass
+   else:
+      new.flags4 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__flags3_flags4
+   except AttributeError:
+      pass
+   else:
+      new._bits__flags3_flags4 = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__fragment_offset_flags1 = 0
+   pkt.fragment_offset = defaults.get('fragment_offset', 0)
+   pkt.flags1 = defaults.get('flags1', 0)
+   pkt.i = defaults.get('i', 0)
+   pkt._bits__flags3_flags4 = 0
+   pkt.flags3 = defaults.get('flags3', 0)
+   pkt.flags4 = defaults.get('flags4', 0)
@@ -0,0 +1,280 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BBHHH4s4s4s")
+BISTURI_PACKET_COOKIE = 'e43a8803e73806612c7f8945ca6f9b1192f4b952'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'version' and 'destination_address'"
+      if pkt.version & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.version)
+      if pkt.header_length & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.header_length)
+      if pkt.fragment_offset & ~0x1fff:
+         raise ValueError("The value %i does not fit in 13 bits." % pkt.fragment_offset)
+      if pkt.flags & ~0x7:
+         raise ValueError("The value %i does not fit in 3 bits." % pkt.flags)
+      fragments.append(_struct_0.pack((pkt.version << 4) | pkt.header_length, pkt.type_of_service, pkt.total_length, pkt.identification, (pkt.fragment_offset << 3) | pkt.flags, pkt.others, pkt.source_address, pkt.destination_address))
+
+
+
+      name = "options"
+      value = pkt.options
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "version"
+      if len(raw) - offset < 20:
+         raise _incomplete_data(len(raw) - offset, 20)
+
+
+
+      name = "between 'version' and 'destination_address'"
+      bits_0, pkt.type_of_service, pkt.total_length, pkt.identification, bits_5, pkt.others, pkt.source_address, pkt.destination_address, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__version_header_length = bits_0
+      pkt.version = (bits_0 & 0xf0) >> 4
+      pkt.header_length = bits_0 & 0xf
+      pkt._bits__fragment_offset_flags = bits_5
+      pkt.fragment_offset = (bits_5 & 0xfff8) >> 3
+      pkt.flags = bits_5 & 0x7
+      offset += 20
+
+
+
+      name = "options"
+      byte_count = ((pkt.header_length * 4) - 20)
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.options = chunk
+      offset = next_offset
+
+
+      name = "data"
+      byte_count = (pkt.total_length - (pkt.header_length * 4))
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.data = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'version' and 'destination_address'"
+      if pkt.version & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.version)
+      if pkt.header_length & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.header_length)
+      if pkt.fragment_offset & ~0x1fff:
+         raise ValueError("The value %i does not fit in 13 bits." % pkt.fragment_offset)
+      if pkt.flags & ~0x7:
+         raise ValueError("The value %i does not fit in 3 bits." % pkt.flags)
+      _struct_0.pack_into(buffer, offset, (pkt.version << 4) | pkt.header_length, pkt.type_of_service, pkt.total_length, pkt.identification, (pkt.fragment_offset << 3) | pkt.flags, pkt.others, pkt.source_address, pkt.destination_address)
+      offset += 20
+
+
+
+      name = "options"
+      value = pkt.options
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.version
+   except AttributeError:
+      pass
+   else:
+      new.version = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.header_length
+   except AttributeError:
+      pass
+   else:
+      new.header_length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__version_header_length
+   except AttributeError:
+      pass
+   else:
+      new._bits__version_header_length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.type_of_service
+   except AttributeError:
+      pass
+   else:
+      new.type_of_service = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.total_length
+   except AttributeError:
+      pass
+   else:
+      new.total_length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.identification
+   except AttributeError:
+      pass
+   else:
+      new.identification = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.fragment_offset
+   except AttributeError:
+      pass
+   else:
+      new.fragment_offset = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags
+   except AttributeError:
+      pass
+   else:
+      new.flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__fragment_offset_flags
+   except AttributeError:
+      pass
+   else:
+      new._bits__fragment_offset_flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.others
+   except AttributeError:
+      pass
+   else:
+      new.others = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.source_address
+   except AttributeError:
+      pass
+   else:
+      new.source_address = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.destination_address
+   except AttributeError:
+      pass
+   else:
+      new.destination_address = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.options
+   except AttributeError:
+      pass
+   else:
+      new.options = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__version_header_length = 0
+   pkt.version = defaults.get('version', 0)
+   pkt.header_length = defaults.get('header_length', 0)
+   pkt.type_of_service = defaults.get('type_of_service', 0)
+   pkt.total_length = defaults.get('total_length', 0)
+   pkt.identification = defaults.get('identification', 0)
+   pkt._bits__fragment_offset_flags = 0
+   pkt.fragment_offset = defaults.get('fragment_offset', 0)
+   pkt.flags = defaults.get('flags', 0)
+   pkt.others = defaults.get('others', b'\x00\x00\x00\x00')
+   pkt.source_address = defaults.get('source_address', b'\x00\x00\x00\x00')
+   pkt.destination_address = defaults.get('destination_address', b'\x00\x00\x00\x00')
+   pkt.options = defaults.get('options', b'')
+   pkt.data = defaults.get('data', b'')
@@ -0,0 +1,154 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = 'dd7705a9d46598f354784de4a1ac20317c806aed'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'has_name' and 'count_numbers'"
+      if pkt.has_name & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.has_name)
+      if pkt.count_numbers & ~0x7f:
+         raise ValueError("The value %i does not fit in 7 bits." % pkt.count_numbers)
+      fragments.append(_struct_0.pack((pkt.has_name << 7) | pkt.count_numbers))
+
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "has_name"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "between 'has_name' and 'count_numbers'"
+      bits_0, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__has_name_count_numbers = bits_0
+      pkt.has_name = (bits_0 & 0x80) >> 7
+      pkt.count_numbers = bits_0 & 0x7f
+      offset += 1
+
+
+
+      name = "numbers"
+      sequence = []
+      pkt.numbers = sequence
+      unpack = fields[2][1].prototype_field.unpack
+      count = pkt.count_numbers
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__numbers)
+
+
+      name = "optional_name"
+      if bool(pkt.has_name):
+         offset = fields[3][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.optional_name = pkt._opt_elem__optional_name
+      else:
+         pkt.optional_name = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.has_name
+   except AttributeError:
+      pass
+   else:
+      new.has_name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.count_numbers
+   except AttributeError:
+      pass
+   else:
+      new.count_numbers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__has_name_count_numbers
+   except AttributeError:
+      pass
+   else:
+      new._bits__has_name_count_numbers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.numbers
+   except AttributeError:
+      pass
+   else:
+      new.numbers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__numbers
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__numbers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.optional_name
+   except AttributeError:
+      pass
+   else:
+      new.optional_name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__optional_name
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__optional_name = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__has_name_count_numbers = 0
+   pkt.has_name = defaults.get('has_name', 0)
+   pkt.count_numbers = defaults.get('count_numbers', 0)
+   fields[2][1].init(pkt, defaults)
+   fields[3][1].init(pkt, defaults)
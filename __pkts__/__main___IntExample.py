@@ -0,0 +1,202 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HB")
+_struct_1 = Struct("<BH")
+_struct_2 = Struct(">HB")
+_struct_3 = Struct("<BH")
+BISTURI_PACKET_COOKIE = 'a42a6af888f9f7d8969a7549c5d20c98b8d918cc'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "a"
+      fragments.append(_struct_0.pack(pkt.a >> 8, pkt.a & 0xff))
+
+
+
+      name = "b"
+      fragments.append(_struct_1.pack(pkt.b & 0xff, pkt.b >> 8))
+
+
+
+      name = "c"
+      fragments.append(pkt.c.to_bytes(16, 'big', signed=True))
+
+
+
+      name = "d"
+      fragments.append(_struct_2.pack(pkt.d >> 8, pkt.d & 0xff))
+
+
+
+      name = "e"
+      fragments.append(_struct_3.pack(pkt.e & 0xff, pkt.e >> 8))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "a"
+      if len(raw) - offset < 28:
+         raise _incomplete_data(len(raw) - offset, 28)
+
+
+
+      name = "a"
+      int_0_0, int_0_1, = _struct_0.unpack_from(raw, offset)
+      pkt.a = (int_0_0 << 8) | int_0_1
+      offset += 3
+
+
+
+      name = "b"
+      int_1_0, int_1_1, = _struct_1.unpack_from(raw, offset)
+      pkt.b = int_1_0 | (int_1_1 << 8)
+      offset += 3
+
+
+
+      name = "c"
+      next_offset = offset + 16
+      pkt.c = int.from_bytes(raw[offset:next_offset], 'big', signed=True)
+      offset = next_offset
+
+
+
+      name = "d"
+      int_3_0, int_3_1, = _struct_2.unpack_from(raw, offset)
+      pkt.d = (int_3_0 << 8) | int_3_1
+      offset += 3
+
+
+
+      name = "e"
+      int_4_0, int_4_1, = _struct_3.unpack_from(raw, offset)
+      pkt.e = int_4_0 | (int_4_1 << 8)
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "a"
+      _struct_0.pack_into(buffer, offset, pkt.a >> 8, pkt.a & 0xff)
+      offset += 3
+
+
+
+      name = "b"
+      _struct_1.pack_into(buffer, offset, pkt.b & 0xff, pkt.b >> 8)
+      offset += 3
+
+
+
+      name = "c"
+      next_offset = offset + 16
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = pkt.c.to_bytes(16, 'big', signed=True)
+      offset = next_offset
+
+
+
+      name = "d"
+      _struct_2.pack_into(buffer, offset, pkt.d >> 8, pkt.d & 0xff)
+      offset += 3
+
+
+
+      name = "e"
+      _struct_3.pack_into(buffer, offset, pkt.e & 0xff, pkt.e >> 8)
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.a
+   except AttributeError:
+      pass
+   else:
+      new.a = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.b
+   except AttributeError:
+      pass
+   else:
+      new.b = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.c
+   except AttributeError:
+      pass
+   else:
+      new.c = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.d
+   except AttributeError:
+      pass
+   else:
+      new.d = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.e
+   except AttributeError:
+      pass
+   else:
+      new.e = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.a = defaults.get('a', 0)
+   pkt.b = defaults.get('b', 0)
+   pkt.c = defaults.get('c', 0)
+   pkt.d = defaults.get('d', 0)
+   pkt.e = defaults.get('e', 0)
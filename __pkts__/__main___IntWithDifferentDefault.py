@@ -0,0 +1,125 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<HH")
+_struct_1 = Struct(">H")
+BISTURI_PACKET_COOKIE = '1aa0adafe933854bfc31cad04cb596813ef2f25c'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'a' and 'b'"
+      fragments.append(_struct_0.pack(pkt.a, pkt.b))
+
+
+
+      name = "c"
+      fragments.append(_struct_1.pack(pkt.c))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "a"
+      if len(raw) - offset < 6:
+         raise _incomplete_data(len(raw) - offset, 6)
+
+
+
+      name = "between 'a' and 'b'"
+      pkt.a, pkt.b, = _struct_0.unpack_from(raw, offset)
+      offset += 4
+
+
+
+      name = "c"
+      pkt.c, = _struct_1.unpack_from(raw, offset)
+      offset += 2
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'a' and 'b'"
+      _struct_0.pack_into(buffer, offset, pkt.a, pkt.b)
+      offset += 4
+
+
+
+      name = "c"
+      _struct_1.pack_into(buffer, offset, pkt.c)
+      offset += 2
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.a
+   except AttributeError:
+      pass
+   else:
+      new.a = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.b
+   except AttributeError:
+      pass
+   else:
+      new.b = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.c
+   except AttributeError:
+      pass
+   else:
+      new.c = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.a = defaults.get('a', 0)
+   pkt.b = defaults.get('b', 0)
+   pkt.c = defaults.get('c', 0)
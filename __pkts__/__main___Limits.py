@@ -0,0 +1,99 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HH")
+BISTURI_PACKET_COOKIE = 'bc1e7b391a6703bed9f6acd29ce0426294143bb2'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'min_size' and 'max_size'"
+      fragments.append(_struct_0.pack(pkt.min_size, pkt.max_size))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "min_size"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+
+      name = "between 'min_size' and 'max_size'"
+      pkt.min_size, pkt.max_size, = _struct_0.unpack_from(raw, offset)
+      offset += 4
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'min_size' and 'max_size'"
+      _struct_0.pack_into(buffer, offset, pkt.min_size, pkt.max_size)
+      offset += 4
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.min_size
+   except AttributeError:
+      pass
+   else:
+      new.min_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.max_size
+   except AttributeError:
+      pass
+   else:
+      new.max_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.min_size = defaults.get('min_size', 0)
+   pkt.max_size = defaults.get('max_size', 0)
@@ -0,0 +1,168 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+BISTURI_PACKET_COOKIE = 'a52e8c5e23a7a82d7bdc4b44e6313c9758bd0f28'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "first"
+      value = pkt.first
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + pkt._delimiter__first)
+
+
+      name = "second"
+      value = pkt.second
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + pkt._delimiter__second)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "first"
+      if len(raw) - offset < 2:
+         raise _incomplete_data(len(raw) - offset, 2)
+
+
+
+      name = "first"
+      position, delimiter = fields[0][1]._find_markers(raw, offset, len(raw))
+      if position < 0:
+         raise fields[0][1]._marker_not_found(raw, offset)
+      count = position - offset
+      pkt._delimiter__first = delimiter
+      extra_count = len(delimiter)
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.first = chunk
+      offset = next_offset + extra_count
+
+
+      name = "second"
+      position, delimiter = fields[1][1]._find_markers(raw, offset, len(raw))
+      if position < 0:
+         raise fields[1][1]._marker_not_found(raw, offset)
+      count = position - offset
+      pkt._delimiter__second = delimiter
+      extra_count = len(delimiter)
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.second = chunk
+      offset = next_offset + extra_count
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "first"
+      value = pkt.first
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += pkt._delimiter__first
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+
+      name = "second"
+      value = pkt.second
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += pkt._delimiter__second
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.first
+   except AttributeError:
+      pass
+   else:
+      new.first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__first
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.second
+   except AttributeError:
+      pass
+   else:
+      new.second = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__second
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__second = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.first = defaults.get('first', b'')
+   pkt._delimiter__first = b'\r\n'
+   pkt.second = defaults.get('second', b'')
+   pkt._delimiter__second = b'\r\n'
@@ -0,0 +1,99 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">3s3s")
+BISTURI_PACKET_COOKIE = '63dbb17a9619e6c47f63e3456f151c4bb9967215'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'oui' and 'nic'"
+      fragments.append(_struct_0.pack(pkt.oui, pkt.nic))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "oui"
+      if len(raw) - offset < 6:
+         raise _incomplete_data(len(raw) - offset, 6)
+
+
+
+      name = "between 'oui' and 'nic'"
+      pkt.oui, pkt.nic, = _struct_0.unpack_from(raw, offset)
+      offset += 6
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'oui' and 'nic'"
+      _struct_0.pack_into(buffer, offset, pkt.oui, pkt.nic)
+      offset += 6
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.oui
+   except AttributeError:
+      pass
+   else:
+      new.oui = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.nic
+   except AttributeError:
+      pass
+   else:
+      new.nic = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.oui = defaults.get('oui', b'\x00\x00\x00')
+   pkt.nic = defaults.get('nic', b'\x00\x00\x00')
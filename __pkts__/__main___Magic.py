@@ -0,0 +1,125 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">4s")
+BISTURI_PACKET_COOKIE = '9b0b14dbdca4d22f482270ffc682e0338bef9778'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "magic"
+      fragments.append(_struct_0.pack(pkt.magic))
+
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "magic"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+
+      name = "magic"
+      pkt.magic, = _struct_0.unpack_from(raw, offset)
+      offset += 4
+
+
+
+      name = "v2_only_field"
+      if (pkt.magic == b'v002'):
+         offset = fields[1][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.v2_only_field = pkt._opt_elem__v2_only_field
+      else:
+         pkt.v2_only_field = None
+
+
+      name, _, _, unpack = fields[2]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.magic
+   except AttributeError:
+      pass
+   else:
+      new.magic = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.v2_only_field
+   except AttributeError:
+      pass
+   else:
+      new.v2_only_field = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__v2_only_field
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__v2_only_field = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.hidden_field
+   except AttributeError:
+      pass
+   else:
+      new.hidden_field = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__hidden_field
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__hidden_field = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.magic = defaults.get('magic', b'v002')
+   fields[1][1].init(pkt, defaults)
+   fields[2][1].init(pkt, defaults)
@@ -0,0 +1,139 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BB")
+BISTURI_PACKET_COOKIE = '2a52fd99fcc4e7f9c19a260231736e352492c2e5'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "between 'rows' and 'cols'"
+      fragments.append(_struct_0.pack(pkt.rows, pkt.cols))
+
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "rows"
+      if len(raw) - offset < 2:
+         raise _incomplete_data(len(raw) - offset, 2)
+
+
+
+      name = "between 'rows' and 'cols'"
+      pkt.rows, pkt.cols, = _struct_0.unpack_from(raw, offset)
+      offset += 2
+
+
+
+      name = "values"
+      sequence = []
+      pkt.values = sequence
+      unpack = fields[2][1].prototype_field.unpack
+      count = (pkt.rows * pkt.cols)
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__values)
+
+
+      name = "padding"
+      if ((pkt.rows * pkt.cols) % 8):
+         offset = fields[3][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.padding = pkt._opt_elem__padding
+      else:
+         pkt.padding = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.rows
+   except AttributeError:
+      pass
+   else:
+      new.rows = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.cols
+   except AttributeError:
+      pass
+   else:
+      new.cols = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.values
+   except AttributeError:
+      pass
+   else:
+      new.values = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__values
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__values = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.padding
+   except AttributeError:
+      pass
+   else:
+      new.padding = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__padding
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__padding = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.rows = defaults.get('rows', 0)
+   pkt.cols = defaults.get('cols', 0)
+   fields[2][1].init(pkt, defaults)
+   fields[3][1].init(pkt, defaults)
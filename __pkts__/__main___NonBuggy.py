@@ -0,0 +1,102 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = '88340dc7a37c5f030ec309ac64c20bc8a8ec5dd1'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "t"
+      fragments.append(_struct_0.pack(pkt.t))
+
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "t"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "t"
+      pkt.t, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+
+      name = "i"
+      if ((pkt.t > 0) & (pkt.t < 10)):
+         offset = fields[1][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.i = pkt._opt_elem__i
+      else:
+         pkt.i = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.t
+   except AttributeError:
+      pass
+   else:
+      new.t = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.i
+   except AttributeError:
+      pass
+   else:
+      new.i = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__i
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__i = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.t = defaults.get('t', 0)
+   fields[1][1].init(pkt, defaults)
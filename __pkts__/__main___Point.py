@@ -0,0 +1,114 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">H")
+_struct_1 = Struct(">H")
+BISTURI_PACKET_COOKIE = 'df9e240e89711084975038de86ec33555a17afe9'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "x"
+      fragments.append(_struct_0.pack(pkt.x))
+
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "y"
+      fragments.append(_struct_1.pack(pkt.y))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "x"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+
+      name = "x"
+      pkt.x, = _struct_0.unpack_from(raw, offset)
+      offset += 2
+
+
+
+      name, _, _, unpack = fields[1]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "y"
+      next_offset = offset + 2
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 2)
+      pkt.y, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.x
+   except AttributeError:
+      pass
+   else:
+      new.x = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_y
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_y = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.y
+   except AttributeError:
+      pass
+   else:
+      new.y = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.x = defaults.get('x', 0)
+   fields[1][1].init(pkt, defaults)
+   pkt.y = defaults.get('y', 0)
@@ -0,0 +1,107 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BBB")
+BISTURI_PACKET_COOKIE = 'def182708f9167a817f47b3563744766aa1f10be'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "between 'x' and 'z'"
+      fragments.append(_struct_0.pack(pkt.x, pkt.y, pkt.z))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "point_2d"
+      if len(raw) - offset < 3:
+         raise _incomplete_data(len(raw) - offset, 3)
+
+
+
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "between 'x' and 'z'"
+      pkt.x, pkt.y, pkt.z, = _struct_0.unpack_from(raw, offset)
+      offset += 3
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.point_2d
+   except AttributeError:
+      pass
+   else:
+      new.point_2d = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.x
+   except AttributeError:
+      pass
+   else:
+      new.x = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.y
+   except AttributeError:
+      pass
+   else:
+      new.y = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.z
+   except AttributeError:
+      pass
+   else:
+      new.z = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   pkt.x = defaults.get('x', 0)
+   pkt.y = defaults.get('y', 0)
+   pkt.z = defaults.get('z', 0)
@@ -0,0 +1,134 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+BISTURI_PACKET_COOKIE = '70c196ed8cd992b427516e82a1e7e238f82b83d6'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "items"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+
+      name = "items"
+      sequence = []
+      pkt.items = sequence
+      unpack = fields[0][1].prototype_field.unpack
+      count = 4
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__items)
+
+
+      name = "extra_data"
+      if (pkt.items[0] == 255):
+         offset = fields[1][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.extra_data = pkt._opt_elem__extra_data
+      else:
+         pkt.extra_data = None
+
+
+      name, _, _, unpack = fields[2]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.items
+   except AttributeError:
+      pass
+   else:
+      new.items = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__items
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__items = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.extra_data
+   except AttributeError:
+      pass
+   else:
+      new.extra_data = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__extra_data
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__extra_data = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.hidden_data
+   except AttributeError:
+      pass
+   else:
+      new.hidden_data = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__hidden_data
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__hidden_data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   fields[1][1].init(pkt, defaults)
+   fields[2][1].init(pkt, defaults)
@@ -0,0 +1,241 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">8s8s8s12s12s8s1s100s255s")
+BISTURI_PACKET_COOKIE = '8b8b4b44005bafa25c8cd88383717445818820a6'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+
+      name = "name"
+      value = pkt.name
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + b'\x00')
+
+
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "between 'mode' and '_pad1'"
+      fragments.append(_struct_0.pack(pkt.mode, pkt.owner, pkt.group, pkt.size, pkt.last, pkt.checksum, pkt.type, pkt.linked, pkt._pad1))
+
+
+
+      name, _, pack, _ = fields[11]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[12]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "name"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+
+      name = "name"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[0][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'\x00', offset)
+      if position < 0:
+         raise fields[0][1]._marker_not_found(raw, offset)
+      count = position - offset
+
+      extra_count = 1
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.name = chunk
+      offset = next_offset + extra_count
+
+
+      name, _, _, unpack = fields[1]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "between 'mode' and '_pad1'"
+      next_offset = offset + 412
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 412)
+      pkt.mode, pkt.owner, pkt.group, pkt.size, pkt.last, pkt.checksum, pkt.type, pkt.linked, pkt._pad1, = _struct_0.unpack_from(raw, offset)
+      offset = next_offset
+
+
+
+      name, _, _, unpack = fields[11]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      name, _, _, unpack = fields[12]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.name
+   except AttributeError:
+      pass
+   else:
+      new.name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_mode
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_mode = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.mode
+   except AttributeError:
+      pass
+   else:
+      new.mode = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.owner
+   except AttributeError:
+      pass
+   else:
+      new.owner = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.group
+   except AttributeError:
+      pass
+   else:
+      new.group = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size
+   except AttributeError:
+      pass
+   else:
+      new.size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.last
+   except AttributeError:
+      pass
+   else:
+      new.last = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.checksum
+   except AttributeError:
+      pass
+   else:
+      new.checksum = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.type
+   except AttributeError:
+      pass
+   else:
+      new.type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.linked
+   except AttributeError:
+      pass
+   else:
+      new.linked = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._pad1
+   except AttributeError:
+      pass
+   else:
+      new._pad1 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.content
+   except AttributeError:
+      pass
+   else:
+      new.content = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__content
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__content = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._pad2
+   except AttributeError:
+      pass
+   else:
+      new._pad2 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem___pad2
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem___pad2 = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.name = defaults.get('name', b'')
+   fields[1][1].init(pkt, defaults)
+   pkt.mode = defaults.get('mode', b'\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt.owner = defaults.get('owner', b'\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt.group = defaults.get('group', b'\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt.size = defaults.get('size', b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt.last = defaults.get('last', b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt.checksum = defaults.get('checksum', b'\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt.type = defaults.get('type', b'\x00')
+   pkt.linked = defaults.get('linked', b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+   pkt._pad1 = defaults.get('_pad1', b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+   fields[11][1].init(pkt, defaults)
+   fields[12][1].init(pkt, defaults)
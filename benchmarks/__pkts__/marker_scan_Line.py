@@ -0,0 +1,114 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of
+
+BISTURI_PACKET_COOKIE = '443a73ccb150471b8f7178d923b115e3fbac196e'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # value = Data(until_marker=re.compile(b'\r?\n'))
+      name = "value"
+      value = pkt.value
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + fields[0][1].delimiter_to_be_included)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+
+      # value = Data(until_marker=re.compile(b'\r?\n'))
+      name = "value"
+      field = fields[0][1]
+      match = field.until_marker.search(raw, offset)
+      if not match:
+         raise field._marker_not_found(raw, offset)
+      count = match.start() - offset
+      extra_count = match.end() - match.start()
+      field.delimiter_to_be_included = bytes(match.group())
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.value = chunk
+      offset = next_offset + extra_count
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # value = Data(until_marker=re.compile(b'\r?\n'))
+      name = "value"
+      value = pkt.value
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += fields[0][1].delimiter_to_be_included
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt._raw_span
+   except AttributeError:
+      pass
+   else:
+      new._raw_span = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.value
+   except AttributeError:
+      pass
+   else:
+      new.value = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.value = defaults.get('value', b'')
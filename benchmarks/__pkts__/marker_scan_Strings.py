@@ -0,0 +1,105 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of
+
+_struct_0 = Struct(">I")
+BISTURI_PACKET_COOKIE = 'b8861a65226829691c7eb3f943d00445bbe0c1eb'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # count = Int(4)
+      name = "count"
+      fragments.append(_struct_0.pack(pkt.count))
+
+
+      # items = Ref(String).repeated(count)
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "count"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+      # count = Int(4)
+      name = "count"
+      pkt.count, = _struct_0.unpack_from(raw, offset)
+      offset += 4
+
+
+      # items = Ref(String).repeated(count)
+      name, _, _, unpack = fields[1]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt._raw_span
+   except AttributeError:
+      pass
+   else:
+      new._raw_span = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.count
+   except AttributeError:
+      pass
+   else:
+      new.count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.items
+   except AttributeError:
+      pass
+   else:
+      new.items = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__items
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__items = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.count = defaults.get('count', 0)
+   fields[1][1].init(pkt, defaults)
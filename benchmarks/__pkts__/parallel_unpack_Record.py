@@ -0,0 +1,109 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data
+
+_struct_0 = Struct(">BHIH")
+BISTURI_PACKET_COOKIE = '72043ba0b793b10b7f023330b6197eb5347c43d4'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # type = Int(1)
+      # flags = Int(2)
+      # seq = Int(4)
+      # length = Int(2)
+      name = "between 'type' and 'length'"
+      fragments.append(_struct_0.pack(pkt.type, pkt.flags, pkt.seq, pkt.length))
+
+
+      # payload = Data(length)
+      name = "payload"
+      value = pkt.payload
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "type"
+      if len(raw) - offset < 9:
+         raise _incomplete_data(len(raw) - offset, 9)
+
+
+      # type = Int(1)
+      # flags = Int(2)
+      # seq = Int(4)
+      # length = Int(2)
+      name = "between 'type' and 'length'"
+      pkt.type, pkt.flags, pkt.seq, pkt.length, = _struct_0.unpack_from(raw, offset)
+      offset += 9
+
+
+      # payload = Data(length)
+      name = "payload"
+      byte_count = pkt.length
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.payload = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # type = Int(1)
+      # flags = Int(2)
+      # seq = Int(4)
+      # length = Int(2)
+      name = "between 'type' and 'length'"
+      _struct_0.pack_into(buffer, offset, pkt.type, pkt.flags, pkt.seq, pkt.length)
+      offset += 9
+
+
+      # payload = Data(length)
+      name = "payload"
+      value = pkt.payload
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
@@ -0,0 +1,198 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of
+
+_struct_0 = Struct(">HIB")
+_struct_1 = Struct(">H")
+BISTURI_PACKET_COOKIE = '3fdd751a05244c1342f5e6b9978a0e8cf3bfab7b'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # version = Bits(4)
+      # flags = Bits(12)
+      # seq = Int(4)
+      # count = Int(1)
+      name = "between 'version' and 'count'"
+      fragments.append(_struct_0.pack(((pkt.version << 12) & 0xf000) | (pkt.flags & 0xfff), pkt.seq, pkt.count))
+
+
+      # headers = Ref(Header).repeated(count)
+      name, _, pack, _ = fields[4]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      # length = Int(2)
+      name = "length"
+      fragments.append(_struct_1.pack(pkt.length))
+
+
+      # payload = Data(length)
+      name = "payload"
+      value = pkt.payload
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "version"
+      if len(raw) - offset < 9:
+         raise _incomplete_data(len(raw) - offset, 9)
+
+
+      # version = Bits(4)
+      # flags = Bits(12)
+      # seq = Int(4)
+      # count = Int(1)
+      name = "between 'version' and 'count'"
+      bits_0, pkt.seq, pkt.count, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__version_flags = bits_0
+      pkt.version = (bits_0 & 0xf000) >> 12
+      pkt.flags = bits_0 & 0xfff
+      offset += 7
+
+
+      # headers = Ref(Header).repeated(count)
+      name, _, _, unpack = fields[4]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      # length = Int(2)
+      name = "length"
+      next_offset = offset + 2
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 2)
+      pkt.length, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+
+      # payload = Data(length)
+      name = "payload"
+      byte_count = pkt.length
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.payload = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt._raw_span
+   except AttributeError:
+      pass
+   else:
+      new._raw_span = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.version
+   except AttributeError:
+      pass
+   else:
+      new.version = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags
+   except AttributeError:
+      pass
+   else:
+      new.flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__version_flags
+   except AttributeError:
+      pass
+   else:
+      new._bits__version_flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.seq
+   except AttributeError:
+      pass
+   else:
+      new.seq = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.count
+   except AttributeError:
+      pass
+   else:
+      new.count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.headers
+   except AttributeError:
+      pass
+   else:
+      new.headers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__headers
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__headers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.payload
+   except AttributeError:
+      pass
+   else:
+      new.payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__version_flags = 0
+   pkt.version = defaults.get('version', 0)
+   pkt.flags = defaults.get('flags', 0)
+   pkt.seq = defaults.get('seq', 0)
+   pkt.count = defaults.get('count', 0)
+   fields[4][1].init(pkt, defaults)
+   pkt.length = defaults.get('length', 0)
+   pkt.payload = defaults.get('payload', b'')
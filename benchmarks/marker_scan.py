@@ -0,0 +1,89 @@
+''' Scaling of the unpack of Data(until_marker=...) fields with the count
+    of fields in the same buffer: a table of NUL-terminated strings
+    and two tables of CRLF-terminated lines, one searching the end of line
+    with a regexp and the other with a tuple of markers.
+
+    The markers are searched in place so the time per field should stay
+    the same no matter how many fields (and bytes) follow it.
+
+    Usage: python benchmarks/marker_scan.py [max_field_count]
+    '''
+import re
+import sys
+import time
+
+sys.path.append(".")
+
+from bisturi.packet import Packet
+from bisturi.field import Int, Data, Ref
+
+
+class String(Packet):
+    value = Data(until_marker=b'\0')
+
+
+class Line(Packet):
+    value = Data(until_marker=re.compile(b'\r?\n'))
+
+
+class TupleLine(Packet):
+    value = Data(until_marker=(b'\r\n', b'\n'))
+
+
+class Strings(Packet):
+    count = Int(4)
+    items = Ref(String).repeated(count)
+
+
+class Lines(Packet):
+    count = Int(4)
+    items = Ref(Line).repeated(count)
+
+
+class TupleLines(Packet):
+    count = Int(4)
+    items = Ref(TupleLine).repeated(count)
+
+
+def build(count, terminator):
+    return count.to_bytes(4, 'big') + b''.join(
+        b'field-%06i-' % i + b'x' * 48 + terminator for i in range(count)
+    )
+
+
+def timeit(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(max_count):
+    print("%-26s %8s %10s %12s" % ("", "fields", "total", "per field"))
+    for pkt_class, terminator in (
+        (Strings, b'\0'), (Lines, b'\r\n'), (TupleLines, b'\r\n')
+    ):
+        for as_view in (False, True):
+            count = 1000
+            while count <= max_count:
+                raw = build(count, terminator)
+                if as_view:
+                    raw = memoryview(raw)
+
+                elapsed = timeit(lambda: pkt_class.unpack(raw))
+                print(
+                    "%-26s %8i %9.3fs %10.2fus" % (
+                        "%s%s" % (
+                            pkt_class.__name__,
+                            " (memoryview)" if as_view else ""
+                        ), count, elapsed, elapsed / count * 1e6
+                    )
+                )
+                count *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 64000)
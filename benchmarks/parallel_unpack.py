@@ -0,0 +1,87 @@
+''' Scaling of bisturi.parallel.unpack_file against the single-process
+    loop (Packet.unpack_many) on a synthetic file of TLV records.
+
+    Usage: python benchmarks/parallel_unpack.py [record_count]
+    '''
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(".")
+
+from bisturi.packet import Packet
+from bisturi.field import Int, Data
+from bisturi.parallel import unpack_file
+
+
+class Record(Packet):
+    type = Int(1)
+    flags = Int(2)
+    seq = Int(4)
+    length = Int(2)
+    payload = Data(length)
+
+
+def write_records(path, count):
+    with open(path, 'wb') as f:
+        for i in range(count):
+            payload = b'x' * (16 + i % 64)
+            f.write(
+                Record(
+                    type=i % 256,
+                    flags=i % 7,
+                    seq=i,
+                    length=len(payload),
+                    payload=payload
+                ).pack()
+            )
+
+
+def timeit(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(count):
+    fd, path = tempfile.mkstemp(suffix='.bin')
+    os.close(fd)
+    try:
+        write_records(path, count)
+
+        def single_process():
+            with open(path, 'rb') as f:
+                pkts, _ = Record.unpack_many(f.read())
+            assert len(pkts) == count
+
+        baseline = timeit(single_process)
+        print("%i records, %i bytes" % (count, os.path.getsize(path)))
+        print("%-28s %8.3fs" % ("single process loop", baseline))
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            for columns in (False, True):
+                elapsed = timeit(
+                    lambda: unpack_file(
+                        Record, path, workers=workers, columns=columns
+                    )
+                )
+                print(
+                    "%-28s %8.3fs  x%.2f" % (
+                        "workers=%i%s" %
+                        (workers, " columns" if columns else ""), elapsed,
+                        baseline / elapsed
+                    )
+                )
+            workers *= 2
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
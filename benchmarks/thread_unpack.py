@@ -0,0 +1,106 @@
+''' Scaling of the unpack of the same packet class from several threads
+    (concurrent.futures.ThreadPoolExecutor) against a single thread loop.
+
+    The threads can run in parallel only in a free-threaded build of
+    CPython (3.13t and later); with the GIL, this shows the overhead of
+    using threads.
+
+    Usage: python benchmarks/thread_unpack.py [record_count]
+    '''
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(".")
+
+from bisturi.packet import Packet
+from bisturi.field import Int, Data, Ref, Bits
+
+
+class Header(Packet):
+    name = Data(until_marker=(b'\r\n', b'\n'))
+    value = Data(until_marker=re.compile(b';|$'))
+
+
+class Record(Packet):
+    version = Bits(4)
+    flags = Bits(12)
+    seq = Int(4)
+    count = Int(1)
+    headers = Ref(Header).repeated(count)
+    length = Int(2)
+    payload = Data(length)
+
+
+def build_records(count):
+    records = []
+    for i in range(count):
+        payload = b'x' * (16 + i % 64)
+        records.append(
+            Record(
+                version=i % 16,
+                flags=i % 4096,
+                seq=i,
+                count=2,
+                headers=[
+                    Header(name=b'host', value=b'example%i;' % i),
+                    Header(name=b'agent', value=b'bisturi;'),
+                ],
+                length=len(payload),
+                payload=payload
+            ).pack()
+        )
+    return records
+
+
+def unpack_all(records):
+    unpack = Record.unpack
+    return [unpack(raw) for raw in records]
+
+
+def timeit(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - begin
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(count):
+    records = build_records(count)
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(
+        "%i records, Python %s, GIL %s" % (
+            count, sys.version.split()[0],
+            "enabled" if is_gil_enabled else "disabled"
+        )
+    )
+
+    baseline = timeit(lambda: unpack_all(records))
+    print("%-28s %8.3fs" % ("single thread loop", baseline))
+
+    threads = 1
+    while threads <= max(os.cpu_count() or 1, 2):
+        # one chunk of records per thread
+        chunk_size = (count + threads - 1) // threads
+        chunks = [
+            records[i:i + chunk_size] for i in range(0, count, chunk_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            elapsed = timeit(lambda: list(executor.map(unpack_all, chunks)))
+
+        print(
+            "%-28s %8.3fs  x%.2f" %
+            ("threads=%i" % threads, elapsed, baseline / elapsed)
+        )
+        threads *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
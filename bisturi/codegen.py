@@ -3,13 +3,25 @@ import itertools
 import hashlib
 import os.path
 import inspect
-from importlib.machinery import SourceFileLoader
+import sys
+import types
+import marshal
+import linecache
+import importlib.util
 
 
 class CodeGenerator:
     def __init__(
-        self, fields, pkt_class, generate_for_pack, generate_for_unpack,
-        sourcecode_by_field_name, vectorize, annotate
+        self,
+        fields,
+        pkt_class,
+        generate_for_pack,
+        generate_for_unpack,
+        sourcecode_by_field_name,
+        vectorize,
+        annotate,
+        in_memory=False,
+        cache_dir=None
     ):
 
         self.fields = fields
@@ -17,23 +29,64 @@ class CodeGenerator:
         self.generate_for_pack = generate_for_pack
         self.generate_for_unpack = generate_for_unpack
         self.vectorize = vectorize
+        self.in_memory = in_memory
+        self.cache_dir = cache_dir
 
         if annotate:
             self.sourcecode_by_field_name = sourcecode_by_field_name
         else:
             self.sourcecode_by_field_name = {}
 
+        # The unpack checks once that the buffer has at least min_size
+        # bytes so the fields that always end within them (the ones
+        # of the static layout with a fixed size) don't need to check it
+        self.min_size = pkt_class._bisturi_min_size
+        self.prechecked_field_names = set(
+            name for name, _, byte_count in pkt_class._bisturi_static_layout
+            if byte_count is not None
+        )
+
+        # The groups of Bits whose integer has a struct code are packed
+        # and unpacked as a single fixed field within the struct groups
+        # (unless a member of the group has its own pack/unpack)
+        from bisturi.field import Bits
+        members_by_group = {}
+        for _, _, field in fields:
+            if isinstance(field, Bits):
+                members_by_group.setdefault(id(field.I), []).append(field)
+
+        self.bits_with_struct_code = set()
+        for members in members_by_group.values():
+            I = members[0].I
+            if I.struct_code is None and _split_int_in_struct_codes(I) is None:
+                continue
+
+            has_its_own_methods = any(
+                not _is_method_of(m.pack, Bits.pack)
+                or not _is_method_of(m.unpack, Bits.unpack) for m in members
+            )
+            if not has_its_own_methods:
+                self.bits_with_struct_code.update(id(m) for m in members)
+
     def generate_code(self):
         if not self.generate_for_pack and not self.generate_for_unpack:
             return
 
         # Divide the fields into groups where each group share the same value
-        # fof the 'is_fixed' attribute.
+        # fof the 'is_fixed' attribute (the groups of Bits with a struct code
+        # are fixed too).
+        def is_fixed(i_n_f):
+            field = i_n_f[2]
+            return field.is_fixed or id(field) in self.bits_with_struct_code
+
         grouped_by_variability = [
-            (k, list(g)) for k, g in
-            itertools.groupby(self.fields, lambda i_n_f: i_n_f[2].is_fixed)
+            (k, list(g)) for k, g in itertools.groupby(self.fields, is_fixed)
         ]
 
+        # Code to be put at the module level of the generated code
+        # like precompiled Struct objects
+        self.module_level_code = []
+
         # Generate code for each group
         codes = []
         for is_fixed, group in grouped_by_variability:
@@ -44,11 +97,14 @@ class CodeGenerator:
 
         if self.generate_for_pack or self.generate_for_unpack:
             import_code = '''
-from struct import pack as StructPack, unpack as StructUnpack
+from struct import Struct
 from bisturi.fragments import Fragments
-from bisturi.packet import PacketError
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
 
-'''
+''' + ''.join(self.module_level_code)
+
+        clone_into_code = self.generate_code_for_clone_into()
+        init_code = self.generate_code_for_init()
 
         if self.generate_for_pack:
             pack_code = '''
@@ -79,10 +135,6 @@ def pack_impl(pkt, fragments, **k):
         if self.generate_for_unpack:
             unpack_code = (
                 '''
-from struct import pack as StructPack, unpack as StructUnpack
-from bisturi.fragments import Fragments
-from bisturi.packet import PacketError
-
 def unpack_impl(pkt, raw, offset, **k):
    k['innermost-pkt-pos'] = offset
    fields = pkt.get_fields()
@@ -98,7 +150,13 @@ def unpack_impl(pkt, raw, offset, **k):
    return offset
 ''' % {
                     'blocks_of_code':
-                    indent("\n".join([c[1] for c in codes]), level=2),
+                    indent(
+                        "\n".join(
+                            [self.generate_code_for_min_size_check()] +
+                            [c[1] for c in codes]
+                        ),
+                        level=2
+                    ),
                     'sync_descriptors_code':
                     self.generate_unrolled_code_for_descriptor_sync(
                         sync_for_pack=False
@@ -108,19 +166,527 @@ def unpack_impl(pkt, raw, offset, **k):
         else:
             unpack_code = ""
 
+        # pack_into_impl is generated only if all the fields can be written
+        # straight into the buffer (fields with a struct code or inlined
+        # Data fields): any other field (Move, Ref, Sequence...) requires
+        # to pack it into a Fragments object first.
+        can_pack_into = all(c[2] is not None for c in codes)
+        if self.generate_for_pack and can_pack_into:
+            pack_into_code = '''
+def pack_into_impl(pkt, buffer, offset, **k):
+%(sync_descriptors_code)s
+   fields = pkt.get_fields()
+   try:
+%(blocks_of_code)s
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+''' % {
+                'blocks_of_code':
+                indent("\n".join([c[2] for c in codes]), level=2),
+                'sync_descriptors_code':
+                self.generate_unrolled_code_for_descriptor_sync(
+                    sync_for_pack=True
+                ),
+            }
+        else:
+            pack_into_code = ""
+
         # Compute a hash over the pack and unpack generated code
         # We will use it to verify that the generated code that may already
         # exist correspond with the one generated right now
         cookie_hash = hashlib.sha1()
+        cookie_hash.update(import_code.encode('utf-8'))
         cookie_hash.update(pack_code.encode('utf-8'))
         cookie_hash.update(unpack_code.encode('utf-8'))
+        cookie_hash.update(pack_into_code.encode('utf-8'))
+        cookie_hash.update(clone_into_code.encode('utf-8'))
+        cookie_hash.update(init_code.encode('utf-8'))
         cookie = cookie_hash.hexdigest()
         cookie_code = f"BISTURI_PACKET_COOKIE = '{cookie}'\n"
 
+        source_code = import_code + cookie_code + pack_code + unpack_code + pack_into_code + clone_into_code + init_code
+
+        if self.in_memory:
+            module = self.load_generated_code_from_memory(source_code, cookie)
+        else:
+            module = self.load_generated_code_from_file(source_code, cookie)
+
+        for method_name, generated in (
+            ('pack_impl', self.generate_for_pack),
+            ('unpack_impl', self.generate_for_unpack),
+            ('pack_into_impl', bool(pack_into_code)),
+            ('clone_into_impl', True),
+            ('__init__', True),
+        ):
+            self.install_method(module, method_name, generated)
+
+    def install_method(self, module, method_name, generated):
+        ''' Set the generated method in the packet class unless the class
+            or one of its parents (other than Packet) defines its own.
+
+            The methods generated for a parent packet class work with the
+            fields of the parent so they are not inherited: if the method
+            was not generated for this class, the Packet's one is used.
+            '''
+        from bisturi.packet import Packet
+        for cls in self.pkt_class.__mro__:
+            if cls is Packet:
+                break
+
+            method = cls.__dict__.get(method_name)
+            if method is not None and not getattr(
+                method, '_is_generated', False
+            ):
+                return
+
+        if generated:
+            method = getattr(module, method_name)
+            method._is_generated = True
+        else:
+            method = Packet.__dict__[method_name]
+
+        setattr(self.pkt_class, method_name, method)
+
+    def generate_code_for_init(self):
+        ''' Generate a Packet.__init__ that initializes each field
+            with the value given by keyword or with its default.
+
+            The fields which init only takes the value or the default
+            (Int, Data and Bits) are initialized inline; for the rest
+            we call their init methods.
+            '''
+        from bisturi.field import Int, Data, Bits
+
+        codes = []
+        for field_index, name, field in self.fields:
+            if isinstance(field, Bits) and field.iam_first and \
+                    _is_method_of(field.init, Bits.init):
+                codes.append('pkt.%s = 0' % field.I.field_name)
+
+            if any(
+                _is_method_of(field.init, cls.init)
+                for cls in (Int, Data, Bits)
+            ):
+                default = field.default
+                if type(default) in (int, bool, bytes, str, type(None)):
+                    default_code = repr(default)
+                else:
+                    default_code = 'fields[%i][1].default' % field_index
+
+                codes.append(
+                    "pkt.%(field_name)s = defaults.get('%(field_name)s', %(default_code)s)"
+                    % {
+                        'field_name': field.field_name,
+                        'default_code': default_code,
+                    }
+                )
+            else:
+                codes.append('fields[%i][1].init(pkt, defaults)' % field_index)
+
+            if isinstance(field, Data) and field.delimiter_name is not None \
+                    and _is_method_of(field.init, Data.init):
+                codes.append(
+                    'pkt.%s = %r' %
+                    (field.delimiter_name, field.default_delimiter)
+                )
+
+            if field.descriptor_name is not None:
+                codes.append(
+                    '''if '%(descriptor_name)s' in defaults:
+   pkt.%(descriptor_name)s = defaults['%(descriptor_name)s']''' %
+                    {'descriptor_name': field.descriptor_name}
+                )
+
+        return '''
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+%(blocks_of_code)s
+''' % {
+            'blocks_of_code': indent('\n'.join(codes), level=1),
+        }
+
+    def generate_code_for_clone_into(self):
+        ''' Generate the code that copies the slots of a packet into
+            another, one by one, sharing the immutable values.
+            See Packet.clone. '''
+        from bisturi.packet import _slot_names
+
+        blocks_of_code = ''.join(
+            '''
+try:
+   value = pkt.%(name)s
+except AttributeError:
+   pass
+else:
+   new.%(name)s = value if type(value) in _immutable_types else _clone_value(value)
+''' % {'name': name} for name in _slot_names(self.pkt_class)
+        )
+
+        return '''
+def clone_into_impl(pkt, new):
+%(blocks_of_code)s
+   return new
+''' % {
+            'blocks_of_code': indent(blocks_of_code, level=1),
+        }
+
+    def generate_projected_unpack(self, field_names):
+        ''' Generate an unpack_impl that unpacks only the given fields and
+            the ones that they or the offsets of the following fields depend
+            on (like the length of a Data). The rest are skipped by their size
+            without decoding them.
+
+            Return the generated function.
+            '''
+        known_names = set(name for _, name, _ in self.fields)
+        for name in field_names:
+            if name not in known_names:
+                raise ValueError(
+                    "The packet %s has no field '%s'." %
+                    (self.pkt_class.__name__, name)
+                )
+
+        plan = self.plan_projection(field_names)
+
+        self.module_level_code = []
+        codes = []
+
+        # consecutive fixed fields, unpacked or skipped, are joined
+        # in a single Struct using pad bytes for the skipped ones
+        run = []
+        for (field_index, name, field), step in zip(self.fields, plan):
+            action, arg = step
+            is_unpacked_by_struct = action == 'unpack' and field.is_fixed \
+                    and field.struct_code is not None
+
+            if action == 'skip-fixed' or is_unpacked_by_struct:
+                if is_unpacked_by_struct and any(
+                    f.is_bigendian != field.is_bigendian
+                    for _, _, f, is_skipped in run if not is_skipped
+                ):
+                    codes.append(self.generate_code_for_projected_run(run))
+                    run = []
+
+                run.append((arg, name, field, action == 'skip-fixed'))
+                continue
+
+            if run:
+                codes.append(self.generate_code_for_projected_run(run))
+                run = []
+
+            comments = self.sourcecode_by_field_name.get(name, '').rstrip()
+            if action == 'unpack':
+                code = self.generate_code_for_variable_data_field(
+                    field_index, name, field
+                )
+                if code is None:
+                    codes.append(
+                        self.generate_code_for_loop_unpack(
+                            [(field_index, name, field)]
+                        )
+                    )
+                else:
+                    codes.append(code[1])
+
+            elif action == 'skip-dynamic':
+                codes.append(
+                    '''
+%(comments)s
+name = "%(name)s"
+byte_count = %(byte_count_code)s
+next_offset = offset + byte_count
+if next_offset > len(raw):
+   raise _incomplete_data(len(raw) - offset, byte_count)
+offset = next_offset
+''' % {
+                        'comments': comments,
+                        'name': name,
+                        'byte_count_code': arg,
+                    }
+                )
+
+            elif action == 'skip-marker':
+                codes.append(
+                    '''
+%(comments)s
+name = "%(name)s"
+%(search_code)s
+offset += count + extra_count
+''' % {
+                        'comments': comments,
+                        'name': name,
+                        'search_code': arg,
+                    }
+                )
+
+            else:
+                assert action == 'skip-packets'
+                codes.append(
+                    self.generate_code_for_packets_skip(
+                        field_index, name, field, arg
+                    )
+                )
+
+        if run:
+            codes.append(self.generate_code_for_projected_run(run))
+
+        import_code = '''
+from struct import Struct
+from bisturi.packet import PacketError, _incomplete_data, _projected_unpack_impl, _findable
+
+''' + ''.join(self.module_level_code)
+
+        unpack_code = '''
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+%(blocks_of_code)s
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+''' % {
+            'blocks_of_code': indent("\n".join(codes), level=2),
+        }
+
+        cookie_hash = hashlib.sha1()
+        cookie_hash.update(import_code.encode('utf-8'))
+        cookie_hash.update(unpack_code.encode('utf-8'))
+        cookie = cookie_hash.hexdigest()
+        cookie_code = f"BISTURI_PACKET_COOKIE = '{cookie}'\n"
+
+        module = self.load_generated_code_from_memory(
+            import_code + cookie_code + unpack_code, cookie
+        )
+        return module.unpack_impl
+
+    def plan_projection(self, field_names):
+        ''' Decide, for each field, if it must be unpacked or it can be
+            skipped. Return a list of (action, arg) tuples, one per field:
+
+            ('unpack', None)            -- unpack the field
+            ('skip-fixed', byte_count)  -- skip a fixed count of bytes
+            ('skip-dynamic', code)      -- skip the count of bytes computed
+                                           by the code (like 'pkt.length')
+            ('skip-marker', code)       -- skip up to the marker searched
+                                           by the code
+            ('skip-packets', code)      -- skip the subpackets of a Ref
+                                           (code is None) or the count of
+                                           them computed by the code
+                                           for a Sequence of Ref
+
+            The fields are visited from the last to the first so the fields
+            that the following ones depend on are unpacked too. If the
+            dependencies of a field are unknown (like a callable), all the
+            previous fields are unpacked.
+            '''
+        from bisturi.field import Bits
+
+        needed = set(field_names)
+        plan = []
+        for field_index, name, field in reversed(self.fields):
+            if isinstance(field, Bits):
+                # the bits of the same group are unpacked together
+                is_needed = any(
+                    n in needed for _, n, f in self.fields
+                    if isinstance(f, Bits) and f.I is field.I
+                )
+            else:
+                is_needed = name in needed
+
+            if not is_needed:
+                skip = self.projection_skip(field_index, field)
+                if skip is not None:
+                    action, arg, dependencies = skip
+                    needed.update(dependencies)
+                    plan.append((action, arg))
+                    continue
+
+            dependencies = _unpack_dependencies(field)
+            if dependencies is None:
+                needed.update(n for _, n, _ in self.fields[:field_index])
+            else:
+                needed.update(dependencies)
+
+            plan.append(('unpack', None))
+
+        plan.reverse()
+        return plan
+
+    def projection_skip(self, field_index, field):
+        ''' Return how to skip the field without unpacking it as a tuple
+            (action, arg, dependencies) or None if it cannot be skipped.
+            See plan_projection.
+            '''
+        from bisturi.field import Field, Data, Ref
+        from bisturi.structural_fields import Sequence
+
+        byte_count = field.static_byte_count()
+        if byte_count is not None:
+            return 'skip-fixed', byte_count, ()
+
+        if isinstance(field, Ref):
+            if _is_ref_to_a_packet(field):
+                return 'skip-packets', None, ()
+
+            return None
+
+        if isinstance(field, Data):
+            if _is_method_of(field.unpack, Data._unpack_variable_size_field):
+                length_name = field.byte_count.field_name
+                return 'skip-dynamic', 'pkt.%s' % length_name, (length_name, )
+
+            if _is_method_of(field.unpack, Data._unpack_with_string_marker):
+                return 'skip-marker', self.generate_code_for_string_marker_search(
+                    field_index, field
+                ), ()
+
+            if _is_method_of(field.unpack, Data._unpack_with_regexp_marker):
+                return 'skip-marker', self.generate_code_for_regexp_marker_search(
+                    field_index, field
+                ), ()
+
+            if _is_method_of(field.unpack, Data._unpack_with_markers):
+                return 'skip-marker', self.generate_code_for_markers_search(
+                    field_index, field
+                ), ()
+
+        elif isinstance(field, Sequence) and \
+                _is_method_of(field.unpack, Sequence.unpack):
+            if field.until_condition is not None \
+                    or field.when is not None or field.aligned_to != 1:
+                return None
+
+            count = field.count_arg
+            if isinstance(count, int):
+                count_code, dependencies = '%i' % count, ()
+            elif isinstance(count, Field) and hasattr(count, 'field_name'):
+                count_code = 'pkt.%s' % count.field_name
+                dependencies = (count.field_name, )
+            else:
+                return None
+
+            elem_byte_count = field.prototype_field.static_byte_count()
+            if elem_byte_count is not None:
+                if isinstance(count, int):
+                    return 'skip-fixed', count * elem_byte_count, ()
+
+                return 'skip-dynamic', '%s * %i' % (
+                    count_code, elem_byte_count
+                ), dependencies
+
+            if _is_ref_to_a_packet(field.prototype_field):
+                return 'skip-packets', count_code, dependencies
+
+        return None
+
+    def generate_code_for_packets_skip(
+        self, field_index, name, field, count_code
+    ):
+        ''' Generate the code to skip the subpackets of a Ref or of
+            a Sequence of Ref (count_code is the count of them).
+
+            A subpacket is skipped unpacking none of its fields (see
+            generate_projected_unpack) so only the fields that its size
+            depends on are unpacked into a single, throwaway packet.
+            '''
+        if count_code is None:
+            proto_class_code = 'fields[%i][1].proto_class' % field_index
+            skip_code = 'offset = skip(scratch, raw, offset, **k)'
+        else:
+            proto_class_code = 'fields[%i][1].prototype_field.proto_class' % field_index
+            skip_code = '''for _ in range(%s):
+   offset = skip(scratch, raw, offset, **k)''' % count_code
+
+        return '''
+%(comments)s
+name = "%(name)s"
+proto_class = %(proto_class_code)s
+skip = _projected_unpack_impl(proto_class, ())
+scratch = proto_class._new_empty()
+%(skip_code)s
+''' % {
+            'comments': self.sourcecode_by_field_name.get(name, '').rstrip(),
+            'name': name,
+            'proto_class_code': proto_class_code,
+            'skip_code': skip_code,
+        }
+
+    def generate_code_for_projected_run(self, run):
+        ''' Generate the code to unpack and skip a run of fixed fields with
+            a single Struct. The run is a list of (byte_count, name, field,
+            is_skipped) tuples.
+            '''
+        unpacked = [field for _, _, field, is_skipped in run if not is_skipped]
+        is_bigendian = unpacked[0].is_bigendian if unpacked else True
+
+        fmt = ">" if is_bigendian else "<"
+        for byte_count, _, field, is_skipped in run:
+            if is_skipped:
+                if byte_count:
+                    fmt += "%ix" % byte_count
+            else:
+                fmt += field.struct_code
+
+        advance = struct.calcsize(fmt)
+        names = [name for _, name, _, _ in run]
+        comments = ''.join(
+            self.sourcecode_by_field_name.get(name, "") for name in names
+        )
+
+        if unpacked:
+            lookup_fields = " ".join(
+                'pkt.%s,' % name for _, name, _, is_skipped in run
+                if not is_skipped
+            )
+            struct_name = self.add_struct_at_module_level(fmt)
+            unpack_line = '%s = %s.unpack_from(raw, offset)\n' % (
+                lookup_fields, struct_name
+            )
+        else:
+            unpack_line = ''
+
+        return '''
+%(comments)s
+name = "%(name)s"
+next_offset = offset + %(advance)s
+if next_offset > len(raw):
+   raise _incomplete_data(len(raw) - offset, %(advance)s)
+%(unpack_line)soffset = next_offset
+''' % {
+            'comments': comments.rstrip(),
+            'name': ("between '%s' and '%s'" % (names[0], names[-1])) \
+                        if len(names) > 1 else names[0],
+            'advance': advance,
+            'unpack_line': unpack_line,
+        }
+
+    def generated_module_location(self):
+        ''' Return the name of the module for the generated code and the
+            folder where the module should be written.
+            '''
         # From which file we got the packet class?
         try:
             pkt_definition_fpath = inspect.getfile(self.pkt_class)
-        except TypeError:
+        except (TypeError, OSError):
             # For builtins packet classes (like the ones created in a
             # interactive shell session) will not have a file associated
             # Assume current workign directory as the location for the code
@@ -147,6 +713,16 @@ def unpack_impl(pkt, raw, offset, **k):
             pkt_definition_module, self.pkt_class.__name__
         )
 
+        return module_name, folder
+
+    def load_generated_code_from_file(self, source_code, cookie):
+        ''' Write the generated code in a __pkts__ folder next to the
+            file where the packet class was defined and import it.
+
+            If the file already exists and it has the same cookie, reuse it.
+            '''
+        module_name, folder = self.generated_module_location()
+
         # Full path for the new module
         module_pathname = os.path.join(folder, module_name + ".py")
 
@@ -154,9 +730,8 @@ def unpack_impl(pkt, raw, offset, **k):
         module = None
         if os.path.exists(module_pathname):
             try:
-                module = SourceFileLoader(module_name,
-                                          module_pathname).load_module()
-            except ImportError:
+                module = _import_from_file(module_name, module_pathname)
+            except (ImportError, SyntaxError):
                 pass
 
         # If no previously written module exists or its cooke does not match
@@ -165,7 +740,7 @@ def unpack_impl(pkt, raw, offset, **k):
             module, 'BISTURI_PACKET_COOKIE', None
         ) != cookie:
             # Delete the compiled file (.pyc)
-            if module and hasattr(module, '__cached__'):
+            if module and getattr(module, '__cached__', None):
                 module_compiled_filename = module.__cached__
             else:
                 module_compiled_filename = module_name + ".pyc"
@@ -177,25 +752,67 @@ def unpack_impl(pkt, raw, offset, **k):
             os.makedirs(folder, exist_ok=True)
 
             with open(module_pathname, 'w') as module_file:
-                module_file.write(import_code)
-                module_file.write(cookie_code)
-                module_file.write(pack_code)
-                module_file.write(unpack_code)
+                module_file.write(source_code)
 
             # load it (again)
-            module = SourceFileLoader(module_name,
-                                      module_pathname).load_module()
+            module = _import_from_file(module_name, module_pathname)
 
-        from bisturi.packet import Packet
-        if self.generate_for_pack and (
-            self.pkt_class.pack_impl == Packet.pack_impl
-        ):
-            self.pkt_class.pack_impl = module.pack_impl
+        return module
 
-        if self.generate_for_unpack and (
-            self.pkt_class.unpack_impl == Packet.unpack_impl
-        ):
-            self.pkt_class.unpack_impl = module.unpack_impl
+    def load_generated_code_from_memory(self, source_code, cookie):
+        ''' Compile and execute the generated code in memory, without
+            writing anything into the filesystem.
+
+            If a cache folder was configured, the compiled code is loaded
+            from there or, if it is not there, saved there for the next time.
+            The compiled code is keyed by the cookie, the Python version
+            and the bisturi version.
+            '''
+        from bisturi import __version__
+
+        module_name, _ = self.generated_module_location()
+
+        # A pseudo filename: put the source code in the linecache
+        # so the tracebacks can show the generated code
+        filename = "<bisturi %s %s>" % (module_name, cookie)
+        linecache.cache[filename] = (
+            len(source_code), None, source_code.splitlines(True), filename
+        )
+
+        code = None
+        if self.cache_dir:
+            cache_pathname = os.path.join(
+                self.cache_dir, "%s.%s.%s.bisturi-%s.marshal" % (
+                    module_name, cookie, sys.implementation.cache_tag,
+                    __version__
+                )
+            )
+
+            try:
+                with open(cache_pathname, 'rb') as cache_file:
+                    code = marshal.load(cache_file)
+            except (OSError, EOFError, ValueError, TypeError):
+                code = None
+
+        if code is None:
+            code = compile(source_code, filename, 'exec')
+
+            if self.cache_dir:
+                # the cache is an optimization: if we cannot write it
+                # (like in a read-only filesystem), just ignore it
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    tmp_pathname = "%s.%i.tmp" % (cache_pathname, os.getpid())
+                    with open(tmp_pathname, 'wb') as cache_file:
+                        marshal.dump(code, cache_file)
+                    os.replace(tmp_pathname, cache_pathname)
+                except OSError:
+                    pass
+
+        module = types.ModuleType(module_name)
+        exec(code, module.__dict__)
+
+        return module
 
     def generate_unrolled_code_for_descriptor_sync(self, sync_for_pack):
         if sync_for_pack:
@@ -215,9 +832,12 @@ def unpack_impl(pkt, raw, offset, **k):
     def generate_code_for_fixed_fields(self, fields):
         # Group the fields of fixed size by if they have a Python' struct
         # format or not
+        def has_struct_code(i_n_f):
+            return self.has_struct_code(i_n_f[2])
+
         grouped_by_has_struct_code = [
-            (k, list(g)) for k, g in itertools.
-            groupby(fields, lambda i_n_f: i_n_f[2].struct_code is not None)
+            (k, list(g))
+            for k, g in itertools.groupby(fields, has_struct_code)
         ]
 
         codes = []
@@ -228,8 +848,9 @@ def unpack_impl(pkt, raw, offset, **k):
                     # endianness so we do a regroup by fields that have the same
                     # endianness in common
                     grouped_by_endianness = [
-                        (k, list(g)) for k, g in itertools.
-                        groupby(group, lambda i_n_f: i_n_f[2].is_bigendian)
+                        (k, list(g)) for k, g in itertools.groupby(
+                            group, lambda i_n_f: self.is_bigendian(i_n_f[2])
+                        )
                     ]
 
                     # Generate the code for each endianness-struct group
@@ -242,13 +863,22 @@ def unpack_impl(pkt, raw, offset, **k):
                         ]
                     )
                 else:
+                    # One struct call per field except for the Bits
+                    # that are unpacked together, one call per Bits group
+                    grouped_by_field = [
+                        list(g) for _, g in itertools.groupby(
+                            group, lambda i_n_f: id(i_n_f[2].I)
+                            if id(i_n_f[2]) in self.bits_with_struct_code else
+                            id(i_n_f[2])
+                        )
+                    ]
                     codes.extend(
                         [
                             self.
                             generate_code_for_fixed_fields_with_struct_code(
-                                [(a, b, f)],
-                                f.is_bigendian,
-                            ) for a, b, f in group
+                                g,
+                                self.is_bigendian(g[0][2]),
+                            ) for g in grouped_by_field
                         ]
                     )
             else:
@@ -267,28 +897,140 @@ def unpack_impl(pkt, raw, offset, **k):
         self, group, is_bigendian
     ):
         fmt = ">" if is_bigendian else "<"
-        fmt += "".join([f.struct_code for _, _, f in group])
+        unpack_targets = []
+        pack_args = []
 
-        lookup_fields = " ".join(
-            [('pkt.%(name)s,' % {
-                'name': name
-            }) for _, name, _ in group]
-        )
+        # code to run after the unpack of the struct (to join the pieces
+        # of the integers and to extract the Bits) and before its pack
+        post_unpack_code = []
+        pre_pack_code = []
+        for field_index, name, f in group:
+            if id(f) in self.bits_with_struct_code:
+                # A group of Bits is a single integer for struct: it is
+                # unpacked into the hidden field of the group and each member
+                # is extracted with a mask and a shift; on pack, the range
+                # of each member is checked and the members are joined
+                # with an OR
+                if not f.iam_first:
+                    continue
+
+                struct_field = f.I
+                target = 'bits_%i' % field_index
+                bits_code = ['pkt.%s = %s' % (f.I.field_name, target)]
+                terms = []
+                for _, n, m in group:
+                    is_bits = id(m) in self.bits_with_struct_code
+                    if not is_bits or m.I is not f.I:
+                        continue
+
+                    max_value = m.mask >> m.shift
+                    pre_pack_code.append(
+                        'if pkt.%(n)s & ~0x%(max)x:\n'
+                        '   raise ValueError("The value %%i does not fit in '
+                        '%(bits)i bits." %% pkt.%(n)s)' % {
+                            'n': n,
+                            'max': max_value,
+                            'bits': max_value.bit_length()
+                        }
+                    )
+
+                    if m.shift:
+                        bits_code.append(
+                            'pkt.%s = (%s & 0x%x) >> %i' %
+                            (n, target, m.mask, m.shift)
+                        )
+                        terms.append('(pkt.%s << %i)' % (n, m.shift))
+                    else:
+                        bits_code.append(
+                            'pkt.%s = %s & 0x%x' % (n, target, m.mask)
+                        )
+                        terms.append('pkt.%s' % n)
+
+                value = ' | '.join(terms)
+            else:
+                struct_field = f
+                target = value = 'pkt.%s' % name
+                bits_code = []
+
+            pieces = _split_int_in_struct_codes(struct_field)
+            if pieces is None:
+                fmt += struct_field.struct_code
+                unpack_targets.append(target)
+                pack_args.append(value)
+            else:
+                # An integer of 3, 5, 6 or 7 bytes is unpacked in pieces
+                # of primitive sizes that are joined later; on pack, it is
+                # split with shifts and masks. The most significant piece
+                # is not masked so struct checks the range of the integer.
+                if value != target:
+                    pre_pack_code.append('%s = %s' % (target, value))
+
+                piece_names = [
+                    'int_%i_%i' % (field_index, j) for j in range(len(pieces))
+                ]
+                unpack_targets.extend(piece_names)
+
+                joined = []
+                for piece_name, piece in zip(piece_names, pieces):
+                    code, shift, mask = piece
+                    fmt += code
+
+                    if shift:
+                        joined.append('(%s << %i)' % (piece_name, shift))
+                    else:
+                        joined.append(piece_name)
+
+                    if not mask:
+                        pack_args.append('%s >> %i' % (target, shift))
+                    elif shift:
+                        pack_args.append(
+                            '(%s >> %i) & 0x%x' % (target, shift, mask)
+                        )
+                    else:
+                        pack_args.append('%s & 0x%x' % (target, mask))
+
+                post_unpack_code.append(
+                    '%s = %s' % (target, ' | '.join(joined))
+                )
+
+            post_unpack_code.extend(bits_code)
+
+        lookup_fields = " ".join(t + ',' for t in unpack_targets)
+        pack_lookup_fields = ", ".join(pack_args)
+        post_unpack_code = ''.join(line + '\n' for line in post_unpack_code)
+        pre_pack_code = ''.join(line + '\n' for line in pre_pack_code)
 
         comments = ''.join(
             self.sourcecode_by_field_name.get(name, "") for _, name, _ in group
         )
 
-        unpack_code = '''
+        # A precompiled Struct, one per group, defined at the module level
+        struct_name = self.add_struct_at_module_level(fmt)
+
+        if all(name in self.prechecked_field_names for _, name, _ in group):
+            # the length of the buffer was already checked for these fields
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+%(lookup_fields)s = %(struct_name)s.unpack_from(raw, offset)
+%(post_unpack_code)soffset += %(advance)s
+'''
+        else:
+            unpack_code = '''
 %(comments)s
 name = "%(name)s"
 next_offset = offset + %(advance)s
-%(lookup_fields)s = StructUnpack("%(fmt)s", raw[offset:next_offset])
-offset = next_offset
-''' % {
+if next_offset > len(raw):
+   raise _incomplete_data(len(raw) - offset, %(advance)s)
+%(lookup_fields)s = %(struct_name)s.unpack_from(raw, offset)
+%(post_unpack_code)soffset = next_offset
+'''
+
+        unpack_code = unpack_code % {
              'comments': comments.rstrip(),
              'lookup_fields': lookup_fields,
-             'fmt': fmt,
+             'post_unpack_code': post_unpack_code,
+             'struct_name': struct_name,
              'advance': struct.calcsize(fmt),
              'name': ("between '%s' and '%s'" % (group[0][1], group[-1][1])) \
                         if len(group) > 1 else group[0][1],
@@ -297,32 +1039,551 @@ offset = next_offset
         pack_code = '''
 %(comments)s
 name = "%(name)s"
-fragments.append(StructPack("%(fmt)s", %(lookup_fields)s))
+%(pre_pack_code)sfragments.append(%(struct_name)s.pack(%(lookup_fields)s))
 ''' % {
              'comments': comments.rstrip(),
-             'lookup_fields': lookup_fields[:-1], # remove the last ","
-             'fmt': fmt,
+             'lookup_fields': pack_lookup_fields,
+             'pre_pack_code': pre_pack_code,
+             'struct_name': struct_name,
              'name': ("between '%s' and '%s'" % (group[0][1], group[-1][1])) \
                         if len(group) > 1 else group[0][1],
           }
 
-        return pack_code, unpack_code
+        pack_into_code = '''
+%(comments)s
+name = "%(name)s"
+%(pre_pack_code)s%(struct_name)s.pack_into(buffer, offset, %(lookup_fields)s)
+offset += %(advance)s
+''' % {
+             'comments': comments.rstrip(),
+             'lookup_fields': pack_lookup_fields,
+             'pre_pack_code': pre_pack_code,
+             'struct_name': struct_name,
+             'advance': struct.calcsize(fmt),
+             'name': ("between '%s' and '%s'" % (group[0][1], group[-1][1])) \
+                        if len(group) > 1 else group[0][1],
+          }
+
+        return pack_code, unpack_code, pack_into_code
+
+    def has_struct_code(self, field):
+        if id(field) in self.bits_with_struct_code:
+            return True
+        return field.struct_code is not None or \
+                _split_int_in_struct_codes(field) is not None
+
+    def is_bigendian(self, field):
+        if id(field) in self.bits_with_struct_code:
+            return field.I.is_bigendian
+        return field.is_bigendian
+
+    def generate_code_for_min_size_check(self):
+        ''' Return the code that checks that the buffer has at least
+            the minimum size of the packet. '''
+        if not self.min_size or not self.fields:
+            return ''
+
+        return '''
+name = "%(name)s"
+if len(raw) - offset < %(min_size)i:
+   raise _incomplete_data(len(raw) - offset, %(min_size)i)
+''' % {
+            'name': self.fields[0][1],
+            'min_size': self.min_size,
+        }
+
+    def add_struct_at_module_level(self, fmt):
+        ''' Define a Struct object for the given format at the module
+            level of the generated code and return its name. '''
+        struct_name = "_struct_%i" % len(self.module_level_code)
+        self.module_level_code.append(
+            '%s = Struct("%s")\n' % (struct_name, fmt)
+        )
+        return struct_name
 
     def generate_code_for_variable_fields(self, group):
+        # Some fields can be inlined; for the rest we call their
+        # pack/unpack methods
+        codes = []
+        for field_index, name, field in group:
+            code = self.generate_code_for_variable_data_field(
+                field_index, name, field
+            )
+            if code is None:
+                code = self.generate_code_for_structural_field(
+                    field_index, name, field
+                )
+            if code is None:
+                single = [(field_index, name, field)]
+                code = (
+                    self.generate_code_for_loop_pack(single),
+                    self.generate_code_for_loop_unpack(single),
+                    None,
+                )
+
+            codes.append(code)
+
+        # pack_into is inlined only if all the fields support it
+        if any(c[2] is None for c in codes):
+            pack_into_code = None
+        else:
+            pack_into_code = ''.join([c[2] for c in codes])
+
         return (
-            self.generate_code_for_loop_pack(group),
-            self.generate_code_for_loop_unpack(group)
+            ''.join([c[0] for c in codes]),
+            ''.join([c[1] for c in codes]),
+            pack_into_code,
         )
 
+    def generate_code_for_structural_field(self, field_index, name, field):
+        ''' Generate inline code to unpack a Sequence or an Optional with
+            their count, 'when' and 'until' conditions inlined: integers,
+            fields and deferred expressions (see compile_expr_into_callable)
+            are evaluated in place instead of calling a function.
+
+            Return None if the field is not one of those or if any of its
+            conditions cannot be inlined (like a callable) so the caller
+            can fallback to call the field's pack/unpack methods.
+            '''
+        from bisturi.field import Field
+        from bisturi.structural_fields import Sequence, Optional
+
+        comments = self.sourcecode_by_field_name.get(name, '').rstrip()
+        if isinstance(field, Optional) and \
+                _is_method_of(field.unpack, Optional.unpack):
+            when_code = getattr(field.when, 'inline_source', None)
+            if when_code is None:
+                return None
+
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+if %(when_code)s:
+   offset = fields[%(field_index)i][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+   pkt.%(field_name)s = pkt.%(elem_name)s
+else:
+   pkt.%(field_name)s = None
+''' % {
+                'comments': comments,
+                'name': name,
+                'field_index': field_index,
+                'field_name': field.field_name,
+                'elem_name': field.opt_elem_field_name,
+                'when_code': when_code,
+            }
+
+        elif isinstance(field, Sequence) and \
+                _is_method_of(field.unpack, Sequence.unpack):
+            count = field.count_arg
+            if count is None:
+                # with an 'until' condition, the first element is always
+                # unpacked
+                count_code = '1'
+            elif isinstance(count, int):
+                count_code = '%i' % count
+            elif isinstance(count, Field) and hasattr(count, 'field_name'):
+                count_code = 'pkt.%s' % count.field_name
+            else:
+                count_code = getattr(
+                    field.get_how_many_elements, 'inline_source', None
+                )
+
+            conditions_code = []
+            for condition in (field.when, field.until_condition):
+                if condition is None:
+                    conditions_code.append(None)
+                else:
+                    conditions_code.append(
+                        getattr(condition, 'inline_source', None)
+                    )
+                    if conditions_code[-1] is None:
+                        return None
+
+            if count_code is None:
+                return None
+
+            when_code, until_code = conditions_code
+
+            element_code = '''offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+sequence.append(pkt.%s)''' % field.seq_elem_field_name
+            if field.aligned_to != 1:
+                element_code = 'offset += (%(a)i - (offset %% %(a)i)) %% %(a)i\n' % {
+                    'a': field.aligned_to
+                } + element_code
+
+            loop_code = 'for _ in range(count):\n' + indent(element_code)
+            if until_code is not None:
+                loop_code += '\nwhile not (%s):\n' % until_code + indent(
+                    element_code
+                )
+
+            if when_code is not None:
+                loop_code = 'if count > 0 and (%s):\n' % when_code + indent(
+                    loop_code
+                )
+
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+sequence = []
+pkt.%(field_name)s = sequence
+unpack = fields[%(field_index)i][1].prototype_field.unpack
+count = %(count_code)s
+%(loop_code)s
+''' % {
+                'comments': comments,
+                'name': name,
+                'field_index': field_index,
+                'field_name': field.field_name,
+                'count_code': count_code,
+                'loop_code': loop_code,
+            }
+
+        else:
+            return None
+
+        # only the unpack evaluates the conditions
+        pack_code = self.generate_code_for_loop_pack(
+            [(field_index, name, field)]
+        )
+        return pack_code, unpack_code, None
+
+    def generate_code_for_variable_data_field(self, field_index, name, field):
+        ''' Generate inline code for a Data field with a variable size:
+            Data(length_field), Data(callable or expression) and
+            Data(until_marker=...).
+
+            Return None if the field is not one of those so the caller
+            can fallback to call the field's pack/unpack methods.
+            '''
+        from bisturi.field import Data
+        if not isinstance(field, Data):
+            return None
+
+        if not _is_method_of(field.pack, Data.pack):
+            return None
+
+        if _is_method_of(field.unpack, Data._unpack_variable_size_field):
+            byte_count_code = 'pkt.%s' % field.byte_count.field_name
+            search_code = None
+
+        elif _is_method_of(field.unpack, Data._unpack_variable_size_callable):
+            # the deferred expressions like Data(length - 4) are inlined
+            inline_source = getattr(field.byte_count, 'inline_source', None)
+            if inline_source is not None:
+                byte_count_code = inline_source
+            else:
+                byte_count_code = 'fields[%i][1].byte_count(pkt=pkt, raw=raw, offset=offset, **k)' % field_index
+            search_code = None
+
+        elif _is_method_of(field.unpack, Data._unpack_with_string_marker):
+            search_code = self.generate_code_for_string_marker_search(
+                field_index, field
+            )
+
+        elif _is_method_of(field.unpack, Data._unpack_with_regexp_marker):
+            search_code = self.generate_code_for_regexp_marker_search(
+                field_index, field
+            )
+
+        elif _is_method_of(field.unpack, Data._unpack_with_markers):
+            search_code = self.generate_code_for_markers_search(
+                field_index, field
+            )
+
+        else:
+            return None
+
+        if field.zero_copy:
+            slice_code = 'chunk = (raw if isinstance(raw, memoryview) else memoryview(raw))[offset:next_offset]'
+        else:
+            slice_code = '''chunk = raw[offset:next_offset]
+if not isinstance(chunk, bytes):
+   chunk = bytes(chunk)'''
+
+        comments = self.sourcecode_by_field_name.get(name, '').rstrip()
+        if search_code is None:
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+byte_count = %(byte_count_code)s
+next_offset = offset + byte_count
+%(slice_code)s
+if len(chunk) != byte_count:
+   raise _incomplete_data(len(chunk), byte_count)
+pkt.%(field_name)s = chunk
+offset = next_offset
+''' % {
+                'comments': comments,
+                'name': name,
+                'field_name': field.field_name,
+                'byte_count_code': byte_count_code,
+                'slice_code': slice_code,
+            }
+
+            # only the Data fields with a marker have a delimiter to pack
+            delimiter_code = ''
+
+        else:
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+%(search_code)s
+next_offset = offset + count
+%(slice_code)s
+pkt.%(field_name)s = chunk
+offset = next_offset + extra_count
+''' % {
+                'comments': comments,
+                'name': name,
+                'field_name': field.field_name,
+                'search_code': search_code,
+                'slice_code': slice_code,
+            }
+
+            if field.delimiter_name is not None:
+                # the delimiter found for a tuple of markers or a regexp
+                # is kept in the packet
+                delimiter_code = 'pkt.%s' % field.delimiter_name
+            elif field.delimiter_to_be_included:
+                delimiter_code = repr(field.delimiter_to_be_included)
+            else:
+                delimiter_code = ''
+
+        if delimiter_code:
+            append_delimiter_code = ' + ' + delimiter_code
+            add_delimiter_code = '\nvalue += ' + delimiter_code
+        else:
+            append_delimiter_code = add_delimiter_code = ''
+
+        pack_code = '''
+%(comments)s
+name = "%(name)s"
+value = pkt.%(field_name)s
+if not isinstance(value, bytes):
+   value = bytes(value)
+fragments.append(value%(append_delimiter_code)s)
+''' % {
+            'comments': comments,
+            'name': name,
+            'field_name': field.field_name,
+            'append_delimiter_code': append_delimiter_code,
+        }
+
+        # a slice assignment of a different size would resize a bytearray
+        # so the size of the buffer must be checked first
+        pack_into_code = '''
+%(comments)s
+name = "%(name)s"
+value = pkt.%(field_name)s
+if not isinstance(value, bytes):
+   value = bytes(value)%(append_delimiter_code)s
+next_offset = offset + len(value)
+if next_offset > len(buffer):
+   raise Exception("The buffer has %%i bytes but it is required at least %%i" %% (len(buffer), next_offset))
+buffer[offset:next_offset] = value
+offset = next_offset
+''' % {
+            'comments': comments,
+            'name': name,
+            'field_name': field.field_name,
+            'append_delimiter_code': add_delimiter_code,
+        }
+
+        return pack_code, unpack_code, pack_into_code
+
+    def generate_code_for_string_marker_search(self, field_index, field):
+        ''' Mimic Data._unpack_with_string_marker: compute 'count' and
+            'extra_count' from the position of the marker. '''
+        # search in place, without slicing (copying) the rest of the buffer
+        if field._search_buffer_length:
+            range_code = 'offset, offset + %i' % field._search_buffer_length
+        else:
+            range_code = 'offset'
+
+        marker_length = len(field.until_marker)
+        if field.include_delimiter:
+            count_code, extra_count = 'count += %i' % marker_length, 0
+        else:
+            count_code = ''
+            extra_count = marker_length if field.consume_delimiter else 0
+
+        return '''findable = raw if type(raw) is bytes else _findable(raw)
+if findable is None:
+   match = fields[%(field_index)i][1]._until_marker_regexp.search(raw, %(range_code)s)
+   position = match.start() if match else -1
+else:
+   position = findable.find(%(until_marker)r, %(range_code)s)
+if position < 0:
+   raise fields[%(field_index)i][1]._marker_not_found(raw, offset)
+count = position - offset
+%(count_code)s
+extra_count = %(extra_count)i''' % {
+            'range_code': range_code,
+            'field_index': field_index,
+            'until_marker': field.until_marker,
+            'count_code': count_code,
+            'extra_count': extra_count,
+        }
+
+    def generate_code_for_regexp_marker_search(self, field_index, field):
+        ''' Mimic Data._unpack_with_regexp_marker: compute 'count' and
+            'extra_count' from the regexp's match. '''
+        if field.until_marker.pattern == b"$":  # shortcut
+            return '''count = len(raw) - offset
+extra_count = 0'''
+
+        # search in place, without slicing (copying) the rest of the buffer
+        if field._search_buffer_length:
+            range_code = 'offset, offset + %i' % field._search_buffer_length
+        else:
+            range_code = 'offset'
+
+        if field.include_delimiter:
+            match_code = '''count = match.end() - offset
+extra_count = 0'''
+        else:
+            if field.consume_delimiter:
+                extra_count_code = 'match.end() - match.start()'
+            else:
+                extra_count_code = '0'
+
+            match_code = '''count = match.start() - offset
+extra_count = %s
+pkt.%s = bytes(match.group())''' % (extra_count_code, field.delimiter_name)
+
+        return '''field = fields[%(field_index)i][1]
+match = field.until_marker.search(raw, %(range_code)s)
+if not match:
+   raise field._marker_not_found(raw, offset)
+%(match_code)s''' % {
+            'field_index': field_index,
+            'range_code': range_code,
+            'match_code': match_code,
+        }
+
+    def generate_code_for_markers_search(self, field_index, field):
+        ''' Mimic Data._unpack_with_markers: compute 'count' and
+            'extra_count' from the position of the first marker found
+            and keep the marker found in the packet. '''
+        if field._search_buffer_length:
+            end_code = 'offset + %i' % field._search_buffer_length
+        else:
+            end_code = 'len(raw)'
+
+        if field.include_delimiter:
+            delimiter_code = '''count += len(delimiter)
+extra_count = 0'''
+        else:
+            delimiter_code = '''pkt.%s = delimiter
+extra_count = %s''' % (
+                field.delimiter_name,
+                'len(delimiter)' if field.consume_delimiter else '0'
+            )
+
+        return '''position, delimiter = fields[%(field_index)i][1]._find_markers(raw, offset, %(end_code)s)
+if position < 0:
+   raise fields[%(field_index)i][1]._marker_not_found(raw, offset)
+count = position - offset
+%(delimiter_code)s''' % {
+            'field_index': field_index,
+            'end_code': end_code,
+            'delimiter_code': delimiter_code,
+        }
+
     def generate_code_for_fixed_fields_without_struct_code(
         self,
         group,
     ):
+        # The integers without a struct code are inlined; for the rest
+        # we call their pack/unpack methods
+        codes = []
+        for field_index, name, field in group:
+            code = self.generate_code_for_int_field(field_index, name, field)
+            if code is None:
+                single = [(field_index, name, field)]
+                code = (
+                    self.generate_code_for_loop_pack(single),
+                    self.generate_code_for_loop_unpack(single),
+                    None,
+                )
+
+            codes.append(code)
+
+        # pack_into is inlined only if all the fields support it
+        if any(c[2] is None for c in codes):
+            pack_into_code = None
+        else:
+            pack_into_code = ''.join([c[2] for c in codes])
+
         return (
-            self.generate_code_for_loop_pack(group),
-            self.generate_code_for_loop_unpack(group)
+            ''.join([c[0] for c in codes]),
+            ''.join([c[1] for c in codes]),
+            pack_into_code,
         )
 
+    def generate_code_for_int_field(self, field_index, name, field):
+        ''' Generate inline code for an Int field without a struct code
+            (like an Int(16)) using int.from_bytes and int.to_bytes.
+
+            Return None if the field is not such Int.
+            '''
+        from bisturi.field import Int
+        if not isinstance(field, Int) or not (
+            _is_method_of(field.unpack, Int._unpack_fixed_size)
+            and _is_method_of(field.pack, Int._pack_fixed_size)
+        ):
+            return None
+
+        args = {
+            'comments': self.sourcecode_by_field_name.get(name, '').rstrip(),
+            'name': name,
+            'field_name': field.field_name,
+            'byte_count': field.byte_count,
+            'byteorder': 'big' if field.is_bigendian else 'little',
+            'signed': field.is_signed,
+        }
+
+        if name in self.prechecked_field_names:
+            # the length of the buffer was already checked for this field
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+next_offset = offset + %(byte_count)i
+pkt.%(field_name)s = int.from_bytes(raw[offset:next_offset], '%(byteorder)s', signed=%(signed)s)
+offset = next_offset
+'''
+        else:
+            unpack_code = '''
+%(comments)s
+name = "%(name)s"
+next_offset = offset + %(byte_count)i
+if next_offset > len(raw):
+   raise _incomplete_data(len(raw) - offset, %(byte_count)i)
+pkt.%(field_name)s = int.from_bytes(raw[offset:next_offset], '%(byteorder)s', signed=%(signed)s)
+offset = next_offset
+'''
+
+        pack_code = '''
+%(comments)s
+name = "%(name)s"
+fragments.append(pkt.%(field_name)s.to_bytes(%(byte_count)i, '%(byteorder)s', signed=%(signed)s))
+'''
+
+        # a slice assignment of a different size would resize a bytearray
+        # so the size of the buffer must be checked first
+        pack_into_code = '''
+%(comments)s
+name = "%(name)s"
+next_offset = offset + %(byte_count)i
+if next_offset > len(buffer):
+   raise Exception("The buffer has %%i bytes but it is required at least %%i" %% (len(buffer), next_offset))
+buffer[offset:next_offset] = pkt.%(field_name)s.to_bytes(%(byte_count)i, '%(byteorder)s', signed=%(signed)s)
+offset = next_offset
+'''
+
+        return pack_code % args, unpack_code % args, pack_into_code % args
+
     def generate_code_for_loop_pack(self, group):
         return ''.join(
             [
@@ -362,6 +1623,113 @@ offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
         )
 
 
+def _import_from_file(module_name, module_pathname):
+    spec = importlib.util.spec_from_file_location(module_name, module_pathname)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _unpack_dependencies(field):
+    ''' Return the names of the fields that must be unpacked before
+        the given field can be unpacked or None if they are unknown
+        (like the ones read by a callable). '''
+    from bisturi.field import Field, Data, Bits, Ref, Em
+    from bisturi.structural_fields import Sequence
+
+    if field.is_fixed or isinstance(field, (Bits, Em)):
+        return ()
+
+    if isinstance(field, Ref):
+        if field.embed or _is_method_of(
+            field.unpack, Ref._unpack_referencing_a_packet
+        ):
+            return ()
+
+    elif isinstance(field, Data):
+        if _is_method_of(field.unpack, Data._unpack_variable_size_field):
+            return (field.byte_count.field_name, )
+
+        if _is_method_of(
+            field.unpack, Data._unpack_with_string_marker
+        ) or _is_method_of(
+            field.unpack, Data._unpack_with_regexp_marker
+        ) or _is_method_of(field.unpack, Data._unpack_with_markers):
+            return ()
+
+    elif isinstance(field, Sequence) and \
+            _is_method_of(field.unpack, Sequence.unpack):
+        if field.until_condition is not None or field.when is not None:
+            return None
+
+        if _unpack_dependencies(field.prototype_field) != ():
+            return None
+
+        count = field.count_arg
+        if isinstance(count, int):
+            return ()
+
+        if isinstance(count, Field) and hasattr(count, 'field_name'):
+            return (count.field_name, )
+
+    return None
+
+
+def _split_int_in_struct_codes(field):
+    ''' Split an Int of 3, 5, 6 or 7 bytes in pieces of primitive sizes
+        (4, 2 and 1 bytes) that can be packed/unpacked with struct.
+
+        Return a list of (struct code, shift, mask) tuples, in the order
+        of the pieces in the buffer, or None if the field is not such Int.
+        The most significant piece has no mask and it has the sign.
+        '''
+    from bisturi.field import Int
+    if not isinstance(field, Int) or field.struct_code is not None or \
+            not (2 < field.byte_count < 8) or not (
+                _is_method_of(field.unpack, Int._unpack_fixed_size) and
+                _is_method_of(field.pack, Int._pack_fixed_size)
+            ):
+        return None
+
+    pieces = []
+    shift = field.byte_count * 8
+    for byte_count in (4, 2, 1):
+        if shift < byte_count * 8:
+            continue
+
+        shift -= byte_count * 8
+        code = {4: 'I', 2: 'H', 1: 'B'}[byte_count]
+        if not pieces:
+            mask = 0
+            if field.is_signed:
+                code = code.lower()
+        else:
+            mask = (1 << (byte_count * 8)) - 1
+
+        pieces.append((code, shift, mask))
+
+    # from the most significant to the least: reverse it for little endian
+    if not field.is_bigendian:
+        pieces.reverse()
+
+    return pieces
+
+
+def _is_method_of(bound_method, function):
+    ''' Return True if the bound method is the given function (the field's
+        method was not overridden nor replaced). '''
+    return getattr(bound_method, '__func__', None) is function
+
+
+def _is_ref_to_a_packet(field):
+    ''' Return True if the field is a Ref to a packet class (not to
+        a callable), not embedded, that unpacks a new subpacket. '''
+    from bisturi.field import Ref
+    return isinstance(field, Ref) and not field.embed and _is_method_of(
+        field.unpack, Ref._unpack_referencing_a_packet
+    )
+
+
 def indent(code, level=1):
     i = "   " * level
     return "\n".join(
@@ -0,0 +1,174 @@
+''' Columnar (vectorized) unpacking of fixed-size packets using NumPy.
+
+    A packet class which fields are all of a fixed size (Int, Data of a
+    fixed byte count and groups of Bits) can be described as a NumPy
+    structured dtype. Then N consecutive records can be decoded from a buffer
+    in a single pass, one array per field, without creating any packet object.
+
+    NumPy is an optional dependency: it is imported only when these
+    functions are called.
+    '''
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for the columnar decoding of packets but it is not installed (try 'pip install numpy')."
+        ) from None
+
+    return numpy
+
+
+def _describe_record(pkt_class):
+    ''' Return a list of tuples (name, byte_count, numpy_format, columns)
+        that describe the layout of a record of the given packet class,
+        one tuple per each chunk of bytes of the record.
+
+        Each chunk is decoded into one or more columns: a list of tuples
+        (column_name, decoder) where decoder is one of
+            ('int', field)  -- the chunk is an integer
+            ('data', field) -- the chunk is the data itself
+            ('bits', field) -- the column is a Bits field of the chunk
+        '''
+    from bisturi.field import Int, Data, Bits
+
+    chunks = []
+    bits_group = []
+    for name, field, _, _ in pkt_class.get_fields():
+        if isinstance(field, Bits):
+            bits_group.append((name, ('bits', field)))
+            if field.iam_last:
+                I = field.I
+                chunks.append(
+                    (I.field_name, I.byte_count, _int_format(I), bits_group)
+                )
+                bits_group = []
+
+        elif isinstance(field, Int) and field.is_fixed:
+            decoders = [(name, ('int', field))]
+            chunks.append(
+                (name, field.byte_count, _int_format(field), decoders)
+            )
+
+        elif isinstance(field, Data) and field.is_fixed:
+            decoders = [(name, ('data', field))]
+            chunks.append(
+                (name, field.byte_count, 'V%i' % field.byte_count, decoders)
+            )
+
+        else:
+            raise ValueError(
+                "The packet %s cannot be described as a NumPy dtype: the field '%s' (%s) is not of a fixed size."
+                % (pkt_class.__name__, name, field.__class__.__name__)
+            )
+
+    return chunks
+
+
+def _int_format(field):
+    if field.struct_code is None:
+        # non primitive sizes (like 3 bytes) are kept as raw bytes
+        return 'V%i' % field.byte_count
+
+    endianness = '>' if field.is_bigendian else '<'
+    kind = 'i' if field.is_signed else 'u'
+    return '%s%s%i' % (endianness, kind, field.byte_count)
+
+
+def as_numpy_dtype(pkt_class):
+    ''' Return the NumPy structured dtype that describes a record of
+        the given packet class.
+
+        The Int fields have the same size, sign and endianness; the fixed
+        Data fields are raw bytes ('V', not 'S' which would strip their
+        trailing null bytes) and the groups of Bits are represented
+        by their underlying integer.
+        Integers of sizes that NumPy does not support (like 3 bytes) are
+        represented as raw bytes ('V') too.
+        '''
+    np = _import_numpy()
+    chunks = _describe_record(pkt_class)
+    return np.dtype([(name, fmt) for name, _, fmt, _ in chunks])
+
+
+def unpack_columns(pkt_class, raw, count=None, offset=0):
+    ''' Decode 'count' consecutive records of the given packet class
+        from the raw buffer (bytes, bytearray, mmap or anything that supports
+        the buffer protocol) starting from the offset.
+
+        If count is None, decode as many complete records as there are.
+
+        Return a dictionary with one array per field: the Int and Data
+        fields are views of the raw buffer while the Bits fields are
+        extracted from their underlying integer.
+
+        The elements of a Data column are NumPy's voids: convert them
+        with bytes() (or the whole column with tolist()).
+        '''
+    np = _import_numpy()
+    chunks = _describe_record(pkt_class)
+    dtype = np.dtype([(name, fmt) for name, _, fmt, _ in chunks])
+
+    if count is None:
+        count = (len(memoryview(raw).cast('B')) - offset) // dtype.itemsize
+
+    records = np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
+
+    # the records seen as a matrix of bytes, one row per record
+    octets = records.view(np.uint8).reshape(count, dtype.itemsize)
+
+    columns = {}
+    for name, byte_count, fmt, decoders in chunks:
+        kind, _ = decoders[0][1]
+        if fmt.startswith('V') and kind != 'data':
+            begin = dtype.fields[name][1]
+            chunk = _bytes_to_int(
+                np, octets[:, begin:begin + byte_count], decoders
+            )
+        else:
+            chunk = records[name]
+
+        for column_name, (kind, field) in decoders:
+            if kind == 'bits':
+                # the mask of a Bits field is already shifted
+                columns[column_name] = (chunk & field.mask) >> field.shift
+            else:
+                columns[column_name] = chunk
+
+    return columns
+
+
+def _bytes_to_int(np, octets, decoders):
+    ''' Convert a matrix of bytes, one row per integer of a non-primitive
+        size (like 3 bytes), into a column of integers. '''
+    kind, field = decoders[0][1]
+    if kind == 'bits':
+        field = field.I
+
+    count, byte_count = octets.shape
+    if not field.is_bigendian:
+        octets = octets[:, ::-1]
+
+    if byte_count > 8:
+        # NumPy has not integers of this size, use Python's ints
+        return np.array(
+            [
+                int.from_bytes(row.tobytes(), 'big', signed=field.is_signed)
+                for row in octets
+            ],
+            dtype=object
+        )
+
+    values = np.zeros(count, dtype=np.uint64)
+    for i in range(byte_count):
+        values = (values << np.uint64(8)) | octets[:, i].astype(np.uint64)
+
+    if kind == 'bits' or not field.is_signed:
+        return values
+
+    # two's complement
+    values = values.astype(np.int64)
+    sign_bit = 1 << (byte_count * 8 - 1)
+    return np.where(values >= sign_bit, values - (sign_bit << 1), values)
@@ -98,122 +98,149 @@ BinaryExpr = collections.namedtuple('BinaryExpr', ['left', 'right', 'op'])
 # For -x
 UnaryExpr = collections.namedtuple('UnaryExpr', ['arg', 'op'])
 
+# Python's source of the operations that can be written inline,
+# the rest are called as functions
+BinaryOperatorsSource = {
+    operator.add: '+',
+    operator.sub: '-',
+    operator.mul: '*',
+    operator.truediv: '/',
+    operator.floordiv: '//',
+    operator.mod: '%',
+    operator.pow: '**',
+    operator.le: '<=',
+    operator.lt: '<',
+    operator.ge: '>=',
+    operator.gt: '>',
+    operator.eq: '==',
+    operator.ne: '!=',
+    operator.and_: '&',
+    operator.or_: '|',
+    operator.xor: '^',
+    operator.rshift: '>>',
+    operator.lshift: '<<',
+}
 
-class Operations:
-    def __init__(self):
-        self.ops = []
+UnaryOperatorsSource = {
+    operator.neg: '(-%s)',
+    operator.inv: '(~%s)',
+    operator.truth: 'bool(%s)',
+    len: 'len(%s)',
+}
 
-    def append(self, num_arguments, operation, level, operation_name=None):
-        if operation_name is None:
-            operation_name = repr(operation)
+# the types of the literal values which repr() is valid Python source
+LiteralTypes = (int, bool, bytes, str, type(None))
 
-        self.ops.append((num_arguments, operation, level, operation_name))
 
-    def as_list(self):
-        return [
-            (num_arguments, operation)
-            for num_arguments, operation, _, _ in self.ops
-        ]
+def compile_expr_into_source(root_expr, constants):
+    ''' Return the Python source code of a single expression that computes
+        the given deferred expression reading the fields from 'pkt'.
 
+        The objects that cannot be written in the source (like a function
+        or a Field that does not belong to a packet) are added to the
+        constants dictionary and referenced by their name there.
 
-def compile_expr(root_expr, ops=None, level=0, verbose=False):
+        example: length - 4 -> "(pkt.length - 4)"
+        example: foo(x, [y, z]) -> "_c0(pkt.x, (pkt.y, pkt.z))"
+        with constants = {'_c0': foo}
+    '''
     from bisturi.field import Field
-    next_level = level + 1
 
-    if ops is None:
-        ops = Operations()
+    def constant(obj):
+        name = '_c%i' % len(constants)
+        constants[name] = obj
+        return name
+
+    def source_of(expr):
+        return compile_expr_into_source(expr, constants)
 
     if not isinstance(root_expr, (UnaryExpr, BinaryExpr, NaryExpr, Field)):
-        # the identity function.
-        # example: 42 -> [42]
-        cb = lambda pkt, *vargs, **kargs: root_expr
-        ops.append(0, cb, level, 'literal-value ' + repr(root_expr))
+        # a literal value
+        # example: 42 -> "42"
+        if type(root_expr) in LiteralTypes:
+            return repr(root_expr)
+        return constant(root_expr)
 
     elif isinstance(root_expr, NaryExpr):
-        # root_expr is "op(x, list)" or "op(x, mapping)",
-        # compile x then each element of list/mapping and append
-        # a single element representing the whole list/mapping
-        # and then the op
+        # root_expr is "op(x, list)" or "op(x, mapping)", the list
+        # and the mapping are passed as a single tuple or dict
         #
-        # example: foo(x, [y, z]) -> [x, (y, z), foo]
-        # example: foo(x, {k1=y, k2=z}) -> [x, {k1=y, k2=z}, foo]
+        # example: foo(x, [y, z]) -> "foo(x, (y, z))"
+        # example: foo(x, {k1=y, k2=z}) -> "foo(x, {k1: y, k2: z})"
         left, arglist, argmapping, op = root_expr
 
-        compile_expr(left, ops, level=next_level)
-
         assert arglist or argmapping
         assert not (arglist and argmapping)
 
         if arglist:
-            n = len(arglist)
-            for value in arglist:
-                compile_expr(value, ops, level=next_level)
-
-            cb = lambda *vargs: vargs
-            ops.append(n, cb, level, 'arg-list')
-
+            options = '(%s,)' % ', '.join(source_of(v) for v in arglist)
         else:
-            n = len(argmapping)
-            keys, values = zip(*argmapping.items())
-            for value in values:
-                compile_expr(value, ops, level=next_level)
+            options = '{%s}' % ', '.join(
+                '%s: %s' % (source_of(k), source_of(v))
+                for k, v in argmapping.items()
+            )
+
+        if op is if_true_then_else and arglist and len(arglist) == 2:
+            # example: if_true_then_else(x, [y, z]) -> "(y if x else z)"
+            return '(%s if %s else %s)' % (
+                source_of(arglist[0]), source_of(left), source_of(arglist[1])
+            )
 
-            cb = lambda *vargs: dict(zip(keys, vargs))
-            ops.append(n, cb, level, 'arg-mapping')
+        if op is chooses:
+            # example: chooses(x, [y, z]) -> "(y, z)[x]"
+            return '%s[%s]' % (options, source_of(left))
 
-        ops.append(2, op, level)
+        return '%s(%s, %s)' % (constant(op), source_of(left), options)
 
     elif isinstance(root_expr, BinaryExpr):
-        # root_expr is "op(x, y)", compile x and y and append then op
-        # example: x + y -> [x, y, +]
+        # example: x + y -> "(x + y)"
         l, r, op = root_expr
-        compile_expr(l, ops, level=next_level)
-        compile_expr(r, ops, level=next_level)
-        ops.append(2, op, level)
+        if op is operator.getitem:
+            return '%s[%s]' % (source_of(l), source_of(r))
+
+        if op in BinaryOperatorsSource:
+            return '(%s %s %s)' % (
+                source_of(l), BinaryOperatorsSource[op], source_of(r)
+            )
+
+        return '%s(%s, %s)' % (constant(op), source_of(l), source_of(r))
 
     elif isinstance(root_expr, UnaryExpr):
-        # root_expr is "op(x)", compile x and append then op
-        # example: -x  -> [x, -]
+        # example: -x  -> "(-x)"
         a, op = root_expr
-        compile_expr(a, ops, level=next_level)
-        ops.append(1, op, level)
+        if op in UnaryOperatorsSource:
+            return UnaryOperatorsSource[op] % source_of(a)
+
+        return '%s(%s)' % (constant(op), source_of(a))
 
     elif isinstance(root_expr, Field):
         if hasattr(root_expr, 'field_name'):
-            field_name = root_expr.field_name
-            cb = lambda pkt, *vargs, **kargs: getattr(pkt, field_name)
-            ops.append(0, cb, level, 'field-lookup ' + repr(root_expr))
+            return 'pkt.%s' % root_expr.field_name
         else:
-            cb = lambda pkt, *vargs, **kargs: root_expr
-            ops.append(0, cb, level, 'literal-field-value ' + repr(root_expr))
+            return constant(root_expr)
     else:
         raise Exception("Invalid argument of type %s" % repr(type(root_expr)))
 
-    return ops
-
-
-def exec_compiled_expr(pkt, args, ops, *vargs, **kargs):
-    args = list(args)
-
-    for arg_count, op in ops:
-        if arg_count == 0:
-            result = op(pkt, *vargs, **kargs)
-        else:
-            result = op(*reversed(args[:arg_count]))
-            del args[:arg_count]
 
-        args.insert(0, result)
+def compile_expr_into_callable(root_expr):
+    ''' Compile the deferred expression into a Python function
+        f(pkt, *vargs, **kargs) that computes it.
 
-    assert len(args) == 1
-    return args[0]
+        If the expression does not require any constant (see
+        compile_expr_into_source), its source is available in the
+        'inline_source' attribute of the function (None otherwise) so
+        it can be inlined in the generated code.
+    '''
+    constants = {}
+    source = compile_expr_into_source(root_expr, constants)
 
+    code = 'def deferred_expr(pkt, *vargs, **kargs):\n   return %s\n' % source
+    namespace = dict(constants)
+    exec(compile(code, '<deferred expression>', 'exec'), namespace)
 
-def compile_expr_into_callable(root_expr):
-    ops = compile_expr(root_expr).as_list()
-    args = []
-    return lambda pkt, *vargs, **kargs: exec_compiled_expr(
-        pkt, args, ops, *vargs, **kargs
-    )
+    func = namespace['deferred_expr']
+    func.inline_source = None if constants else source
+    return func
 
 
 def _defer_method(
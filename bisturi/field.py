@@ -1,6 +1,6 @@
-import time, struct, sys, copy, re
+import time, struct, sys, copy, re, weakref
 
-from bisturi.packet import Packet, Prototype
+from bisturi.packet import Packet, Prototype, IncompleteDataError, _incomplete_data, _clone_value, _keep_raw_span, _unmodified_raw, _findable
 from bisturi.deferred import defer_operations, UnaryExpr, BinaryExpr, NaryExpr,\
                                     compile_expr_into_callable
 from bisturi.pattern_matching import Any
@@ -115,13 +115,23 @@ class Field:
 
         return slots
 
+    def static_byte_count(self):
+        ''' Return the count of bytes that the field always takes or None
+            if it cannot be known without unpacking it. '''
+        return self.byte_count if self.is_fixed else None
+
+    def min_byte_count(self):
+        ''' Return the minimum count of bytes that the field takes. '''
+        byte_count = self.static_byte_count()
+        return 0 if byte_count is None else byte_count
+
     def init(self, packet, defaults):
         ''' Initialize the field based on the default.
             This must set a 'field_name' attribute in the packet.'''
         try:
             obj = defaults[self.field_name]
         except KeyError:
-            obj = copy.deepcopy(self.default)
+            obj = _clone_value(self.default)
 
         setattr(packet, self.field_name, obj)
 
@@ -347,7 +357,6 @@ class Int(Field):
 
         else:
             self.struct_code = None
-            self.base = 2**(self.byte_count * 8)
 
             self.pack, self.unpack = self._pack_fixed_size, \
                                         self._unpack_fixed_size
@@ -372,7 +381,10 @@ class Int(Field):
 
     def _unpack_fixed_and_primitive_size(self, pkt, raw, offset=0, **k):
         next_offset = offset + self.byte_count
-        integer = self.struct_obj.unpack(raw[offset:next_offset])[0]
+        if next_offset > len(raw):
+            raise _incomplete_data(len(raw) - offset, self.byte_count)
+
+        integer = self.struct_obj.unpack_from(raw, offset)[0]
         setattr(pkt, self.field_name, integer)
 
         return next_offset
@@ -387,23 +399,14 @@ class Int(Field):
     def _unpack_fixed_size(self, pkt, raw, offset=0, **k):
         next_offset = offset + self.byte_count
         raw_data = raw[offset:next_offset]
+        if len(raw_data) != self.byte_count:
+            raise _incomplete_data(len(raw_data), self.byte_count)
 
-        try:
-            num = int.from_bytes(
-                raw_data,
-                byteorder='big' if self.is_bigendian else 'little',
-                signed=self.is_signed
-            )
-
-        except AttributeError:
-            if not self.is_bigendian:
-                raw_data = raw_data[::-1]
-
-            hexbytes = raw_data.encode('hex')
-            num = int(hexbytes, 16)
-
-            if self.is_signed and ord(raw_data[0]) > 127:
-                num = -(self.base - num)
+        num = int.from_bytes(
+            raw_data,
+            byteorder='big' if self.is_bigendian else 'little',
+            signed=self.is_signed
+        )
 
         setattr(pkt, self.field_name, num)
         return next_offset
@@ -411,21 +414,11 @@ class Int(Field):
     def _pack_fixed_size(self, pkt, fragments, **k):
         integer = getattr(pkt, self.field_name)
 
-        try:
-            data = integer.to_bytes(
-                self.byte_count,
-                byteorder='big' if self.is_bigendian else 'little',
-                signed=self.is_signed
-            )
-
-        except AttributeError:
-            num = (self.base + integer) if integer < 0 else integer
-
-            xcode = "%%0%(count)ix" % {'count': self.byte_count * 2}
-            data = (xcode % num).decode('hex')
-
-            if not self.is_bigendian:
-                data = data[::-1]
+        data = integer.to_bytes(
+            self.byte_count,
+            byteorder='big' if self.is_bigendian else 'little',
+            signed=self.is_signed
+        )
 
         fragments.append(data)
         return fragments
@@ -444,6 +437,23 @@ class Int(Field):
         return fragments
 
 
+def _common_suffix(markers):
+    ''' Return the longest suffix shared by all the markers. '''
+    suffix = markers[0]
+    for marker in markers[1:]:
+        while not marker.endswith(suffix):
+            suffix = suffix[1:]
+
+    return suffix
+
+
+def _delimiter_name(field_name):
+    ''' Return the name of the hidden field of the packet that keeps
+        the delimiter found by a Data field with a tuple of markers
+        or a regexp. '''
+    return "_delimiter__" + field_name
+
+
 @defer_operations(allowed_categories=['sequence'])
 class Data(Field):
     def __init__(
@@ -466,10 +476,18 @@ class Data(Field):
                         "The until marker is a regular expression which pattern is of type '%s' but it must be 'bytes'."
                         % type(pattern)
                     )
+            elif isinstance(until_marker, tuple):
+                if not until_marker or not all(
+                    isinstance(marker, bytes) and marker
+                    for marker in until_marker
+                ):
+                    raise ValueError(
+                        "The until marker is a tuple but it must have one or more non-empty 'bytes' markers."
+                    )
             else:
                 if not isinstance(until_marker, bytes):
                     raise ValueError(
-                        "The until marker must be 'bytes' or a regular expression, not '%s'."
+                        "The until marker must be 'bytes', a tuple of 'bytes' or a regular expression, not '%s'."
                         % type(until_marker)
                     )
 
@@ -491,6 +509,12 @@ class Data(Field):
             and not include_delimiter else b''
         )
 
+        # with a tuple of markers or a regexp, the delimiter found is
+        # different for each packet so it is kept in a hidden field of
+        # the packet (the unpack never writes into the field so the same
+        # packet class can be unpacked from several threads)
+        self.delimiter_name = None
+
         assert not (consume_delimiter == False and include_delimiter == True)
         self.consume_delimiter = consume_delimiter  #XXX document this!
         self.is_fixed = isinstance(byte_count, int)
@@ -499,9 +523,20 @@ class Data(Field):
     def _compile(self, position, fields, bisturi_conf):
         slots = Field._compile_impl(self, position, fields, bisturi_conf)
 
+        # with zero_copy the unpacked data are memoryview slices of the raw
+        # buffer instead of bytes' copies
+        self.zero_copy = bisturi_conf.get('zero_copy', False)
+        if self.zero_copy:
+            self._slice = self._slice_as_memoryview
+        else:
+            self._slice = self._slice_as_bytes
+
         if self.byte_count is not None:
             if isinstance(self.byte_count, int):
-                self.struct_code = "%is" % self.byte_count
+                if not self.zero_copy:
+                    # Python's struct always makes a copy so we cannot
+                    # use it in zero_copy mode
+                    self.struct_code = "%is" % self.byte_count
                 self.unpack = self._unpack_fixed_size
 
             elif isinstance(self.byte_count, Field):
@@ -528,9 +563,58 @@ class Data(Field):
                 assert self._search_buffer_length >= 0
 
             if isinstance(self.until_marker, bytes):
+                # a raw buffer without a 'find' method (like a memoryview
+                # of an array, see _findable) needs a regexp to search
+                # the marker
+                self._until_marker_regexp = re.compile(
+                    re.escape(self.until_marker)
+                )
                 self.unpack = self._unpack_with_string_marker
 
+            elif isinstance(self.until_marker, tuple):
+                # the markers are tried from the longest to the shortest
+                # so b'\r\n' wins over b'\n' when both begin at the same
+                # position (or when both end there, see _find_markers)
+                self._markers_by_length = sorted(
+                    set(self.until_marker), key=len, reverse=True
+                )
+
+                # a single regexp to search all the markers at once
+                self._until_marker_regexp = re.compile(
+                    b'|'.join(
+                        b'(' + re.escape(marker) + b')'
+                        for marker in self._markers_by_length
+                    )
+                )
+
+                # if the shortest marker is the suffix of the others (like
+                # b'\n' of b'\r\n') and it appears only there, the search
+                # can be done with a single find() of the shortest marker
+                # followed by a check of the bytes before it
+                shortest = self._markers_by_length[-1]
+                if all(
+                    marker.find(shortest) == len(marker) - len(shortest)
+                    for marker in self._markers_by_length
+                ):
+                    self._markers_common_suffix = shortest
+                else:
+                    self._markers_common_suffix = None
+
+                if not self.include_delimiter:
+                    self.delimiter_name = _delimiter_name(self.field_name)
+                    self.default_delimiter = self.until_marker[0]
+                    slots.append(self.delimiter_name)
+
+                self.unpack = self._unpack_with_markers
+
             elif hasattr(self.until_marker, 'search'):
+                # the $ regexp never has a delimiter to pack
+                if not self.include_delimiter and \
+                        self.until_marker.pattern != b"$":
+                    self.delimiter_name = _delimiter_name(self.field_name)
+                    self.default_delimiter = b''
+                    slots.append(self.delimiter_name)
+
                 self.unpack = self._unpack_with_regexp_marker
 
             else:
@@ -544,25 +628,46 @@ class Data(Field):
             defaults.get(self.field_name, self.default)
         )
 
+        if self.delimiter_name is not None:
+            setattr(packet, self.delimiter_name, self.default_delimiter)
+
     def unpack(self, pkt, raw, offset=0, **k):
         raise NotImplementedError(
             "This method should be implemented during the 'compilation' phase."
         )
 
     def pack(self, pkt, fragments, **k):
-        r = getattr(pkt, self.field_name) + self.delimiter_to_be_included
-        fragments.append(r)
+        r = getattr(pkt, self.field_name)
+        if not isinstance(r, bytes):
+            # memoryview (zero_copy) or any other bytes-like object
+            r = bytes(r)
+
+        if self.delimiter_name is not None:
+            # a packet that was never initialized nor unpacked (like one
+            # referenced by a Ref with a callable) has not a delimiter yet
+            fragments.append(
+                r + getattr(pkt, self.delimiter_name, self.default_delimiter)
+            )
+        else:
+            fragments.append(r + self.delimiter_to_be_included)
         return fragments
 
+    def _slice_as_bytes(self, raw, offset, next_offset):
+        chunk = raw[offset:next_offset]
+        return chunk if isinstance(chunk, bytes) else bytes(chunk)
+
+    def _slice_as_memoryview(self, raw, offset, next_offset):
+        if not isinstance(raw, memoryview):
+            raw = memoryview(raw)
+        return raw[offset:next_offset]
+
     def _unpack_fixed_size(self, pkt, raw, offset=0, **k):
         byte_count = self.byte_count
         next_offset = offset + byte_count
 
-        chunk = raw[offset:next_offset]
+        chunk = self._slice(raw, offset, next_offset)
         if len(chunk) != byte_count:
-            raise Exception(
-                "Unpacked %i bytes but expected %i" % (len(chunk), byte_count)
-            )
+            raise _incomplete_data(len(chunk), byte_count)
 
         setattr(pkt, self.field_name, chunk)
         return next_offset
@@ -571,11 +676,9 @@ class Data(Field):
         byte_count = getattr(pkt, self.byte_count.field_name)
         next_offset = offset + byte_count
 
-        chunk = raw[offset:next_offset]
+        chunk = self._slice(raw, offset, next_offset)
         if len(chunk) != byte_count:
-            raise Exception(
-                "Unpacked %i bytes but expected %i" % (len(chunk), byte_count)
-            )
+            raise _incomplete_data(len(chunk), byte_count)
 
         setattr(pkt, self.field_name, chunk)
         return next_offset
@@ -584,11 +687,9 @@ class Data(Field):
         byte_count = self.byte_count(pkt=pkt, raw=raw, offset=offset, **k)
         next_offset = offset + byte_count
 
-        chunk = raw[offset:next_offset]
+        chunk = self._slice(raw, offset, next_offset)
         if len(chunk) != byte_count:
-            raise Exception(
-                "Unpacked %i bytes but expected %i" % (len(chunk), byte_count)
-            )
+            raise _incomplete_data(len(chunk), byte_count)
 
         setattr(pkt, self.field_name, chunk)
         return next_offset
@@ -596,60 +697,154 @@ class Data(Field):
     def _unpack_with_string_marker(self, pkt, raw, offset=0, **k):
         until_marker = self.until_marker
 
+        # search in place, without slicing (copying) the rest of the buffer
         if self._search_buffer_length:
-            max_next_offset_allowed = offset + self._search_buffer_length
-            search_buffer = raw[offset:max_next_offset_allowed]
+            end = offset + self._search_buffer_length
+        else:
+            end = len(raw)
+
+        findable = _findable(raw)
+        if findable is None:
+            # a regexp can search in a buffer without a find()
+            match = self._until_marker_regexp.search(raw, offset, end)
+            position = match.start() if match else -1
         else:
-            search_buffer = raw[offset:]
+            position = findable.find(until_marker, offset, end)
+        if position < 0:
+            raise self._marker_not_found(raw, offset)
 
-        count = search_buffer.find(until_marker)
-        assert count >= 0
+        count = position - offset
 
         extra_count = 0
         if self.include_delimiter:
             count += len(until_marker)
+        elif self.consume_delimiter:
+            extra_count = len(until_marker)
+
+        next_offset = offset + count
+        setattr(pkt, self.field_name, self._slice(raw, offset, next_offset))
+
+        return next_offset + extra_count
+
+    def _unpack_with_markers(self, pkt, raw, offset=0, **k):
+        if self._search_buffer_length:
+            end = offset + self._search_buffer_length
         else:
-            self.delimiter_to_be_included = until_marker
+            end = len(raw)
+
+        position, delimiter = self._find_markers(raw, offset, end)
+        if position < 0:
+            raise self._marker_not_found(raw, offset)
+
+        count = position - offset
+        extra_count = 0
+        if self.include_delimiter:
+            count += len(delimiter)
+        else:
+            setattr(pkt, self.delimiter_name, delimiter)
             if self.consume_delimiter:
-                extra_count = len(until_marker)
+                extra_count = len(delimiter)
 
         next_offset = offset + count
-        setattr(pkt, self.field_name, raw[offset:next_offset])
+        setattr(pkt, self.field_name, self._slice(raw, offset, next_offset))
 
         return next_offset + extra_count
 
+    def _find_markers(self, raw, offset, end):
+        ''' Search the first of the markers in raw[offset:end], in place,
+            and return its position and the marker found or (-1, None).
+            '''
+        suffix = self._markers_common_suffix
+        findable = None if suffix is None else _findable(raw)
+        if findable is not None:
+            position = findable.find(suffix, offset, end)
+            if position < 0:
+                return -1, None
+
+            # the longest marker that ends where the suffix ends
+            stop = position + len(suffix)
+            for marker in self._markers_by_length:
+                begin = stop - len(marker)
+                if begin >= offset and raw[begin:stop] == marker:
+                    return begin, marker
+
+        # without a common suffix or a find() we use a regexp
+        match = self._until_marker_regexp.search(raw, offset, end)
+        if match is None:
+            return -1, None
+
+        return match.start(), self._markers_by_length[match.lastindex - 1]
+
     def _unpack_with_regexp_marker(self, pkt, raw, offset=0, **k):
         until_marker = self.until_marker
 
+        # search in place, without slicing (copying) the rest of the buffer;
+        # the search begins at offset and the regexp sees the buffer
+        # as it were ending at the end of the search
         if self._search_buffer_length:
-            max_next_offset_allowed = offset + self._search_buffer_length
-            search_buffer = raw[offset:max_next_offset_allowed]
+            end = offset + self._search_buffer_length
         else:
-            search_buffer = raw[offset:]
+            end = len(raw)
 
         extra_count = 0
         if until_marker.pattern == b"$":  # shortcut
             count = len(raw) - offset
         else:
-            match = until_marker.search(
-                search_buffer, 0
-            )  #XXX should be (raw, offset) or (raw[offset:], 0) ? See the method search in the module re
+            match = until_marker.search(raw, offset, end)
             if match:
                 if self.include_delimiter:
-                    count = match.end()
+                    count = match.end() - offset
                 else:
-                    count = match.start()
+                    count = match.start() - offset
                     if self.consume_delimiter:
-                        extra_count = match.end() - count
-                    self.delimiter_to_be_included = match.group()
+                        extra_count = match.end() - match.start()
+                    setattr(pkt, self.delimiter_name, bytes(match.group()))
             else:
-                assert False
+                raise self._marker_not_found(raw, offset)
 
         next_offset = offset + count
-        setattr(pkt, self.field_name, raw[offset:next_offset])
+        setattr(pkt, self.field_name, self._slice(raw, offset, next_offset))
 
         return next_offset + extra_count
 
+    def min_byte_count(self):
+        if self.is_fixed or self.byte_count is not None:
+            return Field.min_byte_count(self)
+
+        if self.include_delimiter or self.consume_delimiter:
+            if isinstance(self.until_marker, bytes):
+                # at least the marker
+                return len(self.until_marker)
+
+            if isinstance(self.until_marker, tuple):
+                # at least the shortest marker
+                return min(len(marker) for marker in self.until_marker)
+
+        return 0
+
+    def _marker_not_found(self, raw, offset):
+        ''' Return the exception to raise when the marker was not found. '''
+        searched = len(raw) - offset
+        if self._search_buffer_length and searched >= self._search_buffer_length:
+            return Exception(
+                "The marker was not found in the first %i bytes" %
+                self._search_buffer_length
+            )
+
+        # the marker may be in the bytes that follow, if any
+        marker = self.until_marker
+        if isinstance(marker, tuple):
+            # any of the markers ends with their common suffix
+            marker = _common_suffix(marker) or None
+        elif not isinstance(marker, bytes):
+            marker = None
+
+        return IncompleteDataError(
+            "The marker was not found in the %i bytes available" %
+            max(searched, 0),
+            marker=marker
+        )
+
     def pack_regexp(self, pkt, fragments, **k):
         value = getattr(pkt, self.field_name)
         is_literal = not isinstance(value, Any)
@@ -684,11 +879,14 @@ class Data(Field):
                     fragments.append(custom_regexp, is_literal=False)
 
             else:
-                endswith = (
-                    re.escape(self.until_marker)
-                    if isinstance(self.until_marker, bytes) else
-                    self.until_marker.pattern
-                )
+                if isinstance(self.until_marker, bytes):
+                    endswith = re.escape(self.until_marker)
+                elif isinstance(self.until_marker, tuple):
+                    endswith = b'(?:' + b'|'.join(
+                        re.escape(marker) for marker in self.until_marker
+                    ) + b')'
+                else:
+                    endswith = self.until_marker.pattern
                 fragments.append(custom_regexp + endswith, is_literal=False)
 
         return fragments
@@ -865,6 +1063,11 @@ class Ref(Field):
 
             self.unpack = self._unpack_using_callable
             self.pack = self._pack_with_callable
+            self._prepared_fields = {}
+
+            # a Data returned by the callable may need to keep its
+            # delimiter in the packet (see Data)
+            slots.append(_delimiter_name(self.field_name))
 
         if self.embed:
             assert isinstance(prototype, Packet)
@@ -895,14 +1098,30 @@ class Ref(Field):
 
             Field.init(self, packet, defaults)
 
+    def static_byte_count(self):
+        if self.embed:
+            # the fields of an embedded packet are fields of the packet
+            return 0
+
+        if isinstance(self.prototype, Prototype):
+            return self.proto_class._bisturi_fixed_size
+
+        return None
+
+    def min_byte_count(self):
+        if self.embed:
+            return 0
+
+        if isinstance(self.prototype, Prototype):
+            return self.proto_class._bisturi_min_size
+
+        return 0
+
     def _unpack_using_callable(self, pkt, raw, offset=0, **k):
         referenced = self.prototype(pkt=pkt, raw=raw, offset=offset, **k)
 
         if isinstance(referenced, Field):
-            referenced.field_name = self.field_name
-            referenced._compile(
-                position=self.position, fields=[], bisturi_conf={}
-            )
+            referenced = self._prepare_referenced_field(referenced)
             referenced.init(pkt, {})
 
             return referenced.unpack(pkt=pkt, raw=raw, offset=offset, **k)
@@ -910,13 +1129,52 @@ class Ref(Field):
         assert isinstance(referenced, Packet)
 
         setattr(pkt, self.field_name, referenced)
-        return referenced.unpack_impl(raw, offset, **k)
+        next_offset = referenced.unpack_impl(raw, offset, **k)
+        if k.get('keep-raw'):
+            _keep_raw_span(referenced, raw, offset, next_offset)
+        return next_offset
+
+    def _prepare_referenced_field(self, referenced):
+        ''' Return a copy of the field returned by the callable, named and
+            compiled as this field.
+
+            The returned field is never modified: the callable may return
+            the same field for several Ref fields or from several threads.
+            The copy is made once per returned field and it is forgotten
+            when the returned field is garbage collected.
+            '''
+        key = id(referenced)
+        try:
+            original, prepared = self._prepared_fields[key]
+            if original() is referenced:
+                return prepared
+        except KeyError:
+            pass
+
+        prepared = copy.copy(referenced)
+        for attrname in list(vars(prepared)):
+            if attrname.endswith('_cached_result'):
+                delattr(prepared, attrname)  # see exec_once
+
+        prepared.field_name = self.field_name
+        prepared._compile(position=self.position, fields=[], bisturi_conf={})
+
+        prepared_fields = self._prepared_fields
+        forget = lambda _: prepared_fields.pop(key, None)
+        prepared_fields[key] = (weakref.ref(referenced, forget), prepared)
+        return prepared
 
     def _pack_with_callable(self, pkt, fragments, **k):
         # this can be a Packet or can be anything (but not a Field: it could be
         # a 'int' for example but not a 'Int')
         obj = getattr(pkt, self.field_name)
         if isinstance(obj, Packet):
+            if k.get('keep-raw'):
+                raw = _unmodified_raw(obj)
+                if raw is not None:
+                    fragments.append(bytes(raw))
+                    return fragments
+
             return obj.pack_impl(fragments=fragments, **k)
 
         # we try to know how to pack this value
@@ -927,10 +1185,7 @@ class Ref(Field):
         )
 
         if isinstance(referenced, Field):
-            referenced.field_name = self.field_name
-            referenced._compile(
-                position=self.position, fields=[], bisturi_conf={}
-            )
+            referenced = self._prepare_referenced_field(referenced)
             #referenced.init(pkt, {})
 
             return referenced.pack(pkt, fragments, **k)
@@ -944,13 +1199,22 @@ class Ref(Field):
         )
 
     def _unpack_referencing_a_packet(self, pkt, **k):
-        p = self.proto_class(_initialize_fields=False)
+        p = self.proto_class._new_empty()
         setattr(pkt, self.field_name, p)
-        return p.unpack_impl(**k)
+        next_offset = p.unpack_impl(**k)
+        if k.get('keep-raw'):
+            _keep_raw_span(p, k['raw'], k['offset'], next_offset)
+        return next_offset
 
     def _pack_referencing_a_packet(self, pkt, fragments, **k):
-        return getattr(pkt,
-                       self.field_name).pack_impl(fragments=fragments, **k)
+        p = getattr(pkt, self.field_name)
+        if k.get('keep-raw'):
+            raw = _unmodified_raw(p)
+            if raw is not None:
+                fragments.append(bytes(raw))
+                return fragments
+
+        return p.pack_impl(fragments=fragments, **k)
 
 
 @defer_operations(allowed_categories=['integer'])
@@ -1013,6 +1277,10 @@ class Bits(Field):
             slots.append(fname)
         return slots
 
+    def static_byte_count(self):
+        # the first bits of a group take the bytes of the whole group
+        return self.I.byte_count if self.iam_first else 0
+
     def init(self, packet, defaults):
         if self.iam_first:
             setattr(packet, self.I.field_name, 0)
@@ -1032,11 +1300,17 @@ class Bits(Field):
         return offset
 
     def pack(self, pkt, fragments, **k):
+        value = getattr(pkt, self.field_name)
+        max_value = self.mask >> self.shift
+        if value & ~max_value:
+            raise ValueError(
+                "The value %i does not fit in %i bits." %
+                (value, max_value.bit_length())
+            )
+
         I = getattr(pkt, self.I.field_name)
         setattr(
-            pkt, self.I.field_name,
-            ((getattr(pkt, self.field_name) << self.shift) & self.mask) |
-            (I & (~self.mask))
+            pkt, self.I.field_name, (value << self.shift) | (I & (~self.mask))
         )
 
         if self.iam_last:
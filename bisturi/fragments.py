@@ -3,20 +3,67 @@ import re, pprint
 
 
 class Fragments:
+    ''' Collect the pieces of bytes of a packet being packed, each one
+        at a given position, and join them at the end.
+
+        Most of the time the pieces are appended one after the other so
+        they are kept in a flat list. Only when a piece is inserted out
+        of order (like after a jump done by a Move field) all the pieces
+        are moved to a sparse representation that checks for collisions
+        between them and fills the holes.
+        '''
     def __init__(self, fill=b'.'):
+        # sequential representation: the pieces one after the other
+        # without holes (None if the sparse representation is used)
+        self.chunks = []
+        self.end_of_chunks = 0
+
+        # sparse representation
         self.fragments = {}
         self.begin_of_fragments = []
+
         self.current_offset = 0
         self.fill = fill
 
     def append(self, string):
-        self.insert(self.current_offset, string)
+        if self.chunks is not None and self.current_offset == self.end_of_chunks:
+            self.chunks.append(string)
+            self.end_of_chunks += len(string)
+            self.current_offset = self.end_of_chunks
+        else:
+            self.insert(self.current_offset, string)
 
     def extend(self, iterable):
         for string in iterable:
-            self.insert(self.current_offset, string)
+            self.append(string)
 
     def insert(self, position, string):
+        if self.chunks is not None:
+            if position == self.end_of_chunks:
+                self.chunks.append(string)
+                self.end_of_chunks += len(string)
+                self.current_offset = self.end_of_chunks
+                return
+
+            self._switch_to_sparse()
+
+        self._insert_sparse(position, string)
+
+    def _switch_to_sparse(self):
+        chunks = self.chunks
+        current_offset = self.current_offset
+
+        self.chunks = None
+        self.end_of_chunks = None
+
+        position = 0
+        for string in chunks:
+            self._insert_sparse(position, string)
+            position += len(string)
+
+        self.current_offset = current_offset
+
+    def _insert_sparse(self, position, string):
         #if not string:
         #   return
 
@@ -51,6 +98,9 @@ class Fragments:
         self.current_offset = position + L
 
     def tobytes(self):
+        if self.chunks is not None:
+            return b''.join(self.chunks)
+
         begin = 0
         result = []
         for offset, s in sorted(self.fragments.items()):
@@ -61,6 +111,14 @@ class Fragments:
         return b''.join(result)
 
     def __repr__(self):
+        if self.chunks is not None:
+            items = []
+            position = 0
+            for string in self.chunks:
+                items.append((position, string))
+                position += len(string)
+            return pprint.pformat(items)
+
         return pprint.pformat(sorted(self.fragments.items()))
 
     def __eq__(self, other):
@@ -84,6 +142,9 @@ class FragmentsOfRegexps(Fragments):
         Fragments.__init__(self, *args, **kargs)
         self.regexp_by_position = {}
 
+        # assemble_regexp works with the sparse representation only
+        self._switch_to_sparse()
+
     def append(self, string, is_literal=True):
         assert isinstance(string, bytes)
         self.insert(self.current_offset, string, is_literal)
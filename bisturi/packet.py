@@ -1,12 +1,11 @@
 from bisturi.fragments import Fragments, FragmentsOfRegexps
 from bisturi.pattern_matching import Any
 
-import pickle
-
-import copy, collections
+import copy, collections, functools
 import traceback, sys, re
 
 import bisturi.packet_builder
+import bisturi.codegen
 
 
 # Note: this was taken from 'six'. It is currently used
@@ -28,6 +27,32 @@ def _with_metaclass(meta, *bases):
         return type.__new__(metaclass, b'temporary_class', (), {})
 
 
+class IncompleteDataError(Exception):
+    ''' The raw buffer ended before a field could be unpacked.
+
+        'missing' is how many more bytes are required at least to unpack
+        the field or None if it is unknown (like when a marker was not
+        found). In that case, 'marker' is the marker searched if it is
+        known (for a tuple of markers, the bytes that all of them end
+        with, if any). See bisturi.stream.
+        '''
+    def __init__(self, msg, missing=None, marker=None):
+        Exception.__init__(self, msg)
+        self.missing = missing
+        self.marker = marker
+
+
+def _incomplete_data(unpacked, expected):
+    ''' Return the exception to raise when less bytes than the expected
+        were unpacked. '''
+    unpacked = max(unpacked, 0)
+    msg = "Unpacked %i bytes but expected %i" % (unpacked, expected)
+    if unpacked < expected:
+        return IncompleteDataError(msg, expected - unpacked)
+
+    return Exception(msg)
+
+
 class PacketError(Exception):
     def __init__(
         self, was_error_found_in_unpacking_phase, field_name,
@@ -37,6 +62,7 @@ class PacketError(Exception):
         self.original_traceback = "".join(
             traceback.format_exception(*sys.exc_info())[2:]
         )
+        self.original_exception = sys.exc_info()[1]
 
         self.was_error_found_in_unpacking_phase = was_error_found_in_unpacking_phase
         self.fields_stack = [(offset, field_name, packet_class_name)]
@@ -75,12 +101,84 @@ class PacketError(Exception):
         return msg
 
 
+def _as_raw_buffer(raw):
+    if type(raw) is bytes:
+        return raw
+
+    as_buffer = getattr(raw, 'as_buffer', None)
+    if as_buffer is not None:
+        # objects like FileBuffer know how to be seen as a buffer
+        raw = as_buffer()
+
+    if isinstance(raw, bytes):
+        return raw
+
+    # any object that supports the buffer protocol (bytearray, mmap,
+    # memoryview, array...) is viewed as a flat sequence of bytes
+    # without copying it
+    try:
+        return memoryview(raw).cast('B')
+    except TypeError:
+        raise ValueError(
+            "The raw parameter must be 'bytes' or an object that supports the buffer protocol, not '%s'."
+            % type(raw)
+        ) from None
+
+
+def _findable(raw):
+    ''' Return an object with the same bytes than raw that has a find()
+        method, like bytes or bytearray, or None if there is not such.
+
+        A memoryview has no find() but the object under it may have it
+        (a bytearray or a mmap seen by _as_raw_buffer) if the view covers
+        the whole object.
+        '''
+    if not isinstance(raw, memoryview):
+        return raw
+
+    obj = raw.obj
+    if hasattr(obj, 'find') and raw.nbytes == len(obj):
+        return obj
+
+    return None
+
+
+def _as_writable_buffer(buffer):
+    if type(buffer) is bytearray:
+        return buffer
+
+    try:
+        buffer = memoryview(buffer).cast('B')
+    except TypeError:
+        buffer = None
+
+    if buffer is None or buffer.readonly:
+        raise ValueError(
+            "The buffer must be a writable object that supports the buffer protocol like 'bytearray' or 'mmap'."
+        )
+
+    return buffer
+
+
 class Packet(_with_metaclass(bisturi.packet_builder.MetaPacket, object)):
     __bisturi__ = {}
 
+    # Set only while a packet unpacked with lazy=True has fields pending
+    # to be unpacked: [raw, index of the next field, offset, k, values of
+    # the fields already unpacked]
+    #
+    # Set only if the packet was unpacked with keep_raw=True:
+    # (raw, begin, end, values of the fields after the unpack)
+    __slots__ = ['_lazy_state', '_raw_span']
+
     def __init__(self, _initialize_fields=True, **defaults):
         assert _initialize_fields in (True, False)
-        if _initialize_fields:
+        if _initialize_fields and not defaults:
+            # all the fields take their default values: copy them
+            # from a packet already initialized
+            _default_template_of(self.__class__).clone_into_impl(self)
+
+        elif _initialize_fields:
             for field_name, field, _, _ in self.__class__.get_fields():
                 field.init(self, defaults)
                 try:
@@ -96,15 +194,68 @@ class Packet(_with_metaclass(bisturi.packet_builder.MetaPacket, object)):
         return Prototype(self)
 
     @classmethod
-    def unpack(cls, raw, offset=0, silent=False):
-        if not isinstance(raw, bytes):
+    def _new_empty(cls):
+        ''' Return a new packet without initializing its fields. This is
+            overridden by each packet class with a faster version. '''
+        return object.__new__(cls)
+
+    def clone(self):
+        ''' Return a copy of the packet.
+
+            The values of the fields are copied recursively (subpackets
+            and lists are copied too) except the immutable ones (like
+            integers and bytes) that are shared.
+            '''
+        if _lazy_state_of(self) is not None:
+            self._resume_lazy_unpack(None)
+        return self.clone_into_impl(object.__new__(self.__class__))
+
+    def clone_into_impl(self, new):
+        for name in _slot_names(self.__class__):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+
+            setattr(
+                new, name, value
+                if type(value) in _immutable_types else _clone_value(value)
+            )
+
+        return new
+
+    @classmethod
+    def unpack(
+        cls,
+        raw,
+        offset=0,
+        silent=False,
+        lazy=False,
+        fields=None,
+        keep_raw=False
+    ):
+        raw = _as_raw_buffer(raw)
+        if keep_raw and (lazy or fields is not None):
             raise ValueError(
-                "The raw parameter must be 'bytes', not '%s'." % type(raw)
+                "The keep_raw mode cannot be combined with lazy or fields."
             )
 
-        pkt = cls(_initialize_fields=False)
+        pkt = cls._new_empty()
         try:
-            pkt.unpack_impl(raw, offset, root=pkt)
+            if fields is not None:
+                unpack_fields = _projected_unpack_impl(cls, tuple(fields))
+                unpack_fields(pkt, raw, offset, root=pkt)
+            elif lazy:
+                pkt.unpack_lazy_impl(raw, offset, root=pkt)
+            elif keep_raw:
+                # remember from where each packet was unpacked so
+                # pack can reuse those bytes if the packet is not modified
+                end = pkt.unpack_impl(
+                    raw, offset, root=pkt, **{'keep-raw': True}
+                )
+                _keep_raw_span(pkt, raw, offset, end)
+            else:
+                pkt.unpack_impl(raw, offset, root=pkt)
             return pkt
         except PacketError as e:
             e.packet = pkt
@@ -118,9 +269,102 @@ class Packet(_with_metaclass(bisturi.packet_builder.MetaPacket, object)):
             else:
                 raise
 
+    @classmethod
+    def project(cls, *field_names):
+        ''' Return a function like unpack(raw, offset=0, silent=False) that
+            unpacks only the given fields (and the ones that they depend on)
+            skipping the rest by their size.
+            See unpack(..., fields=[...]).
+            '''
+        # generate the code now: any invalid field name is reported here
+        _projected_unpack_impl(cls, field_names)
+
+        def unpack(raw, offset=0, silent=False):
+            return cls.unpack(raw, offset, silent, fields=field_names)
+
+        return unpack
+
+    @classmethod
+    def fixed_size(cls):
+        ''' Return the size of the packet if all of its fields have
+            a fixed size, None otherwise.
+            '''
+        return cls._bisturi_fixed_size
+
+    @classmethod
+    def min_size(cls):
+        ''' Return the minimum count of bytes required to unpack
+            a packet of this class.
+            '''
+        return cls._bisturi_min_size
+
+    @classmethod
+    def static_layout(cls):
+        ''' Return a list of (name, offset, byte_count) tuples, from the
+            first field up to the first field which offset is not known
+            before unpacking. The byte_count is None if the field has not
+            a fixed size.
+            '''
+        return cls._bisturi_static_layout
+
+    @classmethod
+    def iter_unpack(cls, raw, offset=0, count=None):
+        ''' Unpack one packet after the other from the same raw buffer,
+            starting at the given offset, and yield each packet with
+            the offset where it ends (where the next one begins).
+
+            Stop after 'count' packets or, if count is None, when the
+            end of the raw buffer is reached.
+            '''
+        return _iter_unpack(cls, raw, offset, count)
+
+    @classmethod
+    def unpack_many(cls, raw, offset=0, count=None):
+        ''' Like iter_unpack but return the list of packets unpacked and
+            the offset where the last packet ends.
+            '''
+        return _unpack_many(cls, raw, offset, count)
+
+    @classmethod
+    async def read_from(cls, reader):
+        ''' Read a packet from an asyncio.StreamReader, reading only the
+            bytes of the packet. See bisturi.stream.
+            '''
+        from bisturi.stream import read_packet
+        return await read_packet(cls, reader)
+
+    async def write_to(self, writer):
+        ''' Pack the packet and write it into an asyncio.StreamWriter. '''
+        writer.write(self.pack())
+        await writer.drain()
+
+    @classmethod
+    def as_numpy_dtype(cls):
+        ''' Return a NumPy structured dtype that describes this packet
+            class. All the fields must be of a fixed size.
+            See bisturi.columnar (requires NumPy).
+            '''
+        from bisturi.columnar import as_numpy_dtype
+        return as_numpy_dtype(cls)
+
+    @classmethod
+    def unpack_columns(cls, raw, count=None, offset=0):
+        ''' Decode 'count' consecutive packets from the raw buffer into
+            a dictionary of NumPy arrays, one per field, in a single
+            vectorized pass. All the fields must be of a fixed size.
+            See bisturi.columnar (requires NumPy).
+            '''
+        from bisturi.columnar import unpack_columns
+        return unpack_columns(cls, raw, count, offset)
+
     def unpack_impl(self, raw, offset, **k):
         k['innermost-pkt-pos'] = offset
         try:
+            min_size = self._bisturi_min_size
+            if len(raw) - offset < min_size:
+                name = self.get_fields()[0][0]
+                raise _incomplete_data(len(raw) - offset, min_size)
+
             for name, f, _, unpack in self.get_fields():
                 offset = unpack(pkt=self, raw=raw, offset=offset, **k)
         except PacketError as e:
@@ -136,10 +380,133 @@ class Packet(_with_metaclass(bisturi.packet_builder.MetaPacket, object)):
         [sync(self) for sync in self.get_sync_after_unpack_methods()]
         return offset
 
+    def unpack_lazy_impl(self, raw, offset, **k):
+        ''' Unpack the fixed fields at the begin of the packet and defer
+            the unpack of the rest until one of them is accessed.
+            '''
+        fields = self.get_fields()
+
+        prefix_len = 0
+        for _, f, _, _ in fields:
+            if not f.is_fixed:
+                break
+            prefix_len += 1
+
+        if prefix_len == len(fields) or self.get_sync_after_unpack_methods(
+        ) or self.get_sync_before_pack_methods():
+            # nothing to defer or there are descriptors that need all
+            # the fields to be synchronized
+            return self.unpack_impl(raw, offset, **k)
+
+        k['innermost-pkt-pos'] = offset
+        self._lazy_state = [raw, 0, offset, k, {}]
+        self._resume_lazy_unpack(prefix_len - 1)
+
+    def _resume_lazy_unpack(self, until):
+        ''' Unpack the pending fields up to the field at the index 'until'
+            (inclusive) or all of them if it is None.
+
+            The fields assigned by the user before being unpacked keep the
+            user's value. Return True if none was assigned.
+
+            The pending fields are unpacked with the values that the fields
+            before them had when they were unpacked, not with the values
+            that the user may have assigned since then (like a length).
+            '''
+        state = self._lazy_state
+        raw, index, offset, k, unpacked = state
+
+        fields = self.get_fields()
+        if until is None:
+            until = len(fields) - 1
+
+        current = {}
+        for name, value in unpacked.items():
+            try:
+                current[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+            setattr(self, name, value)
+
+        assigned = {}
+        try:
+            while index <= until:
+                name, _, _, unpack = fields[index]
+                try:
+                    assigned[name] = object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+
+                offset = unpack(pkt=self, raw=raw, offset=offset, **k)
+                try:
+                    unpacked[name] = object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+
+                index += 1
+                state[1], state[2] = index, offset
+
+        except PacketError as e:
+            e.add_parent_field_and_packet(
+                offset, name, self.__class__.__name__
+            )
+            raise
+        except Exception as e:
+            raise PacketError(
+                True, name, self.__class__.__name__, offset, str(e)
+            ) from None
+        finally:
+            for name, value in current.items():
+                setattr(self, name, value)
+            for name, value in assigned.items():
+                setattr(self, name, value)
+
+        if index == len(fields):
+            del self._lazy_state
+
+        return not assigned
+
+    def __getattr__(self, name):
+        # Called only if the attribute was not found: it may be
+        # a field not unpacked yet
+        try:
+            index = _lazy_state_slot.__get__(self)[1]
+        except AttributeError:
+            index = None
+
+        if index is not None:
+            fields = self.get_fields()
+            for until in range(index, len(fields)):
+                if fields[until][0] == name:
+                    try:
+                        self._resume_lazy_unpack(until)
+                    except PacketError as e:
+                        e.packet = self
+                        raise e from None
+
+                    return object.__getattribute__(self, name)
+
+        raise AttributeError(
+            "'%s' object has no attribute '%s'" %
+            (self.__class__.__name__, name)
+        )
+
     def pack(self):
         fragments = Fragments()
         try:
-            fragments = self.pack_impl(fragments, root=self)
+            if _lazy_state_of(self) is not None:
+                fragments = self._pack_lazy_impl(fragments, root=self)
+            elif _raw_span_of(self) is not None:
+                # unpacked with keep_raw=True
+                raw = _unmodified_raw(self)
+                if raw is not None:
+                    return bytes(raw)
+
+                fragments = self.pack_impl(
+                    fragments, root=self, **{'keep-raw': True}
+                )
+            else:
+                fragments = self.pack_impl(fragments, root=self)
             return fragments.tobytes()
         except PacketError as e:
             e.packet = self
@@ -165,6 +532,196 @@ class Packet(_with_metaclass(bisturi.packet_builder.MetaPacket, object)):
 
         return fragments
 
+    def pack_into(self, buffer, offset=0):
+        ''' Pack the packet writing it straight into the buffer (a bytearray,
+            a mmap or any writable object that supports the buffer protocol)
+            at the given offset and return the offset where the packet ends.
+
+            The buffer must be large enough: it is never resized.
+            '''
+        buffer = _as_writable_buffer(buffer)
+        try:
+            if _lazy_state_of(self) is not None:
+                self._resume_lazy_unpack(None)
+
+            if _raw_span_of(self) is not None:
+                # unpacked with keep_raw=True
+                raw = _unmodified_raw(self)
+                if raw is None:
+                    return self.pack_into_impl(
+                        buffer, offset, root=self, **{'keep-raw': True}
+                    )
+
+                next_offset = offset + len(raw)
+                if next_offset > len(buffer):
+                    raise Exception(
+                        "The buffer has %i bytes but it is required at least %i"
+                        % (len(buffer), next_offset)
+                    )
+
+                buffer[offset:next_offset] = raw
+                return next_offset
+
+            return self.pack_into_impl(buffer, offset, root=self)
+        except PacketError as e:
+            e.packet = self
+            raise e from None
+
+    def repack(self, previous=None):
+        ''' Pack a packet unpacked with keep_raw=True re-encoding only
+            the fields that were modified.
+
+            The new bytes of those fields are written over a copy of
+            the previous bytes of the packet (by default, the bytes
+            from where it was unpacked). If any of them changed its size,
+            the whole packet is packed as pack() does.
+
+            Once packed, the returned bytes are the previous bytes
+            for the next repack.
+            '''
+        span = _raw_span_of(self)
+        if span is None or span[0] is None:
+            return self.pack()
+
+        raw, begin, end, snapshot = span
+        if previous is None:
+            previous = raw[begin:end]
+        elif len(previous) != end - begin:
+            raise ValueError(
+                "The previous bytes are %i bytes but the packet has %i bytes."
+                % (len(previous), end - begin)
+            )
+
+        try:
+            result = self._repack_impl(previous, snapshot)
+        except PacketError as e:
+            e.packet = self
+            raise e from None
+
+        if result is None:
+            # a field changed its size
+            result = self.pack()
+
+        _mark_modified_subpackets_as_stale(self)
+        _keep_raw_span(self, result, 0, len(result))
+        return result
+
+    def _repack_impl(self, previous, snapshot):
+        ''' Write the modified fields over a copy of the previous bytes
+            and return them or return None if a field changed its size
+            or its previous size is unknown. '''
+        from bisturi.field import Bits
+        [sync(self) for sync in self.get_sync_before_pack_methods()]
+
+        old_by_name = dict(zip(_tracked_names(self.__class__), snapshot))
+        k = {'root': self, 'keep-raw': True, 'innermost-pkt-pos': 0}
+
+        fields = self.get_fields()
+        out = None
+        offset = 0
+        i = 0
+        while i < len(fields):
+            name, field, _, _ = fields[i]
+
+            # the bits of a group are packed together
+            group_len = 1
+            if isinstance(field, Bits):
+                while not fields[i + group_len - 1][1].iam_last:
+                    group_len += 1
+            group = fields[i:i + group_len]
+            i += group_len
+
+            old_byte_count = _old_byte_count(
+                field, old_by_name.get(field.field_name, (None, None))
+            )
+            if old_byte_count is None:
+                return None
+
+            if any(
+                _is_value_modified(
+                    getattr(self, f.field_name), old_by_name[f.field_name]
+                ) for _, f, _, _ in group
+            ):
+                fragments = Fragments()
+                try:
+                    for name, f, pack, _ in group:
+                        pack(pkt=self, fragments=fragments, **k)
+                except PacketError as e:
+                    e.add_parent_field_and_packet(
+                        offset, name, self.__class__.__name__
+                    )
+                    raise
+                except Exception as e:
+                    raise PacketError(
+                        False, name, self.__class__.__name__, offset, str(e)
+                    ) from None
+
+                chunk = fragments.tobytes()
+                if len(chunk) != old_byte_count:
+                    return None
+
+                if out is None:
+                    out = bytearray(previous)
+                out[offset:offset + old_byte_count] = chunk
+
+            offset += old_byte_count
+
+        if offset != len(previous):
+            return None
+
+        return bytes(previous if out is None else out)
+
+    def _pack_lazy_impl(self, fragments, **k):
+        ''' Pack a packet unpacked with lazy=True.
+
+            The fields that were never accessed nor assigned are not packed
+            again: the original bytes from where they were unpacked are
+            reused instead. They are still unpacked to know where the
+            packet ends.
+            '''
+        state = self._lazy_state
+        raw, index, begin, _, _ = state
+
+        if not self._resume_lazy_unpack(None):
+            return self.pack_impl(fragments, **k)
+
+        end = state[2]
+
+        k['innermost-pkt-pos'] = fragments.current_offset
+        try:
+            for name, f, pack, _ in self.get_fields()[:index]:
+                pack(pkt=self, fragments=fragments, **k)
+        except PacketError as e:
+            e.add_parent_field_and_packet(
+                fragments.current_offset, name, self.__class__.__name__
+            )
+            raise
+        except Exception as e:
+            raise PacketError(
+                False, name, self.__class__.__name__, fragments.current_offset,
+                str(e)
+            ) from None
+
+        span = raw[begin:end]
+        fragments.append(span if isinstance(span, bytes) else bytes(span))
+        return fragments
+
+    def pack_into_impl(self, buffer, offset, **k):
+        # Generic version: pack the packet into fragments and copy them.
+        # The generated version for the packets with a fixed layout
+        # writes each field directly.
+        raw = self.pack_impl(Fragments(), **k).tobytes()
+
+        next_offset = offset + len(raw)
+        if next_offset > len(buffer):
+            raise Exception(
+                "The buffer has %i bytes but it is required at least %i" %
+                (len(buffer), next_offset)
+            )
+
+        buffer[offset:next_offset] = raw
+        return next_offset
+
     def assert_consistency(self, dont_raise=False):
         try:
             self.__class__.unpack(self.pack())
@@ -208,26 +765,326 @@ class Packet(_with_metaclass(bisturi.packet_builder.MetaPacket, object)):
     def __repr__(self):
         msg = [f'{self.__class__.__name__}:']
         for name, f, _, _ in self.get_fields():
-            msg.append(f'  {name}: {getattr(self, name)}')
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                # like the fields skipped by unpack(..., fields=[...])
+                value = '<not unpacked>'
+
+            msg.append(f'  {name}: {value}')
 
         return '\n'.join(msg)
 
 
-class Prototype:
-    def __init__(self, pkt):
+_lazy_state_slot = Packet.__dict__['_lazy_state']
+_raw_span_slot = Packet.__dict__['_raw_span']
+
+
+def _raw_span_of(pkt):
+    try:
+        return _raw_span_slot.__get__(pkt)
+    except AttributeError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _tracked_names(pkt_class):
+    ''' Return the names of the attributes that hold the values of
+        the fields of the packet class (see _keep_raw_span). '''
+    from bisturi.structural_fields import Move
+
+    names = []
+    for _, field, _, _ in pkt_class.get_fields():
+        if isinstance(field, Move):
+            continue
+
+        names.append(field.field_name)
+        if field.descriptor_name is not None:
+            names.append(field.descriptor_name)
+
+    return tuple(names)
+
+
+@functools.lru_cache(maxsize=None)
+def _can_reuse_raw(pkt_class):
+    ''' Return True if the bytes of a packet of this class can be reused
+        anywhere, False if they depend on where the packet begins
+        (the packet has a field moved or aligned to an absolute offset). '''
+    from bisturi.structural_fields import Move, Sequence
+
+    for _, field, _, _ in pkt_class.get_fields():
+        if isinstance(field, Move):
+            if not field.is_alignment or field.reference == 'begins':
+                return False
+
+        if isinstance(field, Sequence) and field.aligned_to != 1:
+            return False
+
+    return True
+
+
+def _tracked_values(pkt):
+    return tuple(
+        getattr(pkt, name, None) for name in _tracked_names(pkt.__class__)
+    )
+
+
+def _keep_raw_span(pkt, raw, begin, end):
+    ''' Remember that the packet was unpacked from raw[begin:end] and
+        the values of its fields (and the items of its lists) at that
+        moment: a tuple (value, items) per tracked name where items
+        is None if the value is not a list. '''
+    snapshot = tuple(
+        (v, tuple(v) if type(v) is list else None)
+        for v in _tracked_values(pkt)
+    )
+    pkt._raw_span = (raw, begin, end, snapshot)
+
+
+# The span of a packet that was modified and packed again: the bytes
+# from where it was unpacked are not its bytes anymore
+_stale_raw_span = (None, 0, 0, None)
+
+
+def _is_unmodified(pkt):
+    ''' Return True if the packet was unpacked with keep_raw=True and
+        neither it nor its subpackets were modified since then.
+
+        A packet is modified if any of its fields was set to another
+        object or any of its lists (like a Sequence) changed its items.
+        '''
+    span = _raw_span_of(pkt)
+    if span is None or span[0] is None or not _can_reuse_raw(pkt.__class__):
+        return False
+
+    return not any(map(_is_value_modified, _tracked_values(pkt), span[3]))
+
+
+def _is_value_modified(value, old):
+    old_value, old_items = old
+    if value is not old_value:
+        return True
+
+    if old_items is not None:
+        return len(value) != len(old_items) or any(
+            a is not b for a, b in zip(value, old_items)
+        ) or any(_is_modified_subpacket(item) for item in value)
+
+    return _is_modified_subpacket(value)
+
+
+def _is_modified_subpacket(value):
+    if not isinstance(value, Packet) or _raw_span_of(value) is None:
+        # a subpacket that was not unpacked (like one embedded)
+        # does not have bytes on its own
+        return False
+
+    return not _is_unmodified(value)
+
+
+def _mark_modified_subpackets_as_stale(pkt):
+    ''' Mark the modified subpackets of the packet (at any depth)
+        as stale: their bytes were packed again somewhere else. '''
+    for value in _tracked_values(pkt):
+        items = value if type(value) is list else (value, )
+        for item in items:
+            if _is_modified_subpacket(item):
+                _mark_modified_subpackets_as_stale(item)
+                item._raw_span = _stale_raw_span
+
+
+def _old_byte_count(field, old):
+    ''' Return the count of bytes that the field took when it was
+        unpacked given its old value (see _keep_raw_span) or None
+        if it is unknown. '''
+    from bisturi.field import Data, Ref
+    from bisturi.structural_fields import Sequence
+
+    byte_count = field.static_byte_count()
+    if byte_count is not None:
+        return byte_count
+
+    old_value, old_items = old
+    if isinstance(field, Ref):
+        span = None
+        if isinstance(old_value, Packet):
+            span = _raw_span_of(old_value)
+        if span is None or span[0] is None:
+            return None
+        return span[2] - span[1]
+
+    if isinstance(field, Data) and isinstance(old_value, (bytes, memoryview)):
+        if field.until_marker is None:
+            return len(old_value)
+
+        if isinstance(field.until_marker, bytes):
+            return len(old_value) + len(field.delimiter_to_be_included)
+
+        return None
+
+    if isinstance(field, Sequence) and old_items is not None \
+            and field.aligned_to == 1:
+        elem_byte_count = field.prototype_field.static_byte_count()
+        if elem_byte_count is not None:
+            return len(old_items) * elem_byte_count
+
+        total = 0
+        for item in old_items:
+            span = _raw_span_of(item) if isinstance(item, Packet) else None
+            if span is None or span[0] is None:
+                return None
+            total += span[2] - span[1]
+
+        return total
+
+    return None
+
+
+def _unmodified_raw(pkt):
+    ''' Return the bytes from where the packet was unpacked if it was
+        not modified since then (see _is_unmodified), None otherwise. '''
+    if not _is_unmodified(pkt):
+        return None
+
+    raw, begin, end, _ = _raw_span_of(pkt)
+    return raw[begin:end]
+
+
+@functools.lru_cache(maxsize=None)
+def _projected_unpack_impl(pkt_class, field_names):
+    generator = bisturi.codegen.CodeGenerator(
+        [
+            (i, name, f)
+            for i, (name, f, _, _) in enumerate(pkt_class.get_fields())
+        ],
+        pkt_class,
+        generate_for_pack=False,
+        generate_for_unpack=True,
+        sourcecode_by_field_name={},
+        vectorize=True,
+        annotate=False,
+        in_memory=True,
+        cache_dir=pkt_class.__bisturi__.get('generated_code_cache_dir'),
+    )
+    return generator.generate_projected_unpack(field_names)
+
+
+def _lazy_state_of(pkt):
+    try:
+        return _lazy_state_slot.__get__(pkt)
+    except AttributeError:
+        return None
+
+
+# These are called by bisturi instead of Packet.iter_unpack and
+# Packet.unpack_many: a packet class may have fields with those names
+def _iter_unpack(pkt_class, raw, offset, count):
+    raw = _as_raw_buffer(raw)
+    end = len(raw)
+
+    i = 0
+    while (i < count) if count is not None else (offset < end):
+        pkt = pkt_class._new_empty()
         try:
-            self.template = pickle.dumps(pkt, -1)
-            pickle.loads(self.template)  # sanity check
-            self.clone = self._clone_from_pickle
-        except Exception as e:
-            self.template = copy.deepcopy(pkt)
-            self.clone = self._clone_from_live_obj
+            next_offset = pkt.unpack_impl(raw, offset, root=pkt)
+        except PacketError as e:
+            e.packet = pkt
+            raise e from None
 
-    def clone(self):
-        raise Exception()
+        if next_offset == offset and count is None:
+            raise Exception(
+                "The packet %s at %08x was unpacked from zero bytes: unpacking more packets would loop forever."
+                % (pkt_class.__name__, offset)
+            )
+
+        yield pkt, next_offset
+        offset = next_offset
+        i += 1
+
+
+def _unpack_many(pkt_class, raw, offset, count):
+    pkts = []
+    append = pkts.append
+    for pkt, offset in _iter_unpack(pkt_class, raw, offset, count):
+        append(pkt)
+
+    return pkts, offset
+
+
+# The values of these types are shared between a packet and its clones
+_immutable_types = frozenset(
+    (int, bool, float, complex, bytes, str, type(None))
+)
+
+
+def _clone_value(value):
+    ''' Return a copy of the value of a field. '''
+    if type(value) in _immutable_types:
+        return value
+
+    if isinstance(value, Packet):
+        # not value.clone(): a packet class may have a field named 'clone'
+        return Packet.clone(value)
+
+    if type(value) is list:
+        # like the values of a Sequence (a list of packets)
+        return [_clone_value(v) for v in value]
+
+    if type(value) is memoryview:
+        # a Data of a packet with zero_copy: the copy points to
+        # the same raw buffer
+        return value
+
+    return copy.deepcopy(value)
 
-    def _clone_from_pickle(self):
-        return pickle.loads(self.template)
 
-    def _clone_from_live_obj(self):
-        return copy.deepcopy(self.template)
+@functools.lru_cache(maxsize=None)
+def _slot_names(pkt_class):
+    ''' Return the names of the slots of the packet class and of its
+        parents, the slots that hold the state of a packet.
+
+        The state of a lazy unpack and the bytes kept by keep_raw=True
+        are not part of it: a copy of a packet is a new packet. '''
+    names = []
+    for cls in reversed(pkt_class.__mro__):
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = [slots]
+
+        for name in slots:
+            if name not in ('_lazy_state', '_raw_span', '__weakref__',
+                            '__dict__') \
+                    and name not in names:
+                names.append(name)
+
+    return tuple(names)
+
+
+# A packet initialized with the default values per packet class
+# to be cloned by Packet.__init__
+_default_templates = {}
+
+
+def _default_template_of(pkt_class):
+    try:
+        return _default_templates[pkt_class]
+    except KeyError:
+        pass
+
+    template = pkt_class._new_empty()
+    for _, field, _, _ in pkt_class.get_fields():
+        field.init(template, {})
+
+    _default_templates[pkt_class] = template
+    return template
+
+
+class Prototype:
+    ''' A packet used as a template to create new packets, cloning it.
+        See Packet.clone.
+        '''
+    def __init__(self, pkt):
+        self.template = Packet.clone(pkt)
+
+    def clone(self):
+        return Packet.clone(self.template)
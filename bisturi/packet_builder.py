@@ -1,5 +1,5 @@
 import bisturi.codegen
-import copy, pprint
+import copy, pprint, os, functools
 
 __trace_enabled = False
 __trace_indent = 0
@@ -308,6 +308,61 @@ class PacketClassBuilder:
         self.cls.get_sync_before_pack_methods = get_sync_before_pack_methods
         self.cls.get_sync_after_unpack_methods = get_sync_after_unpack_methods
 
+    @_trace(pattrs=['fixed_size', 'min_size', 'static_layout'])
+    def compute_static_layout(self):
+        ''' Compute, from the fields, the size of the packet if it is
+            fixed (None otherwise), its minimum size and the offsets of the
+            fields that are known before unpacking.
+
+            The static layout is a list of (name, offset, byte_count)
+            tuples, from the first field up to the first field which offset
+            is not known. The byte_count is None if the field has not a
+            fixed size.
+        '''
+        from bisturi.structural_fields import Move
+
+        offset = 0
+        min_size = 0
+        min_size_known = True
+        static_layout = []
+        for name, field in self.fields:
+            if isinstance(field, Move):
+                # a move (at()) can go back and overlap other fields
+                # but an alignment only moves forward
+                if not field.is_alignment:
+                    min_size_known = False
+                offset = None
+                continue
+
+            byte_count = field.static_byte_count()
+            if offset is not None:
+                static_layout.append((name, offset, byte_count))
+                offset = None if byte_count is None else offset + byte_count
+
+            if min_size_known:
+                min_size += field.min_byte_count()
+
+        self.fixed_size = offset
+        self.min_size = min_size
+        self.static_layout = static_layout
+
+    @_trace()
+    def add_static_layout_to_class(self):
+        # Packet.fixed_size(), min_size() and static_layout() return these
+        # but a field may have one of those names so the layout is kept
+        # (and read by bisturi) under private names
+        self.cls._bisturi_fixed_size = self.fixed_size
+        self.cls._bisturi_min_size = self.min_size
+        self.cls._bisturi_static_layout = self.static_layout
+
+    @_trace()
+    def add_new_empty_class_method(self):
+        # create a packet without calling __init__: its fields
+        # are going to be set by unpack
+        self.cls._new_empty = staticmethod(
+            functools.partial(object.__new__, self.cls)
+        )
+
     @_trace(pattrs=['am_in_debug_mode'])
     def check_if_we_are_in_debug_mode(self):
         ''' A class creation is in debug mode if one of its fields is
@@ -340,6 +395,18 @@ class PacketClassBuilder:
         vectorize = self.cls.__bisturi__.get('vectorize', True)
         annotate = self.cls.__bisturi__.get('annotate', True)
 
+        # The generated code is written into a __pkts__ folder by default.
+        # Instead, it can be compiled in memory and, optionally, cached
+        # in a folder
+        in_memory = self.cls.__bisturi__.get(
+            'generate_in_memory',
+            os.environ.get('BISTURI_GENERATE_IN_MEMORY', '') not in ('', '0')
+        )
+        cache_dir = self.cls.__bisturi__.get(
+            'generated_code_cache_dir',
+            os.environ.get('BISTURI_GENERATED_CODE_CACHE_DIR') or None
+        )
+
         bisturi.codegen.CodeGenerator(
             [
                 (i, name_f[0], name_f[1])
@@ -350,7 +417,9 @@ class PacketClassBuilder:
             generate_for_unpack,
             sourcecode_by_field_name=self.sourcecode_by_field_name,
             vectorize=vectorize,
-            annotate=annotate
+            annotate=annotate,
+            in_memory=in_memory,
+            cache_dir=cache_dir
         ).generate_code()
 
     @_trace()
@@ -379,7 +448,7 @@ class PacketClassBuilder:
         import inspect, textwrap
         try:
             sourcelines, _ = inspect.getsourcelines(self.cls)
-        except TypeError:
+        except (TypeError, OSError):
             self.sourcecode_by_field_name = {}
             return
 
@@ -414,6 +483,10 @@ class PacketClassBuilder:
         self.add_get_fields_class_method()
         self.add_sync_descriptor_class_methods()
 
+        self.compute_static_layout()
+        self.add_static_layout_to_class()
+        self.add_new_empty_class_method()
+
     @_trace()
     def remove_fields_from_and_add_descriptors_to_class_definition(self):
         self.remove_fields_from_class_definition()
@@ -483,7 +556,7 @@ class PacketSpecializationClassBuilder(PacketClassBuilder):
 class MetaPacket(type):
     def __new__(metacls, name, bases, attrs):
         if name == 'Packet' and bases == (object, ):
-            attrs['__slots__'] = []
+            attrs.setdefault('__slots__', [])
             return type.__new__(
                 metacls, name, bases, attrs
             )  # Packet base class
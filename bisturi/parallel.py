@@ -0,0 +1,291 @@
+''' Unpack the packets of a file using several processes.
+
+    The file is split in records, one per packet, and each record is
+    described only by its offset and length. The records are sent to
+    a pool of worker processes in batches; each worker maps the same file
+    in memory (mmap) and unpacks the packets of its batches with
+    Packet.unpack_many (or Packet.unpack), using the code generated for
+    the packet class.
+
+    The packets (or their fields as columns) are returned in batches
+    to the main process which joins them in the order of the file.
+
+    The packet class must be importable by the workers: define it at
+    the module level, not inside a function.
+    '''
+import os
+import mmap
+import array
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from bisturi.packet import PacketError, _projected_unpack_impl, _unpack_many
+
+
+def split_by_fixed_size(pkt_class, raw):
+    ''' Split the raw buffer in records of the fixed size of the packet
+        class. See Packet.fixed_size.
+        '''
+    byte_count = pkt_class._bisturi_fixed_size
+    if not byte_count:
+        raise ValueError(
+            "The packet %s has not a fixed size: use another splitter." %
+            pkt_class.__name__
+        )
+
+    if len(raw) % byte_count:
+        raise Exception(
+            "The buffer of %i bytes cannot be split in packets %s of %i bytes."
+            % (len(raw), pkt_class.__name__, byte_count)
+        )
+
+    return ((offset, byte_count) for offset in range(0, len(raw), byte_count))
+
+
+def split_by_skipping(pkt_class, raw):
+    ''' Split the raw buffer in records walking over it, one packet after
+        the other, unpacking only the fields required to know where each
+        packet ends (like the length of a Data). See Packet.project.
+        '''
+    skip = _projected_unpack_impl(pkt_class, ())
+
+    offset = 0
+    end = len(raw)
+    while offset < end:
+        pkt = pkt_class._new_empty()
+        try:
+            next_offset = skip(pkt, raw, offset, root=pkt)
+        except PacketError as e:
+            e.packet = pkt
+            raise e from None
+
+        if next_offset == offset:
+            raise Exception(
+                "The packet %s at %08x was unpacked from zero bytes: splitting more packets would loop forever."
+                % (pkt_class.__name__, offset)
+            )
+
+        yield offset, next_offset - offset
+        offset = next_offset
+
+
+def default_splitter(pkt_class, raw):
+    ''' Split by the fixed size of the packet class if it has one,
+        otherwise split by skipping. '''
+    if pkt_class._bisturi_fixed_size:
+        return split_by_fixed_size(pkt_class, raw)
+    return split_by_skipping(pkt_class, raw)
+
+
+def _default_batches(pkt_class, raw, batch_size):
+    ''' Split the raw buffer like default_splitter but return batches of
+        consecutive records as (offset, count, end) spans.
+
+        With a fixed size, the spans are computed without walking
+        the buffer. '''
+    byte_count = pkt_class._bisturi_fixed_size
+    if byte_count:
+        # raise if the buffer cannot be split in records of this size
+        split_by_fixed_size(pkt_class, raw)
+
+        total = len(raw) // byte_count
+        for first in range(0, total, batch_size):
+            count = min(batch_size, total - first)
+            yield (first * byte_count, count, (first + count) * byte_count)
+        return
+
+    begin = end = count = 0
+    for offset, length in split_by_skipping(pkt_class, raw):
+        end = offset + length
+        count += 1
+        if count == batch_size:
+            yield (begin, count, end)
+            begin, count = end, 0
+
+    if count:
+        yield (begin, count, end)
+
+
+# The packet class and the mapped file of the current worker process,
+# set by _init_worker
+_worker_state = None
+
+
+def _init_worker(pkt_class, path):
+    global _worker_state
+    with open(path, 'rb') as file:
+        raw = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    _worker_state = (pkt_class, raw)
+
+
+def _unpack_batch(batch, columns):
+    pkt_class, raw = _worker_state
+    return _unpack_batch_of(pkt_class, raw, batch, columns)
+
+
+def _unpack_batch_of(pkt_class, raw, batch, columns):
+    ''' Unpack the records of the batch: a (offset, count, end) span of
+        consecutive records or a list of (offset, length) ranges. '''
+    if type(batch) is tuple:
+        pkts = _unpack_span(pkt_class, raw, *batch)
+    else:
+        pkts = _unpack_ranges(pkt_class, raw, batch)
+
+    if not columns:
+        return pkts
+
+    return _as_columns(pkt_class, pkts)
+
+
+def _unpack_span(pkt_class, raw, offset, count, end):
+    try:
+        pkts, _ = _unpack_many(pkt_class, raw, offset, count)
+    except PacketError as e:
+        # the PacketError cannot cross the process boundary
+        # (it cannot be pickled) so we send its description
+        raise Exception(
+            "Error in the records from %08x to %08x: %s" % (offset, end, e)
+        ) from None
+
+    return pkts
+
+
+def _unpack_ranges(pkt_class, raw, ranges):
+    view = memoryview(raw)
+    try:
+        pkts = []
+        for offset, length in ranges:
+            try:
+                pkts.append(pkt_class.unpack(view[offset:offset + length]))
+            except PacketError as e:
+                raise Exception(
+                    "Error in the record at %08x: %s" % (offset, e)
+                ) from None
+    finally:
+        view.release()
+
+    return pkts
+
+
+def _new_column(field):
+    ''' Return an empty column for the values of the field: an array
+        of integers for the Int and Bits fields of 1, 2, 4 or 8 bytes,
+        a list for the rest. '''
+    from bisturi.field import Int, Bits
+
+    if isinstance(field, Bits):
+        byte_count, is_signed = field.I.byte_count, False
+    elif isinstance(field, Int) and field.is_fixed:
+        byte_count, is_signed = field.byte_count, field.is_signed
+    else:
+        return []
+
+    for typecode in ('bhilq' if is_signed else 'BHILQ'):
+        if array.array(typecode).itemsize == byte_count:
+            return array.array(typecode)
+
+    return []
+
+
+def _as_columns(pkt_class, pkts):
+    columns = {}
+    for name, field, _, _ in pkt_class.get_fields():
+        column = _new_column(field)
+        column.extend([getattr(pkt, name) for pkt in pkts])
+        columns[name] = column
+
+    return columns
+
+
+def _batched(iterable, n):
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, n))
+        if not batch:
+            return
+        yield batch
+
+
+def unpack_file(
+    pkt_class,
+    path,
+    workers=None,
+    splitter=None,
+    batch_size=4096,
+    columns=False
+):
+    ''' Unpack all the packets of the given class from the file
+        and return them in a list, in the order of the file.
+
+        If columns is True, return a dictionary with a column of values
+        per field instead: an array.array for the integer fields of 1, 2,
+        4 or 8 bytes (Int and Bits) and a list for the rest. This is
+        cheaper to send between processes than the packets.
+
+        The splitter is a callable splitter(pkt_class, raw) that returns
+        the (offset, length) ranges of the packets in raw (the whole file).
+        By default the file is split by the fixed size of the packet class
+        if it has one (split_by_fixed_size) or unpacking only the fields
+        that tell where each packet ends (split_by_skipping) and each
+        worker unpacks its consecutive records with unpack_many.
+
+        The records are sent in batches of batch_size records to
+        the workers (os.cpu_count() processes by default).
+        With workers=1, everything is done in the current process and,
+        with the default splitter, the file is unpacked with unpack_many
+        without splitting it first.
+        '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("The count of workers must be 1 or more.")
+
+    if not os.path.getsize(path):
+        return {
+            name: _new_column(field)
+            for name, field, _, _ in pkt_class.get_fields()
+        } if columns else []
+
+    with open(path, 'rb') as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as raw:
+        if splitter is None and workers == 1:
+            # the plain loop: there is no one to share the work with
+            pkts, _ = _unpack_many(pkt_class, raw, 0, None)
+            return _as_columns(pkt_class, pkts) if columns else pkts
+
+        if splitter is None:
+            batches = _default_batches(pkt_class, raw, batch_size)
+        else:
+            batches = _batched(splitter(pkt_class, raw), batch_size)
+
+        if workers == 1:
+            results = [
+                _unpack_batch_of(pkt_class, raw, batch, columns)
+                for batch in batches
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(pkt_class, path)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _unpack_batch, batches, itertools.repeat(columns)
+                    )
+                )
+
+    if not columns:
+        return list(itertools.chain.from_iterable(results))
+
+    joined = {}
+    for name, field, _, _ in pkt_class.get_fields():
+        column = _new_column(field)
+        for batch in results:
+            column.extend(batch[name])
+        joined[name] = column
+
+    return joined
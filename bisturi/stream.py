@@ -0,0 +1,181 @@
+from bisturi.packet import PacketError, IncompleteDataError
+
+
+class StreamParser:
+    ''' Unpack packets of a given class from a stream of bytes that arrives
+        in chunks of any size (like from a socket or a pipe).
+
+        Feed the parser with each chunk and iterate over the packets
+        completed so far:
+
+            parser = StreamParser(TLP)
+            for chunk in chunks:
+                for pkt in parser.feed(chunk):
+                    ...
+
+        The bytes of an incomplete packet are kept in an internal buffer
+        until more bytes arrive. The bytes already unpacked are discarded
+        so the memory used is bounded by the size of the largest packet.
+
+        The packets must be self-delimited: their size must be known from
+        their own bytes and not from the end of the buffer.
+        '''
+    def __init__(self, pkt_class):
+        self.pkt_class = pkt_class
+
+        self.buffer = bytearray()
+        self.offset = 0  # where the next packet begins in the buffer
+
+        # don't try to unpack the next packet until the buffer
+        # has at least these bytes
+        self.min_size = max(pkt_class._bisturi_min_size, 1)
+        self.wait_until = self.min_size
+
+        # nor until this marker arrives (see _has_marker_arrived)
+        self.marker = None
+        self.search_from = 0
+
+    @property
+    def needed(self):
+        ''' How many more bytes are needed at least to unpack the next
+            packet. It is a lower bound: more may be required after them.
+            '''
+        return max(self.wait_until - len(self.buffer), 0)
+
+    def pending(self):
+        ''' Return the bytes received but not unpacked yet (the bytes
+            of an incomplete packet). '''
+        return bytes(self.buffer[self.offset:])
+
+    def feed(self, chunk):
+        ''' Add the chunk of bytes to the internal buffer and return an
+            iterator over the packets completed.
+
+            A PacketError is raised if the bytes are invalid (and not
+            just incomplete).
+            '''
+        try:
+            self.buffer += chunk
+        except BufferError:
+            # some packet is still viewing the buffer (zero_copy),
+            # it cannot be resized so we use a new one
+            self.buffer = self.buffer + chunk
+
+        return self._unpack_packets()
+
+    def _unpack_packets(self):
+        pkt_class = self.pkt_class
+        while len(self.buffer) >= self.wait_until \
+                and self._has_marker_arrived():
+            raw = memoryview(self.buffer)
+            offset = self.offset
+
+            pkt = pkt_class._new_empty()
+            try:
+                next_offset = pkt.unpack_impl(raw, offset, root=pkt)
+            except PacketError as e:
+                e.packet = pkt
+                if not isinstance(e.original_exception, IncompleteDataError):
+                    raise e from None
+
+                # wait for more bytes before trying again
+                missing = e.original_exception.missing
+                self.wait_until = len(self.buffer) + (missing or 1)
+                self._wait_for_marker(e.original_exception.marker)
+                break
+            finally:
+                raw.release()
+
+            if next_offset == offset:
+                raise Exception(
+                    "The packet %s was unpacked from zero bytes: unpacking more packets would loop forever."
+                    % pkt_class.__name__
+                )
+
+            self.offset = next_offset
+            self.wait_until = next_offset + self.min_size
+            yield pkt
+
+        self._compact()
+
+    def _wait_for_marker(self, marker):
+        ''' Don't try to unpack the packet again until the marker that
+            was not found arrives (if it is known). '''
+        self.marker = marker
+        if marker is not None:
+            # the marker was not in the buffer: it can only end in the
+            # bytes that are still to come
+            self.search_from = max(
+                len(self.buffer) - len(marker) + 1, self.offset
+            )
+
+    def _has_marker_arrived(self):
+        marker = self.marker
+        if marker is None:
+            return True
+
+        if self.buffer.find(marker, self.search_from) == -1:
+            # don't search these bytes again
+            self.search_from = max(
+                len(self.buffer) - len(marker) + 1, self.search_from
+            )
+            return False
+
+        self.marker = None
+        return True
+
+    def _compact(self):
+        ''' Discard the bytes already unpacked. '''
+        if not self.offset:
+            return
+
+        # slicing creates a new buffer: this works even if a packet is
+        # still viewing the old buffer (zero_copy)
+        self.buffer = self.buffer[self.offset:]
+        self.wait_until -= self.offset
+        self.search_from = max(self.search_from - self.offset, 0)
+        self.offset = 0
+
+
+async def read_packet(pkt_class, reader):
+    ''' Read a packet of the given class from an asyncio.StreamReader.
+
+        The reads are driven by the packet itself: first the minimum
+        size of the packet is read (see Packet.min_size) and then,
+        each time that the packet cannot be unpacked, exactly the missing
+        bytes (like the ones of a Data with a length) or up to the marker
+        searched. The packet is not unpacked again until the marker
+        searched is read.
+
+        No byte after the end of the packet is read so the next packet
+        can be read from the same reader. For that reason, when the end
+        of a field is a regexp the bytes are read one by one: prefer
+        a marker or a tuple of markers.
+        '''
+    raw = await reader.readexactly(pkt_class._bisturi_min_size)
+    while True:
+        pkt = pkt_class._new_empty()
+        try:
+            pkt.unpack_impl(raw, 0, root=pkt)
+            return pkt
+        except PacketError as e:
+            e.packet = pkt
+            error = e.original_exception
+            if not isinstance(error, IncompleteDataError):
+                raise e from None
+
+        marker = error.marker
+        if error.missing:
+            raw += await reader.readexactly(error.missing)
+        elif marker:
+            # read up to the last byte of the marker (the rest of the
+            # marker may be already in raw) until the whole marker is
+            # read; it can only end in the bytes not read yet
+            search_from = max(len(raw) - len(marker) + 1, 0)
+            while True:
+                raw += await reader.readuntil(marker[-1:])
+                if raw.find(marker, search_from) != -1:
+                    break
+                search_from = len(raw) - len(marker) + 1
+        else:
+            raw += await reader.readexactly(1)
@@ -124,6 +124,10 @@ class Sequence(Field):
 
         count, until, when = self.tmp
 
+        # keep the original count (an int, a field or an expression)
+        # so it can be inspected later (see bisturi.codegen)
+        self.count_arg = count
+
         self.when = None if when is None else normalize_raw_condition_into_a_callable(
             when
         )
@@ -141,6 +145,23 @@ class Sequence(Field):
 
         return slots + [self.seq_elem_field_name]
 
+    def static_byte_count(self):
+        count = self.count_arg
+        if not isinstance(count, int) or self.when is not None \
+                or self.until_condition is not None or self.aligned_to != 1:
+            return None
+
+        elem_byte_count = self.prototype_field.static_byte_count()
+        return None if elem_byte_count is None else count * elem_byte_count
+
+    def min_byte_count(self):
+        count = self.count_arg
+        if not isinstance(count, int) or self.when is not None \
+                or self.until_condition is not None:
+            return 0
+
+        return count * self.prototype_field.min_byte_count()
+
     def init(self, packet, defaults):
         Field.init(self, packet, defaults)
         self.prototype_field.init(packet, {})
@@ -1,3 +1,9 @@
+import io
+import os
+import mmap
+import warnings
+import collections
+
 FROM_BEGIN = 0
 FROM_END = 2
 
@@ -9,59 +15,194 @@ def to_bytes(bytes_or_text):
     )
 
 
-class SeekableFile(bytes):
-    def __new__(cls, file_open):
-        self = bytes.__new__(cls)
+class FileBuffer:
+    ''' A read-only view of the content of a file that can be unpacked
+        without reading the whole file first.
 
-        self._file = file_open
-        self._file_length = self._calculate_file_length()
+        The file (an open binary file or a path) is mapped in memory
+        (mmap) so its pages are loaded by the operating system on demand.
 
-        return self
+        If the file cannot be mapped (like a compressed file), a paged read
+        cache is used instead: indexing, slicing, find and search read
+        only the pages that they need but unpacking a packet reads
+        the whole file into memory (see as_buffer).
+        '''
+    def __init__(self, file, page_size=64 * 1024, max_cached_pages=64):
+        self._owns_file = isinstance(file, (str, bytes, os.PathLike))
+        if self._owns_file:
+            file = open(file, 'rb')
+
+        self._file = file
 
-    def __getslice__(self, i, j):
-        # deprecated, but still necessary to redefine the behavior of 'bytes'
-        return self._slice(slice(i, j))
+        # only the real files can be mapped: others like GzipFile have
+        # a fileno() but it is of the underlying (compressed) file
+        self._mmap = None
+        if isinstance(file, (io.FileIO, io.BufferedReader, io.BufferedRandom)):
+            try:
+                self._mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (OSError, ValueError, io.UnsupportedOperation):
+                # an empty file or a special one like a pipe
+                pass
+
+        if self._mmap is None:
+            self._length = file.seek(0, FROM_END)
+            self._page_size = page_size
+            self._max_cached_pages = max_cached_pages
+            self._pages = collections.OrderedDict()
+        else:
+            self._length = len(self._mmap)
+
+    def __len__(self):
+        return self._length
 
     def __getitem__(self, index):
+        if self._mmap is not None:
+            return self._mmap[index]
+
         if isinstance(index, int):
-            self._seek(index)
-            return self._file.read(1)
+            if index < 0:
+                index += self._length
+            if not 0 <= index < self._length:
+                raise IndexError("index out of range")
+
+            return self._read(index, index + 1)[0]
 
         elif isinstance(index, slice):
-            return self._slice(index)
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return self._read(start, stop)
+
+            positions = range(start, stop, step)
+            if not positions:
+                return b''
+
+            low = min(positions[0], positions[-1])
+            high = max(positions[0], positions[-1]) + 1
+            data = self._read(low, high)
+            return bytes(data[i - low] for i in positions)
 
         else:
             raise TypeError("Invalid index/slice")
 
-    def _slice(self, index):
-        start, stop, step = index.indices(self._file_length)
+    def find(self, sub, start=0, end=None):
+        ''' Return the lowest position where sub is found between start
+            and end (like bytes.find) or -1 if it is not found. '''
+        if self._mmap is not None:
+            if end is None:
+                return self._mmap.find(sub, start)
+            return self._mmap.find(sub, start, end)
+
+        start, end, _ = slice(start, end).indices(self._length)
+
+        # read a page at time, with an overlap of len(sub) - 1 bytes to
+        # find the matches that span two pages
+        overlap = max(len(sub) - 1, 0)
+        position = start
+        while True:
+            chunk = self._read(
+                position, min(position + self._page_size + overlap, end)
+            )
+            found = chunk.find(sub)
+            if found >= 0:
+                return position + found
+
+            position += self._page_size
+            if position + overlap >= end:
+                return -1
+
+    def search(self, pattern, pos=0, endpos=None):
+        ''' Search the compiled regular expression (of bytes) between
+            pos and endpos and return the span (start, end) of the first
+            match or None if there is no match.
+
+            With the paged read cache, the bytes between pos and endpos
+            are read at once.
+            '''
+        if endpos is None:
+            endpos = self._length
+
+        if self._mmap is not None:
+            match = pattern.search(self._mmap, pos, endpos)
+            return match.span() if match else None
+
+        match = pattern.search(self._read(pos, endpos))
+        return (match.start() + pos, match.end() + pos) if match else None
+
+    def as_buffer(self):
+        ''' Return an object that supports the buffer protocol with the
+            content of the file: the mapped file or, for the files that
+            cannot be mapped, their whole content. '''
+        if self._mmap is not None:
+            return self._mmap
+
+        return self._read(0, self._length)
+
+    def __buffer__(self, flags):
+        # buffer protocol for Python 3.12+ (PEP 688)
+        return memoryview(self.as_buffer())
+
+    def close(self):
+        ''' Close the map and the file if it was opened by us.
+
+            It will fail if some packet unpacked with zero_copy is still
+            viewing the file.
+            '''
+        if self._mmap is not None:
+            self._mmap.close()
+
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
 
-        if step == 1:
-            self._seek(start)
-            return self._file.read(stop - start)
+    def __exit__(self, *args):
+        self.close()
 
-        else:
-            return b"".join((self[i] for i in irange(start, stop, step)))
+    def _read(self, start, stop):
+        if stop <= start:
+            return b''
 
-    def __str__(self):
-        self._seek(0)
-        return self._file.read()
+        page_size = self._page_size
+        first, last = start // page_size, (stop - 1) // page_size
 
-    def _seek(self, offset):
-        whence = FROM_BEGIN if offset >= 0 else FROM_END
-        self._file.seek(offset, whence)
+        data = b''.join(self._page(i) for i in range(first, last + 1))
+        begin = first * page_size
+        return data[start - begin:stop - begin]
 
-    def _calculate_file_length(self):
-        self._file.seek(-1, FROM_END)
-        length = self._file.tell() + 1
+    def _page(self, number):
+        pages = self._pages
+        try:
+            pages.move_to_end(number)
+            return pages[number]
+        except KeyError:
+            pass
 
-        self._file.seek(0, FROM_BEGIN)
-        return length
+        self._file.seek(number * self._page_size, FROM_BEGIN)
+        page = self._file.read(self._page_size)
 
+        pages[number] = page
+        if len(pages) > self._max_cached_pages:
+            pages.popitem(last=False)
 
-def _string_as_seekable_file(s):
-    from StringIO import StringIO
-    return SeekableFile(file_open=StringIO(s))
+        return page
+
+
+class SeekableFile(FileBuffer):
+    ''' Deprecated: use FileBuffer.
+
+        SeekableFile was the former (and slower) way to unpack files.
+        This is a FileBuffer that still takes the file as 'file_open'.
+        '''
+    def __init__(self, file_open, *args, **kargs):
+        warnings.warn(
+            "SeekableFile is deprecated, use FileBuffer instead.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        FileBuffer.__init__(self, file_open, *args, **kargs)
 
 
 import array
@@ -0,0 +1,290 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HHBBH")
+BISTURI_PACKET_COOKIE = 'a80bb167b8ecc2549456e4a79e4923b8e1dbe97f'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # hw_type   = Int(2)
+      # prot_type = Int(2)
+      # hw_len    = Int(1)
+      # prot_len  = Int(1)
+      # opcode    = Int(2)
+      name = "between 'hw_type' and 'opcode'"
+      fragments.append(_struct_0.pack(pkt.hw_type, pkt.prot_type, pkt.hw_len, pkt.prot_len, pkt.opcode))
+
+
+      # sender_hw_addr   = Data(hw_len)
+      name = "sender_hw_addr"
+      value = pkt.sender_hw_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+      # sender_prot_addr = Data(prot_len)
+      name = "sender_prot_addr"
+      value = pkt.sender_prot_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+      # target_hw_addr   = Data(hw_len)
+      name = "target_hw_addr"
+      value = pkt.target_hw_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+      # target_prot_addr = Data(prot_len)
+      name = "target_prot_addr"
+      value = pkt.target_prot_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "hw_type"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # hw_type   = Int(2)
+      # prot_type = Int(2)
+      # hw_len    = Int(1)
+      # prot_len  = Int(1)
+      # opcode    = Int(2)
+      name = "between 'hw_type' and 'opcode'"
+      pkt.hw_type, pkt.prot_type, pkt.hw_len, pkt.prot_len, pkt.opcode, = _struct_0.unpack_from(raw, offset)
+      offset += 8
+
+
+      # sender_hw_addr   = Data(hw_len)
+      name = "sender_hw_addr"
+      byte_count = pkt.hw_len
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.sender_hw_addr = chunk
+      offset = next_offset
+
+      # sender_prot_addr = Data(prot_len)
+      name = "sender_prot_addr"
+      byte_count = pkt.prot_len
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.sender_prot_addr = chunk
+      offset = next_offset
+
+      # target_hw_addr   = Data(hw_len)
+      name = "target_hw_addr"
+      byte_count = pkt.hw_len
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.target_hw_addr = chunk
+      offset = next_offset
+
+      # target_prot_addr = Data(prot_len)
+      name = "target_prot_addr"
+      byte_count = pkt.prot_len
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.target_prot_addr = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # hw_type   = Int(2)
+      # prot_type = Int(2)
+      # hw_len    = Int(1)
+      # prot_len  = Int(1)
+      # opcode    = Int(2)
+      name = "between 'hw_type' and 'opcode'"
+      _struct_0.pack_into(buffer, offset, pkt.hw_type, pkt.prot_type, pkt.hw_len, pkt.prot_len, pkt.opcode)
+      offset += 8
+
+
+      # sender_hw_addr   = Data(hw_len)
+      name = "sender_hw_addr"
+      value = pkt.sender_hw_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+      # sender_prot_addr = Data(prot_len)
+      name = "sender_prot_addr"
+      value = pkt.sender_prot_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+      # target_hw_addr   = Data(hw_len)
+      name = "target_hw_addr"
+      value = pkt.target_hw_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+      # target_prot_addr = Data(prot_len)
+      name = "target_prot_addr"
+      value = pkt.target_prot_addr
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.hw_type
+   except AttributeError:
+      pass
+   else:
+      new.hw_type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.prot_type
+   except AttributeError:
+      pass
+   else:
+      new.prot_type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.hw_len
+   except AttributeError:
+      pass
+   else:
+      new.hw_len = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.prot_len
+   except AttributeError:
+      pass
+   else:
+      new.prot_len = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.opcode
+   except AttributeError:
+      pass
+   else:
+      new.opcode = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.sender_hw_addr
+   except AttributeError:
+      pass
+   else:
+      new.sender_hw_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.sender_prot_addr
+   except AttributeError:
+      pass
+   else:
+      new.sender_prot_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.target_hw_addr
+   except AttributeError:
+      pass
+   else:
+      new.target_hw_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.target_prot_addr
+   except AttributeError:
+      pass
+   else:
+      new.target_prot_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.hw_type = defaults.get('hw_type', 0)
+   pkt.prot_type = defaults.get('prot_type', 0)
+   pkt.hw_len = defaults.get('hw_len', 0)
+   pkt.prot_len = defaults.get('prot_len', 0)
+   pkt.opcode = defaults.get('opcode', 0)
+   pkt.sender_hw_addr = defaults.get('sender_hw_addr', b'')
+   pkt.sender_prot_addr = defaults.get('sender_prot_addr', b'')
+   pkt.target_hw_addr = defaults.get('target_hw_addr', b'')
+   pkt.target_prot_addr = defaults.get('target_prot_addr', b'')
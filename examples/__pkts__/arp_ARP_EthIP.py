@@ -0,0 +1,182 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HHBBH6s4s6s4s")
+BISTURI_PACKET_COOKIE = '63697868759efb4db89a3a8bd2febbaa20437f63'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # hw_type   = Int(2, default=0x0001)
+      # prot_type = Int(2, default=0x0800)
+      # hw_len    = Int(1, default=6)
+      # prot_len  = Int(1, default=4)
+      # opcode    = Int(2)
+
+      # sender_hw_addr   = Data(6)
+      # sender_prot_addr = Data(4)
+      # target_hw_addr   = Data(6)
+      # target_prot_addr = Data(4)
+      name = "between 'hw_type' and 'target_prot_addr'"
+      fragments.append(_struct_0.pack(pkt.hw_type, pkt.prot_type, pkt.hw_len, pkt.prot_len, pkt.opcode, pkt.sender_hw_addr, pkt.sender_prot_addr, pkt.target_hw_addr, pkt.target_prot_addr))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "hw_type"
+      if len(raw) - offset < 28:
+         raise _incomplete_data(len(raw) - offset, 28)
+
+
+      # hw_type   = Int(2, default=0x0001)
+      # prot_type = Int(2, default=0x0800)
+      # hw_len    = Int(1, default=6)
+      # prot_len  = Int(1, default=4)
+      # opcode    = Int(2)
+
+      # sender_hw_addr   = Data(6)
+      # sender_prot_addr = Data(4)
+      # target_hw_addr   = Data(6)
+      # target_prot_addr = Data(4)
+      name = "between 'hw_type' and 'target_prot_addr'"
+      pkt.hw_type, pkt.prot_type, pkt.hw_len, pkt.prot_len, pkt.opcode, pkt.sender_hw_addr, pkt.sender_prot_addr, pkt.target_hw_addr, pkt.target_prot_addr, = _struct_0.unpack_from(raw, offset)
+      offset += 28
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # hw_type   = Int(2, default=0x0001)
+      # prot_type = Int(2, default=0x0800)
+      # hw_len    = Int(1, default=6)
+      # prot_len  = Int(1, default=4)
+      # opcode    = Int(2)
+
+      # sender_hw_addr   = Data(6)
+      # sender_prot_addr = Data(4)
+      # target_hw_addr   = Data(6)
+      # target_prot_addr = Data(4)
+      name = "between 'hw_type' and 'target_prot_addr'"
+      _struct_0.pack_into(buffer, offset, pkt.hw_type, pkt.prot_type, pkt.hw_len, pkt.prot_len, pkt.opcode, pkt.sender_hw_addr, pkt.sender_prot_addr, pkt.target_hw_addr, pkt.target_prot_addr)
+      offset += 28
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.hw_type
+   except AttributeError:
+      pass
+   else:
+      new.hw_type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.prot_type
+   except AttributeError:
+      pass
+   else:
+      new.prot_type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.hw_len
+   except AttributeError:
+      pass
+   else:
+      new.hw_len = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.prot_len
+   except AttributeError:
+      pass
+   else:
+      new.prot_len = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.opcode
+   except AttributeError:
+      pass
+   else:
+      new.opcode = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.sender_hw_addr
+   except AttributeError:
+      pass
+   else:
+      new.sender_hw_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.sender_prot_addr
+   except AttributeError:
+      pass
+   else:
+      new.sender_prot_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.target_hw_addr
+   except AttributeError:
+      pass
+   else:
+      new.target_hw_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.target_prot_addr
+   except AttributeError:
+      pass
+   else:
+      new.target_prot_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.hw_type = defaults.get('hw_type', 1)
+   pkt.prot_type = defaults.get('prot_type', 2048)
+   pkt.hw_len = defaults.get('hw_len', 6)
+   pkt.prot_len = defaults.get('prot_len', 4)
+   pkt.opcode = defaults.get('opcode', 0)
+   pkt.sender_hw_addr = defaults.get('sender_hw_addr', b'\x00\x00\x00\x00\x00\x00')
+   pkt.sender_prot_addr = defaults.get('sender_prot_addr', b'\x00\x00\x00\x00')
+   pkt.target_hw_addr = defaults.get('target_hw_addr', b'\x00\x00\x00\x00\x00\x00')
+   pkt.target_prot_addr = defaults.get('target_prot_addr', b'\x00\x00\x00\x00')
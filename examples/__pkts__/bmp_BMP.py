@@ -0,0 +1,286 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">2s")
+_struct_1 = Struct("<IHHI")
+_struct_2 = Struct("<IIIHHIIIIII")
+BISTURI_PACKET_COOKIE = 'a5b8dab90bb2ba29d56cdd01b8a6e1468ce22ff3'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # signature = Data(2, default=b"BM")
+      name = "signature"
+      fragments.append(_struct_0.pack(pkt.signature))
+
+
+      # file_size = Int(4)
+      # reserved1 = Int(2)
+      # reserved2 = Int(2)
+
+      # offset_pixel_array = Int(4)
+      name = "between 'file_size' and 'offset_pixel_array'"
+      fragments.append(_struct_1.pack(pkt.file_size, pkt.reserved1, pkt.reserved2, pkt.offset_pixel_array))
+
+
+      # dib = Ref(DIB, embed=True)
+      name, _, pack, _ = fields[5]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+
+      name = "between 'header_size' and 'reserved'"
+      fragments.append(_struct_2.pack(pkt.header_size, pkt.image_width, pkt.image_height, pkt.planes, pkt.bits_per_pixel, pkt.compression, pkt.image_size, pkt.x_pixels_per_meter, pkt.y_pixels_per_meter, pkt.colors_in_color_table, pkt.reserved))
+
+
+
+      name, _, pack, _ = fields[17]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # pixel_rows = Ref(PixelRow).repeated(lambda root, **k: root.image_height)\
+      #                     .at(offset_pixel_array)
+      name, _, pack, _ = fields[18]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "signature"
+      if len(raw) - offset < 54:
+         raise _incomplete_data(len(raw) - offset, 54)
+
+
+      # signature = Data(2, default=b"BM")
+      name = "signature"
+      pkt.signature, = _struct_0.unpack_from(raw, offset)
+      offset += 2
+
+
+      # file_size = Int(4)
+      # reserved1 = Int(2)
+      # reserved2 = Int(2)
+
+      # offset_pixel_array = Int(4)
+      name = "between 'file_size' and 'offset_pixel_array'"
+      pkt.file_size, pkt.reserved1, pkt.reserved2, pkt.offset_pixel_array, = _struct_1.unpack_from(raw, offset)
+      offset += 12
+
+
+      # dib = Ref(DIB, embed=True)
+      name, _, _, unpack = fields[5]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+
+      name = "between 'header_size' and 'reserved'"
+      pkt.header_size, pkt.image_width, pkt.image_height, pkt.planes, pkt.bits_per_pixel, pkt.compression, pkt.image_size, pkt.x_pixels_per_meter, pkt.y_pixels_per_meter, pkt.colors_in_color_table, pkt.reserved, = _struct_2.unpack_from(raw, offset)
+      offset += 40
+
+
+
+      name, _, _, unpack = fields[17]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+      # pixel_rows = Ref(PixelRow).repeated(lambda root, **k: root.image_height)\
+      #                     .at(offset_pixel_array)
+      name, _, _, unpack = fields[18]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.signature
+   except AttributeError:
+      pass
+   else:
+      new.signature = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.file_size
+   except AttributeError:
+      pass
+   else:
+      new.file_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved1
+   except AttributeError:
+      pass
+   else:
+      new.reserved1 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved2
+   except AttributeError:
+      pass
+   else:
+      new.reserved2 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.offset_pixel_array
+   except AttributeError:
+      pass
+   else:
+      new.offset_pixel_array = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.dib
+   except AttributeError:
+      pass
+   else:
+      new.dib = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.header_size
+   except AttributeError:
+      pass
+   else:
+      new.header_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.image_width
+   except AttributeError:
+      pass
+   else:
+      new.image_width = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.image_height
+   except AttributeError:
+      pass
+   else:
+      new.image_height = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.planes
+   except AttributeError:
+      pass
+   else:
+      new.planes = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.bits_per_pixel
+   except AttributeError:
+      pass
+   else:
+      new.bits_per_pixel = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.compression
+   except AttributeError:
+      pass
+   else:
+      new.compression = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.image_size
+   except AttributeError:
+      pass
+   else:
+      new.image_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.x_pixels_per_meter
+   except AttributeError:
+      pass
+   else:
+      new.x_pixels_per_meter = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.y_pixels_per_meter
+   except AttributeError:
+      pass
+   else:
+      new.y_pixels_per_meter = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.colors_in_color_table
+   except AttributeError:
+      pass
+   else:
+      new.colors_in_color_table = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved
+   except AttributeError:
+      pass
+   else:
+      new.reserved = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_pixel_rows
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_pixel_rows = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.pixel_rows
+   except AttributeError:
+      pass
+   else:
+      new.pixel_rows = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__pixel_rows
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__pixel_rows = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.signature = defaults.get('signature', b'BM')
+   pkt.file_size = defaults.get('file_size', 0)
+   pkt.reserved1 = defaults.get('reserved1', 0)
+   pkt.reserved2 = defaults.get('reserved2', 0)
+   pkt.offset_pixel_array = defaults.get('offset_pixel_array', 0)
+   fields[5][1].init(pkt, defaults)
+   pkt.header_size = defaults.get('header_size', 0)
+   pkt.image_width = defaults.get('image_width', 0)
+   pkt.image_height = defaults.get('image_height', 0)
+   pkt.planes = defaults.get('planes', 1)
+   pkt.bits_per_pixel = defaults.get('bits_per_pixel', 32)
+   pkt.compression = defaults.get('compression', 0)
+   pkt.image_size = defaults.get('image_size', 0)
+   pkt.x_pixels_per_meter = defaults.get('x_pixels_per_meter', 0)
+   pkt.y_pixels_per_meter = defaults.get('y_pixels_per_meter', 0)
+   pkt.colors_in_color_table = defaults.get('colors_in_color_table', 0)
+   pkt.reserved = defaults.get('reserved', 0)
+   fields[17][1].init(pkt, defaults)
+   fields[18][1].init(pkt, defaults)
@@ -0,0 +1,276 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<IIIHHIIIIII")
+BISTURI_PACKET_COOKIE = 'd460d9dbac8033bec0bb35edc042f21fd84274ce'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # header_size = Int(4)
+
+      # image_width  = Int(4)
+      # image_height = Int(4)
+
+      # planes = Int(2, default=1)
+      # bits_per_pixel = Int(2, default=32)
+
+      # compression = Int(4)
+      # image_size  = Int(4)
+
+      # x_pixels_per_meter = Int(4)
+      # y_pixels_per_meter = Int(4)
+      # colors_in_color_table = Int(4)
+
+      # '''
+      # important_color_count = Int(4)
+
+      # red_channel_bitmask   = Int(4)
+      # green_channel_bitmask = Int(4)
+      # blue_channel_bitmask  = Int(4)
+      # alpha_channel_bitmask = Int(4)
+
+      # color_space_type = Int(4)
+      # color_space_endpoints= Int(4)
+
+      # gamma_for_red_channel   = Int(4)
+      # gamma_for_green_channel = Int(4)
+      # gamma_for_blue_channel  = Int(4)
+
+      # intent = Int(4)
+      # icc_profile_data = Int(4)
+      # icc_profile_size = Int(4)
+      # '''
+
+      # reserved = Int(4)
+      name = "between 'header_size' and 'reserved'"
+      fragments.append(_struct_0.pack(pkt.header_size, pkt.image_width, pkt.image_height, pkt.planes, pkt.bits_per_pixel, pkt.compression, pkt.image_size, pkt.x_pixels_per_meter, pkt.y_pixels_per_meter, pkt.colors_in_color_table, pkt.reserved))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "header_size"
+      if len(raw) - offset < 40:
+         raise _incomplete_data(len(raw) - offset, 40)
+
+
+      # header_size = Int(4)
+
+      # image_width  = Int(4)
+      # image_height = Int(4)
+
+      # planes = Int(2, default=1)
+      # bits_per_pixel = Int(2, default=32)
+
+      # compression = Int(4)
+      # image_size  = Int(4)
+
+      # x_pixels_per_meter = Int(4)
+      # y_pixels_per_meter = Int(4)
+      # colors_in_color_table = Int(4)
+
+      # '''
+      # important_color_count = Int(4)
+
+      # red_channel_bitmask   = Int(4)
+      # green_channel_bitmask = Int(4)
+      # blue_channel_bitmask  = Int(4)
+      # alpha_channel_bitmask = Int(4)
+
+      # color_space_type = Int(4)
+      # color_space_endpoints= Int(4)
+
+      # gamma_for_red_channel   = Int(4)
+      # gamma_for_green_channel = Int(4)
+      # gamma_for_blue_channel  = Int(4)
+
+      # intent = Int(4)
+      # icc_profile_data = Int(4)
+      # icc_profile_size = Int(4)
+      # '''
+
+      # reserved = Int(4)
+      name = "between 'header_size' and 'reserved'"
+      pkt.header_size, pkt.image_width, pkt.image_height, pkt.planes, pkt.bits_per_pixel, pkt.compression, pkt.image_size, pkt.x_pixels_per_meter, pkt.y_pixels_per_meter, pkt.colors_in_color_table, pkt.reserved, = _struct_0.unpack_from(raw, offset)
+      offset += 40
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # header_size = Int(4)
+
+      # image_width  = Int(4)
+      # image_height = Int(4)
+
+      # planes = Int(2, default=1)
+      # bits_per_pixel = Int(2, default=32)
+
+      # compression = Int(4)
+      # image_size  = Int(4)
+
+      # x_pixels_per_meter = Int(4)
+      # y_pixels_per_meter = Int(4)
+      # colors_in_color_table = Int(4)
+
+      # '''
+      # important_color_count = Int(4)
+
+      # red_channel_bitmask   = Int(4)
+      # green_channel_bitmask = Int(4)
+      # blue_channel_bitmask  = Int(4)
+      # alpha_channel_bitmask = Int(4)
+
+      # color_space_type = Int(4)
+      # color_space_endpoints= Int(4)
+
+      # gamma_for_red_channel   = Int(4)
+      # gamma_for_green_channel = Int(4)
+      # gamma_for_blue_channel  = Int(4)
+
+      # intent = Int(4)
+      # icc_profile_data = Int(4)
+      # icc_profile_size = Int(4)
+      # '''
+
+      # reserved = Int(4)
+      name = "between 'header_size' and 'reserved'"
+      _struct_0.pack_into(buffer, offset, pkt.header_size, pkt.image_width, pkt.image_height, pkt.planes, pkt.bits_per_pixel, pkt.compression, pkt.image_size, pkt.x_pixels_per_meter, pkt.y_pixels_per_meter, pkt.colors_in_color_table, pkt.reserved)
+      offset += 40
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.header_size
+   except AttributeError:
+      pass
+   else:
+      new.header_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.image_width
+   except AttributeError:
+      pass
+   else:
+      new.image_width = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.image_height
+   except AttributeError:
+      pass
+   else:
+      new.image_height = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.planes
+   except AttributeError:
+      pass
+   else:
+      new.planes = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.bits_per_pixel
+   except AttributeError:
+      pass
+   else:
+      new.bits_per_pixel = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.compression
+   except AttributeError:
+      pass
+   else:
+      new.compression = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.image_size
+   except AttributeError:
+      pass
+   else:
+      new.image_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.x_pixels_per_meter
+   except AttributeError:
+      pass
+   else:
+      new.x_pixels_per_meter = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.y_pixels_per_meter
+   except AttributeError:
+      pass
+   else:
+      new.y_pixels_per_meter = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.colors_in_color_table
+   except AttributeError:
+      pass
+   else:
+      new.colors_in_color_table = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved
+   except AttributeError:
+      pass
+   else:
+      new.reserved = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.header_size = defaults.get('header_size', 0)
+   pkt.image_width = defaults.get('image_width', 0)
+   pkt.image_height = defaults.get('image_height', 0)
+   pkt.planes = defaults.get('planes', 1)
+   pkt.bits_per_pixel = defaults.get('bits_per_pixel', 32)
+   pkt.compression = defaults.get('compression', 0)
+   pkt.image_size = defaults.get('image_size', 0)
+   pkt.x_pixels_per_meter = defaults.get('x_pixels_per_meter', 0)
+   pkt.y_pixels_per_meter = defaults.get('y_pixels_per_meter', 0)
+   pkt.colors_in_color_table = defaults.get('colors_in_color_table', 0)
+   pkt.reserved = defaults.get('reserved', 0)
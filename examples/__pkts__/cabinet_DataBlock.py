@@ -0,0 +1,147 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<IHH")
+BISTURI_PACKET_COOKIE = 'bc0a7a1704dbde23bad1c541e530e0387e34114a'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # checksum = Int(4)
+      # size_compressed = Int(2)
+      # size_uncompressed = Int(2)
+      name = "between 'checksum' and 'size_uncompressed'"
+      fragments.append(_struct_0.pack(pkt.checksum, pkt.size_compressed, pkt.size_uncompressed))
+
+
+      # reserved_area = Data(lambda root, **k: root.size_reserved_area_per_datablock)\
+      #                     .when(lambda root, **k: root.flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # data = Data(size_compressed)
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "checksum"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # checksum = Int(4)
+      # size_compressed = Int(2)
+      # size_uncompressed = Int(2)
+      name = "between 'checksum' and 'size_uncompressed'"
+      pkt.checksum, pkt.size_compressed, pkt.size_uncompressed, = _struct_0.unpack_from(raw, offset)
+      offset += 8
+
+
+      # reserved_area = Data(lambda root, **k: root.size_reserved_area_per_datablock)\
+      #                     .when(lambda root, **k: root.flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, _, unpack = fields[3]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+      # data = Data(size_compressed)
+      name = "data"
+      byte_count = pkt.size_compressed
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.data = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.checksum
+   except AttributeError:
+      pass
+   else:
+      new.checksum = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size_compressed
+   except AttributeError:
+      pass
+   else:
+      new.size_compressed = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size_uncompressed
+   except AttributeError:
+      pass
+   else:
+      new.size_uncompressed = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved_area
+   except AttributeError:
+      pass
+   else:
+      new.reserved_area = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__reserved_area
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__reserved_area = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.checksum = defaults.get('checksum', 0)
+   pkt.size_compressed = defaults.get('size_compressed', 0)
+   pkt.size_uncompressed = defaults.get('size_uncompressed', 0)
+   fields[3][1].init(pkt, defaults)
+   pkt.data = defaults.get('data', b'')
@@ -0,0 +1,196 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<IIHHHH")
+BISTURI_PACKET_COOKIE = 'a9d076b87cafd45b9631cad88a8a10fc1591278c'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # uncompressed_size = Int(4)
+      # uncompressed_offset_of_this_in_folder = Int(4)
+      # index_of_folder = Int(2)
+      # date = Int(2)
+      # time = Int(2)
+      # attributes = Int(2)
+      name = "between 'uncompressed_size' and 'attributes'"
+      fragments.append(_struct_0.pack(pkt.uncompressed_size, pkt.uncompressed_offset_of_this_in_folder, pkt.index_of_folder, pkt.date, pkt.time, pkt.attributes))
+
+
+      # name = Data(until_marker=b'\0')
+      name = "name"
+      value = pkt.name
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + b'\x00')
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "uncompressed_size"
+      if len(raw) - offset < 17:
+         raise _incomplete_data(len(raw) - offset, 17)
+
+
+      # uncompressed_size = Int(4)
+      # uncompressed_offset_of_this_in_folder = Int(4)
+      # index_of_folder = Int(2)
+      # date = Int(2)
+      # time = Int(2)
+      # attributes = Int(2)
+      name = "between 'uncompressed_size' and 'attributes'"
+      pkt.uncompressed_size, pkt.uncompressed_offset_of_this_in_folder, pkt.index_of_folder, pkt.date, pkt.time, pkt.attributes, = _struct_0.unpack_from(raw, offset)
+      offset += 16
+
+
+      # name = Data(until_marker=b'\0')
+      name = "name"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[6][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'\x00', offset)
+      if position < 0:
+         raise fields[6][1]._marker_not_found(raw, offset)
+      count = position - offset
+
+      extra_count = 1
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.name = chunk
+      offset = next_offset + extra_count
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # uncompressed_size = Int(4)
+      # uncompressed_offset_of_this_in_folder = Int(4)
+      # index_of_folder = Int(2)
+      # date = Int(2)
+      # time = Int(2)
+      # attributes = Int(2)
+      name = "between 'uncompressed_size' and 'attributes'"
+      _struct_0.pack_into(buffer, offset, pkt.uncompressed_size, pkt.uncompressed_offset_of_this_in_folder, pkt.index_of_folder, pkt.date, pkt.time, pkt.attributes)
+      offset += 16
+
+
+      # name = Data(until_marker=b'\0')
+      name = "name"
+      value = pkt.name
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      value += b'\x00'
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.uncompressed_size
+   except AttributeError:
+      pass
+   else:
+      new.uncompressed_size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.uncompressed_offset_of_this_in_folder
+   except AttributeError:
+      pass
+   else:
+      new.uncompressed_offset_of_this_in_folder = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.index_of_folder
+   except AttributeError:
+      pass
+   else:
+      new.index_of_folder = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.date
+   except AttributeError:
+      pass
+   else:
+      new.date = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.time
+   except AttributeError:
+      pass
+   else:
+      new.time = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.attributes
+   except AttributeError:
+      pass
+   else:
+      new.attributes = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name
+   except AttributeError:
+      pass
+   else:
+      new.name = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.uncompressed_size = defaults.get('uncompressed_size', 0)
+   pkt.uncompressed_offset_of_this_in_folder = defaults.get('uncompressed_offset_of_this_in_folder', 0)
+   pkt.index_of_folder = defaults.get('index_of_folder', 0)
+   pkt.date = defaults.get('date', 0)
+   pkt.time = defaults.get('time', 0)
+   pkt.attributes = defaults.get('attributes', 0)
+   pkt.name = defaults.get('name', b'')
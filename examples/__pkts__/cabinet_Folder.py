@@ -0,0 +1,167 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<IHH")
+BISTURI_PACKET_COOKIE = '3621750a00da0a074d17151d91f99fd2f997d617'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # offset_first_datablock = Int(4)
+      # number_of_datablocks = Int(2)
+      # compression_type = Int(2)
+      name = "between 'offset_first_datablock' and 'compression_type'"
+      fragments.append(_struct_0.pack(pkt.offset_first_datablock, pkt.number_of_datablocks, pkt.compression_type))
+
+
+      # reserved_area = Data(lambda root, **k: root.pkt.size_reserved_area_per_folder)\
+      #                     .when(lambda root, **k: root.flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      name, _, pack, _ = fields[4]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # datablocks = Ref(DataBlock).repeated(number_of_datablocks)\
+      #                .at(offset_first_datablock, 'begins')
+      name, _, pack, _ = fields[5]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "offset_first_datablock"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # offset_first_datablock = Int(4)
+      # number_of_datablocks = Int(2)
+      # compression_type = Int(2)
+      name = "between 'offset_first_datablock' and 'compression_type'"
+      pkt.offset_first_datablock, pkt.number_of_datablocks, pkt.compression_type, = _struct_0.unpack_from(raw, offset)
+      offset += 8
+
+
+      # reserved_area = Data(lambda root, **k: root.pkt.size_reserved_area_per_folder)\
+      #                     .when(lambda root, **k: root.flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, _, unpack = fields[3]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      name, _, _, unpack = fields[4]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+      # datablocks = Ref(DataBlock).repeated(number_of_datablocks)\
+      #                .at(offset_first_datablock, 'begins')
+      name = "datablocks"
+      sequence = []
+      pkt.datablocks = sequence
+      unpack = fields[5][1].prototype_field.unpack
+      count = pkt.number_of_datablocks
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__datablocks)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.offset_first_datablock
+   except AttributeError:
+      pass
+   else:
+      new.offset_first_datablock = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.number_of_datablocks
+   except AttributeError:
+      pass
+   else:
+      new.number_of_datablocks = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.compression_type
+   except AttributeError:
+      pass
+   else:
+      new.compression_type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved_area
+   except AttributeError:
+      pass
+   else:
+      new.reserved_area = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__reserved_area
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__reserved_area = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._shift_to_datablocks
+   except AttributeError:
+      pass
+   else:
+      new._shift_to_datablocks = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.datablocks
+   except AttributeError:
+      pass
+   else:
+      new.datablocks = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__datablocks
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__datablocks = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.offset_first_datablock = defaults.get('offset_first_datablock', 0)
+   pkt.number_of_datablocks = defaults.get('number_of_datablocks', 0)
+   pkt.compression_type = defaults.get('compression_type', 0)
+   fields[3][1].init(pkt, defaults)
+   fields[4][1].init(pkt, defaults)
+   fields[5][1].init(pkt, defaults)
@@ -0,0 +1,431 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">4s")
+_struct_1 = Struct("<IIIIIBBHHHHH")
+BISTURI_PACKET_COOKIE = '5de11e6e59734daf84b39132d0a73886673a82c0'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # signature = Data(4, default=b'MSCF')
+      name = "signature"
+      fragments.append(_struct_0.pack(pkt.signature))
+
+
+      # reserved1 = Int(4)
+      # size_of_cabinet = Int(4)
+      # reserved2 = Int(4)
+      # offset_first_file = Int(4)
+      # reserved3 = Int(4)
+
+      # version_minor = Int(1)
+      # version_major = Int(1)
+
+      # number_of_folders = Int(2)
+      # number_of_files = Int(2)
+
+      # flags = Int(2)
+
+      # set_id = Int(2) # must be the same for all cabinets in a set
+      # cabinet_id = Int(2) # number of this cabinet file in a set
+      name = "between 'reserved1' and 'cabinet_id'"
+      fragments.append(_struct_1.pack(pkt.reserved1, pkt.size_of_cabinet, pkt.reserved2, pkt.offset_first_file, pkt.reserved3, pkt.version_minor, pkt.version_major, pkt.number_of_folders, pkt.number_of_files, pkt.flags, pkt.set_id, pkt.cabinet_id))
+
+
+      # size_reserved_area_per_cabinet   = Int(2).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, pack, _ = fields[13]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # size_reserved_area_per_folder    = Int(1).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, pack, _ = fields[14]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # size_reserved_area_per_datablock = Int(1).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, pack, _ = fields[15]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # # (optional) per-cabinet reserved area
+      # reserved_area = Data(size_reserved_area_per_cabinet).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name, _, pack, _ = fields[16]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # name_previous_cabinet = Data(until_marker=b'\0').when(flags & HeaderFlags.PREV_CABINET)
+      name, _, pack, _ = fields[17]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # name_previous_disk = Data(until_marker=b'\0').when(flags & HeaderFlags.PREV_CABINET)
+      name, _, pack, _ = fields[18]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # name_next_cabinet = Data(until_marker=b'\0').when(flags & HeaderFlags.NEXT_CABINET)
+      name, _, pack, _ = fields[19]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # name_next_disk = Data(until_marker=b'\0').when(flags & HeaderFlags.NEXT_CABINET)
+      name, _, pack, _ = fields[20]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "signature"
+      if len(raw) - offset < 36:
+         raise _incomplete_data(len(raw) - offset, 36)
+
+
+      # signature = Data(4, default=b'MSCF')
+      name = "signature"
+      pkt.signature, = _struct_0.unpack_from(raw, offset)
+      offset += 4
+
+
+      # reserved1 = Int(4)
+      # size_of_cabinet = Int(4)
+      # reserved2 = Int(4)
+      # offset_first_file = Int(4)
+      # reserved3 = Int(4)
+
+      # version_minor = Int(1)
+      # version_major = Int(1)
+
+      # number_of_folders = Int(2)
+      # number_of_files = Int(2)
+
+      # flags = Int(2)
+
+      # set_id = Int(2) # must be the same for all cabinets in a set
+      # cabinet_id = Int(2) # number of this cabinet file in a set
+      name = "between 'reserved1' and 'cabinet_id'"
+      pkt.reserved1, pkt.size_of_cabinet, pkt.reserved2, pkt.offset_first_file, pkt.reserved3, pkt.version_minor, pkt.version_major, pkt.number_of_folders, pkt.number_of_files, pkt.flags, pkt.set_id, pkt.cabinet_id, = _struct_1.unpack_from(raw, offset)
+      offset += 32
+
+
+      # size_reserved_area_per_cabinet   = Int(2).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name = "size_reserved_area_per_cabinet"
+      if (pkt.flags & 4):
+         offset = fields[13][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.size_reserved_area_per_cabinet = pkt._opt_elem__size_reserved_area_per_cabinet
+      else:
+         pkt.size_reserved_area_per_cabinet = None
+
+      # size_reserved_area_per_folder    = Int(1).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name = "size_reserved_area_per_folder"
+      if (pkt.flags & 4):
+         offset = fields[14][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.size_reserved_area_per_folder = pkt._opt_elem__size_reserved_area_per_folder
+      else:
+         pkt.size_reserved_area_per_folder = None
+
+      # size_reserved_area_per_datablock = Int(1).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name = "size_reserved_area_per_datablock"
+      if (pkt.flags & 4):
+         offset = fields[15][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.size_reserved_area_per_datablock = pkt._opt_elem__size_reserved_area_per_datablock
+      else:
+         pkt.size_reserved_area_per_datablock = None
+
+      # # (optional) per-cabinet reserved area
+      # reserved_area = Data(size_reserved_area_per_cabinet).when(flags & HeaderFlags.RESERVE_PRESENT)
+      name = "reserved_area"
+      if (pkt.flags & 4):
+         offset = fields[16][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.reserved_area = pkt._opt_elem__reserved_area
+      else:
+         pkt.reserved_area = None
+
+      # name_previous_cabinet = Data(until_marker=b'\0').when(flags & HeaderFlags.PREV_CABINET)
+      name = "name_previous_cabinet"
+      if (pkt.flags & 1):
+         offset = fields[17][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.name_previous_cabinet = pkt._opt_elem__name_previous_cabinet
+      else:
+         pkt.name_previous_cabinet = None
+
+      # name_previous_disk = Data(until_marker=b'\0').when(flags & HeaderFlags.PREV_CABINET)
+      name = "name_previous_disk"
+      if (pkt.flags & 1):
+         offset = fields[18][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.name_previous_disk = pkt._opt_elem__name_previous_disk
+      else:
+         pkt.name_previous_disk = None
+
+      # name_next_cabinet = Data(until_marker=b'\0').when(flags & HeaderFlags.NEXT_CABINET)
+      name = "name_next_cabinet"
+      if (pkt.flags & 2):
+         offset = fields[19][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.name_next_cabinet = pkt._opt_elem__name_next_cabinet
+      else:
+         pkt.name_next_cabinet = None
+
+      # name_next_disk = Data(until_marker=b'\0').when(flags & HeaderFlags.NEXT_CABINET)
+      name = "name_next_disk"
+      if (pkt.flags & 2):
+         offset = fields[20][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.name_next_disk = pkt._opt_elem__name_next_disk
+      else:
+         pkt.name_next_disk = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.signature
+   except AttributeError:
+      pass
+   else:
+      new.signature = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved1
+   except AttributeError:
+      pass
+   else:
+      new.reserved1 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size_of_cabinet
+   except AttributeError:
+      pass
+   else:
+      new.size_of_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved2
+   except AttributeError:
+      pass
+   else:
+      new.reserved2 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.offset_first_file
+   except AttributeError:
+      pass
+   else:
+      new.offset_first_file = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved3
+   except AttributeError:
+      pass
+   else:
+      new.reserved3 = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.version_minor
+   except AttributeError:
+      pass
+   else:
+      new.version_minor = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.version_major
+   except AttributeError:
+      pass
+   else:
+      new.version_major = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.number_of_folders
+   except AttributeError:
+      pass
+   else:
+      new.number_of_folders = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.number_of_files
+   except AttributeError:
+      pass
+   else:
+      new.number_of_files = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags
+   except AttributeError:
+      pass
+   else:
+      new.flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.set_id
+   except AttributeError:
+      pass
+   else:
+      new.set_id = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.cabinet_id
+   except AttributeError:
+      pass
+   else:
+      new.cabinet_id = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size_reserved_area_per_cabinet
+   except AttributeError:
+      pass
+   else:
+      new.size_reserved_area_per_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__size_reserved_area_per_cabinet
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__size_reserved_area_per_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size_reserved_area_per_folder
+   except AttributeError:
+      pass
+   else:
+      new.size_reserved_area_per_folder = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__size_reserved_area_per_folder
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__size_reserved_area_per_folder = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size_reserved_area_per_datablock
+   except AttributeError:
+      pass
+   else:
+      new.size_reserved_area_per_datablock = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__size_reserved_area_per_datablock
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__size_reserved_area_per_datablock = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved_area
+   except AttributeError:
+      pass
+   else:
+      new.reserved_area = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__reserved_area
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__reserved_area = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name_previous_cabinet
+   except AttributeError:
+      pass
+   else:
+      new.name_previous_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__name_previous_cabinet
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__name_previous_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name_previous_disk
+   except AttributeError:
+      pass
+   else:
+      new.name_previous_disk = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__name_previous_disk
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__name_previous_disk = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name_next_cabinet
+   except AttributeError:
+      pass
+   else:
+      new.name_next_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__name_next_cabinet
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__name_next_cabinet = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name_next_disk
+   except AttributeError:
+      pass
+   else:
+      new.name_next_disk = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__name_next_disk
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__name_next_disk = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.signature = defaults.get('signature', b'MSCF')
+   pkt.reserved1 = defaults.get('reserved1', 0)
+   pkt.size_of_cabinet = defaults.get('size_of_cabinet', 0)
+   pkt.reserved2 = defaults.get('reserved2', 0)
+   pkt.offset_first_file = defaults.get('offset_first_file', 0)
+   pkt.reserved3 = defaults.get('reserved3', 0)
+   pkt.version_minor = defaults.get('version_minor', 0)
+   pkt.version_major = defaults.get('version_major', 0)
+   pkt.number_of_folders = defaults.get('number_of_folders', 0)
+   pkt.number_of_files = defaults.get('number_of_files', 0)
+   pkt.flags = defaults.get('flags', 0)
+   pkt.set_id = defaults.get('set_id', 0)
+   pkt.cabinet_id = defaults.get('cabinet_id', 0)
+   fields[13][1].init(pkt, defaults)
+   fields[14][1].init(pkt, defaults)
+   fields[15][1].init(pkt, defaults)
+   fields[16][1].init(pkt, defaults)
+   fields[17][1].init(pkt, defaults)
+   fields[18][1].init(pkt, defaults)
+   fields[19][1].init(pkt, defaults)
+   fields[20][1].init(pkt, defaults)
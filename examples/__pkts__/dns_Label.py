@@ -0,0 +1,129 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = '638d56cd32279c7247add9252dfa2c63ed391f99'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # length = Int(1)
+      name = "length"
+      fragments.append(_struct_0.pack(pkt.length))
+
+
+      # #name   = Ref(lambda pkt, **k: Int(1) if pkt.is_compressed() else Data(pkt.length),
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # #                default=b'')
+      name, _, pack, _ = fields[2]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "length"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+      # length = Int(1)
+      name = "length"
+      pkt.length, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+      # #name   = Ref(lambda pkt, **k: Int(1) if pkt.is_compressed() else Data(pkt.length),
+      name = "name"
+      if ((pkt.length & 192) != 192):
+         offset = fields[1][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.name = pkt._opt_elem__name
+      else:
+         pkt.name = None
+
+      # #                default=b'')
+      name = "shift"
+      if ((pkt.length & 192) == 192):
+         offset = fields[2][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.shift = pkt._opt_elem__shift
+      else:
+         pkt.shift = None
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.name
+   except AttributeError:
+      pass
+   else:
+      new.name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__name
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.shift
+   except AttributeError:
+      pass
+   else:
+      new.shift = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__shift
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__shift = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.length = defaults.get('length', 0)
+   fields[1][1].init(pkt, defaults)
+   fields[2][1].init(pkt, defaults)
@@ -0,0 +1,352 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HHHHHH")
+BISTURI_PACKET_COOKIE = '1937e192f26e7f5334497951afff950bb40e34d6'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # id       = Int(2)    # query's id, it's copied in the corresponding reply to match up
+
+      # is_query = Bits(1)   # a message can be a query or a reply
+      # opcode   = Bits(4)
+
+      # is_authoritative  = Bits(1) # is an authoritative answer?
+      # was_truncated     = Bits(1) # was the message truncated due its excessive length?
+      # request_recursion = Bits(1) # the query desires to be resolved recursively; it's copied in the reply
+
+      # is_recursion_available = Bits(1) # is the server supporting recursion? it's set/cleared in the reply
+      # reserved      = Bits(3)
+      # response_code = Bits(4)
+
+      # qd_count = Int(2)
+      # an_count = Int(2)
+      # ns_count = Int(2)
+      # ar_count = Int(2)
+      name = "between 'id' and 'ar_count'"
+      if pkt.is_query & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.is_query)
+      if pkt.opcode & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.opcode)
+      if pkt.is_authoritative & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.is_authoritative)
+      if pkt.was_truncated & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.was_truncated)
+      if pkt.request_recursion & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.request_recursion)
+      if pkt.is_recursion_available & ~0x1:
+         raise ValueError("The value %i does not fit in 1 bits." % pkt.is_recursion_available)
+      if pkt.reserved & ~0x7:
+         raise ValueError("The value %i does not fit in 3 bits." % pkt.reserved)
+      if pkt.response_code & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.response_code)
+      fragments.append(_struct_0.pack(pkt.id, (pkt.is_query << 15) | (pkt.opcode << 11) | (pkt.is_authoritative << 10) | (pkt.was_truncated << 9) | (pkt.request_recursion << 8) | (pkt.is_recursion_available << 7) | (pkt.reserved << 4) | pkt.response_code, pkt.qd_count, pkt.an_count, pkt.ns_count, pkt.ar_count))
+
+
+      # questions   = Ref(Question).repeated(qd_count)          # the question did in the reply and copied in the response
+      name, _, pack, _ = fields[13]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # answers     = Ref(ResourceRecord).repeated(an_count)    # the answers
+      name, _, pack, _ = fields[14]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # authorities = Ref(ResourceRecord).repeated(ns_count)    # the name servers authorities
+      name, _, pack, _ = fields[15]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # additionals = Ref(ResourceRecord).repeated(ar_count)    # additional records
+      name, _, pack, _ = fields[16]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "id"
+      if len(raw) - offset < 12:
+         raise _incomplete_data(len(raw) - offset, 12)
+
+
+      # id       = Int(2)    # query's id, it's copied in the corresponding reply to match up
+
+      # is_query = Bits(1)   # a message can be a query or a reply
+      # opcode   = Bits(4)
+
+      # is_authoritative  = Bits(1) # is an authoritative answer?
+      # was_truncated     = Bits(1) # was the message truncated due its excessive length?
+      # request_recursion = Bits(1) # the query desires to be resolved recursively; it's copied in the reply
+
+      # is_recursion_available = Bits(1) # is the server supporting recursion? it's set/cleared in the reply
+      # reserved      = Bits(3)
+      # response_code = Bits(4)
+
+      # qd_count = Int(2)
+      # an_count = Int(2)
+      # ns_count = Int(2)
+      # ar_count = Int(2)
+      name = "between 'id' and 'ar_count'"
+      pkt.id, bits_1, pkt.qd_count, pkt.an_count, pkt.ns_count, pkt.ar_count, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__is_query_opcode_is_authoritative_was_truncated_request_recursion_is_recursion_available_reserved_response_code = bits_1
+      pkt.is_query = (bits_1 & 0x8000) >> 15
+      pkt.opcode = (bits_1 & 0x7800) >> 11
+      pkt.is_authoritative = (bits_1 & 0x400) >> 10
+      pkt.was_truncated = (bits_1 & 0x200) >> 9
+      pkt.request_recursion = (bits_1 & 0x100) >> 8
+      pkt.is_recursion_available = (bits_1 & 0x80) >> 7
+      pkt.reserved = (bits_1 & 0x70) >> 4
+      pkt.response_code = bits_1 & 0xf
+      offset += 12
+
+
+      # questions   = Ref(Question).repeated(qd_count)          # the question did in the reply and copied in the response
+      name = "questions"
+      sequence = []
+      pkt.questions = sequence
+      unpack = fields[13][1].prototype_field.unpack
+      count = pkt.qd_count
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__questions)
+
+      # answers     = Ref(ResourceRecord).repeated(an_count)    # the answers
+      name = "answers"
+      sequence = []
+      pkt.answers = sequence
+      unpack = fields[14][1].prototype_field.unpack
+      count = pkt.an_count
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__answers)
+
+      # authorities = Ref(ResourceRecord).repeated(ns_count)    # the name servers authorities
+      name = "authorities"
+      sequence = []
+      pkt.authorities = sequence
+      unpack = fields[15][1].prototype_field.unpack
+      count = pkt.ns_count
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__authorities)
+
+      # additionals = Ref(ResourceRecord).repeated(ar_count)    # additional records
+      name = "additionals"
+      sequence = []
+      pkt.additionals = sequence
+      unpack = fields[16][1].prototype_field.unpack
+      count = pkt.ar_count
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__additionals)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.id
+   except AttributeError:
+      pass
+   else:
+      new.id = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.is_query
+   except AttributeError:
+      pass
+   else:
+      new.is_query = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.opcode
+   except AttributeError:
+      pass
+   else:
+      new.opcode = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.is_authoritative
+   except AttributeError:
+      pass
+   else:
+      new.is_authoritative = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.was_truncated
+   except AttributeError:
+      pass
+   else:
+      new.was_truncated = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.request_recursion
+   except AttributeError:
+      pass
+   else:
+      new.request_recursion = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.is_recursion_available
+   except AttributeError:
+      pass
+   else:
+      new.is_recursion_available = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.reserved
+   except AttributeError:
+      pass
+   else:
+      new.reserved = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.response_code
+   except AttributeError:
+      pass
+   else:
+      new.response_code = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__is_query_opcode_is_authoritative_was_truncated_request_recursion_is_recursion_available_reserved_response_code
+   except AttributeError:
+      pass
+   else:
+      new._bits__is_query_opcode_is_authoritative_was_truncated_request_recursion_is_recursion_available_reserved_response_code = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.qd_count
+   except AttributeError:
+      pass
+   else:
+      new.qd_count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.an_count
+   except AttributeError:
+      pass
+   else:
+      new.an_count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.ns_count
+   except AttributeError:
+      pass
+   else:
+      new.ns_count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.ar_count
+   except AttributeError:
+      pass
+   else:
+      new.ar_count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.questions
+   except AttributeError:
+      pass
+   else:
+      new.questions = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__questions
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__questions = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.answers
+   except AttributeError:
+      pass
+   else:
+      new.answers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__answers
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__answers = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.authorities
+   except AttributeError:
+      pass
+   else:
+      new.authorities = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__authorities
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__authorities = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.additionals
+   except AttributeError:
+      pass
+   else:
+      new.additionals = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__additionals
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__additionals = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.id = defaults.get('id', 0)
+   pkt._bits__is_query_opcode_is_authoritative_was_truncated_request_recursion_is_recursion_available_reserved_response_code = 0
+   pkt.is_query = defaults.get('is_query', 0)
+   pkt.opcode = defaults.get('opcode', 0)
+   pkt.is_authoritative = defaults.get('is_authoritative', 0)
+   pkt.was_truncated = defaults.get('was_truncated', 0)
+   pkt.request_recursion = defaults.get('request_recursion', 0)
+   pkt.is_recursion_available = defaults.get('is_recursion_available', 0)
+   pkt.reserved = defaults.get('reserved', 0)
+   pkt.response_code = defaults.get('response_code', 0)
+   pkt.qd_count = defaults.get('qd_count', 0)
+   pkt.an_count = defaults.get('an_count', 0)
+   pkt.ns_count = defaults.get('ns_count', 0)
+   pkt.ar_count = defaults.get('ar_count', 0)
+   fields[13][1].init(pkt, defaults)
+   fields[14][1].init(pkt, defaults)
+   fields[15][1].init(pkt, defaults)
+   fields[16][1].init(pkt, defaults)
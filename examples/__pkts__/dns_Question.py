@@ -0,0 +1,113 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HH")
+BISTURI_PACKET_COOKIE = '751e995ebaf7b1312edb04eff86392f9c07b5114'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # name   = Ref(Label).repeated(until=lambda pkt, **k: pkt.name[-1].is_root() or pkt.name[-1].is_compressed())
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      # type_  = Int(2, default=1)  # the values include all codes valid for this field together with some more general codes
+      #                             # which can match more than one type of resource records
+      # class_ = Int(2, default=1)  # For example the class_ IN is for the Internet
+      name = "between 'type_' and 'class_'"
+      fragments.append(_struct_0.pack(pkt.type_, pkt.class_))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "name"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+      # name   = Ref(Label).repeated(until=lambda pkt, **k: pkt.name[-1].is_root() or pkt.name[-1].is_compressed())
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      # type_  = Int(2, default=1)  # the values include all codes valid for this field together with some more general codes
+      #                             # which can match more than one type of resource records
+      # class_ = Int(2, default=1)  # For example the class_ IN is for the Internet
+      name = "between 'type_' and 'class_'"
+      next_offset = offset + 4
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 4)
+      pkt.type_, pkt.class_, = _struct_0.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.name
+   except AttributeError:
+      pass
+   else:
+      new.name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__name
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.type_
+   except AttributeError:
+      pass
+   else:
+      new.type_ = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.class_
+   except AttributeError:
+      pass
+   else:
+      new.class_ = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   pkt.type_ = defaults.get('type_', 1)
+   pkt.class_ = defaults.get('class_', 1)
@@ -0,0 +1,160 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">HHIH")
+BISTURI_PACKET_COOKIE = '5e81a0c15058058cbe91b9c2583df1fdd604d924'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # name   = Ref(Label).repeated(until=lambda pkt, **k: pkt.name[-1].is_root() or pkt.name[-1].is_compressed())
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      # type_  = Int(2, default=1)
+      # class_ = Int(2, default=1)
+      # ttl    = Int(4)     # time interval that the RR may be cached before the source consult it again. Zero means shouldn't cached (SOA used this)
+      # length = Int(2)
+      name = "between 'type_' and 'length'"
+      fragments.append(_struct_0.pack(pkt.type_, pkt.class_, pkt.ttl, pkt.length))
+
+
+      # data   = Data(length) # (the data varies according type_ and class_)
+      name = "data"
+      value = pkt.data
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "name"
+      if len(raw) - offset < 10:
+         raise _incomplete_data(len(raw) - offset, 10)
+
+
+      # name   = Ref(Label).repeated(until=lambda pkt, **k: pkt.name[-1].is_root() or pkt.name[-1].is_compressed())
+      name, _, _, unpack = fields[0]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      # type_  = Int(2, default=1)
+      # class_ = Int(2, default=1)
+      # ttl    = Int(4)     # time interval that the RR may be cached before the source consult it again. Zero means shouldn't cached (SOA used this)
+      # length = Int(2)
+      name = "between 'type_' and 'length'"
+      next_offset = offset + 10
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 10)
+      pkt.type_, pkt.class_, pkt.ttl, pkt.length, = _struct_0.unpack_from(raw, offset)
+      offset = next_offset
+
+
+      # data   = Data(length) # (the data varies according type_ and class_)
+      name = "data"
+      byte_count = pkt.length
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.data = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.name
+   except AttributeError:
+      pass
+   else:
+      new.name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__name
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__name = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.type_
+   except AttributeError:
+      pass
+   else:
+      new.type_ = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.class_
+   except AttributeError:
+      pass
+   else:
+      new.class_ = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.ttl
+   except AttributeError:
+      pass
+   else:
+      new.ttl = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.data
+   except AttributeError:
+      pass
+   else:
+      new.data = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   pkt.type_ = defaults.get('type_', 1)
+   pkt.class_ = defaults.get('class_', 1)
+   pkt.ttl = defaults.get('ttl', 0)
+   pkt.length = defaults.get('length', 0)
+   pkt.data = defaults.get('data', b'')
@@ -0,0 +1,157 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">6s6sH")
+BISTURI_PACKET_COOKIE = '709fe8f5d70349f5a88e3c801ef5947b1785844d'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # dst_addr = Data(6)
+      # src_addr = Data(6)
+      # size     = Int(2)
+      name = "between 'dst_addr' and 'size'"
+      fragments.append(_struct_0.pack(pkt.dst_addr, pkt.src_addr, pkt.size))
+
+
+      # payload  = Data(lambda pkt, raw, offset, **k:
+      #                      pkt.size if pkt.size <= 1500 else (len(raw)-offset))
+      name = "payload"
+      value = pkt.payload
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "dst_addr"
+      if len(raw) - offset < 14:
+         raise _incomplete_data(len(raw) - offset, 14)
+
+
+      # dst_addr = Data(6)
+      # src_addr = Data(6)
+      # size     = Int(2)
+      name = "between 'dst_addr' and 'size'"
+      pkt.dst_addr, pkt.src_addr, pkt.size, = _struct_0.unpack_from(raw, offset)
+      offset += 14
+
+
+      # payload  = Data(lambda pkt, raw, offset, **k:
+      #                      pkt.size if pkt.size <= 1500 else (len(raw)-offset))
+      name = "payload"
+      byte_count = fields[3][1].byte_count(pkt=pkt, raw=raw, offset=offset, **k)
+      next_offset = offset + byte_count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      if len(chunk) != byte_count:
+         raise _incomplete_data(len(chunk), byte_count)
+      pkt.payload = chunk
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # dst_addr = Data(6)
+      # src_addr = Data(6)
+      # size     = Int(2)
+      name = "between 'dst_addr' and 'size'"
+      _struct_0.pack_into(buffer, offset, pkt.dst_addr, pkt.src_addr, pkt.size)
+      offset += 14
+
+
+      # payload  = Data(lambda pkt, raw, offset, **k:
+      #                      pkt.size if pkt.size <= 1500 else (len(raw)-offset))
+      name = "payload"
+      value = pkt.payload
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      next_offset = offset + len(value)
+      if next_offset > len(buffer):
+         raise Exception("The buffer has %i bytes but it is required at least %i" % (len(buffer), next_offset))
+      buffer[offset:next_offset] = value
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.dst_addr
+   except AttributeError:
+      pass
+   else:
+      new.dst_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.src_addr
+   except AttributeError:
+      pass
+   else:
+      new.src_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.size
+   except AttributeError:
+      pass
+   else:
+      new.size = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.payload
+   except AttributeError:
+      pass
+   else:
+      new.payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.dst_addr = defaults.get('dst_addr', b'\x00\x00\x00\x00\x00\x00')
+   pkt.src_addr = defaults.get('src_addr', b'\x00\x00\x00\x00\x00\x00')
+   pkt.size = defaults.get('size', 0)
+   pkt.payload = defaults.get('payload', b'')
@@ -0,0 +1,106 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">B")
+BISTURI_PACKET_COOKIE = '19cae8efe3166ddb8c0edc9d8ad515ad6578085b'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # next_header = Int(1)
+      name = "next_header"
+      fragments.append(_struct_0.pack(pkt.next_header))
+
+
+      # val         = Ref(lambda pkt, root, **k: {
+      #                      0: HopByHop(),
+      #                      1: Routing(),
+      #                   }[root.extentions[-1].next_header if root.extentions else root.next_header],
+      #                   default=HopByHop())
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "next_header"
+      if len(raw) - offset < 1:
+         raise _incomplete_data(len(raw) - offset, 1)
+
+
+      # next_header = Int(1)
+      name = "next_header"
+      pkt.next_header, = _struct_0.unpack_from(raw, offset)
+      offset += 1
+
+
+      # val         = Ref(lambda pkt, root, **k: {
+      #                      0: HopByHop(),
+      #                      1: Routing(),
+      #                   }[root.extentions[-1].next_header if root.extentions else root.next_header],
+      #                   default=HopByHop())
+      name, _, _, unpack = fields[1]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.next_header
+   except AttributeError:
+      pass
+   else:
+      new.next_header = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.val
+   except AttributeError:
+      pass
+   else:
+      new.val = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__val
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__val = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.next_header = defaults.get('next_header', 0)
+   fields[1][1].init(pkt, defaults)
@@ -0,0 +1,225 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">IHBB")
+_struct_1 = Struct(">0s")
+BISTURI_PACKET_COOKIE = 'e491963e6fc219af9c026bcdee7dae65684e9024'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # version        = Bits(4)
+      # traffic_class  = Bits(8)
+      # flow_label     = Bits(20)
+
+      # length      = Int(2)
+      # next_header = Int(1)
+      # hop_limit   = Int(1)
+      name = "between 'version' and 'hop_limit'"
+      if pkt.version & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.version)
+      if pkt.traffic_class & ~0xff:
+         raise ValueError("The value %i does not fit in 8 bits." % pkt.traffic_class)
+      if pkt.flow_label & ~0xfffff:
+         raise ValueError("The value %i does not fit in 20 bits." % pkt.flow_label)
+      fragments.append(_struct_0.pack((pkt.version << 28) | (pkt.traffic_class << 20) | pkt.flow_label, pkt.length, pkt.next_header, pkt.hop_limit))
+
+
+      # src_addr    = IPAddr(version=6)
+      name, _, pack, _ = fields[6]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # dst_addr    = IPAddr(version=6)
+      name, _, pack, _ = fields[7]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # extentions  = Ref(Extention).repeated(until = lambda pkt, **k: pkt.extentions[-1].next_header in (59, 6),
+      #                                         when = lambda pkt, **k: pkt.next_header not in (59, 6))
+      name, _, pack, _ = fields[8]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      # payload     = Data(0) # TODO pkt.length-len(pkt.extentions)
+      name = "payload"
+      fragments.append(_struct_1.pack(pkt.payload))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "version"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # version        = Bits(4)
+      # traffic_class  = Bits(8)
+      # flow_label     = Bits(20)
+
+      # length      = Int(2)
+      # next_header = Int(1)
+      # hop_limit   = Int(1)
+      name = "between 'version' and 'hop_limit'"
+      bits_0, pkt.length, pkt.next_header, pkt.hop_limit, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__version_traffic_class_flow_label = bits_0
+      pkt.version = (bits_0 & 0xf0000000) >> 28
+      pkt.traffic_class = (bits_0 & 0xff00000) >> 20
+      pkt.flow_label = bits_0 & 0xfffff
+      offset += 8
+
+
+      # src_addr    = IPAddr(version=6)
+      name, _, _, unpack = fields[6]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+      # dst_addr    = IPAddr(version=6)
+      name, _, _, unpack = fields[7]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+      # extentions  = Ref(Extention).repeated(until = lambda pkt, **k: pkt.extentions[-1].next_header in (59, 6),
+      #                                         when = lambda pkt, **k: pkt.next_header not in (59, 6))
+      name, _, _, unpack = fields[8]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+
+      # payload     = Data(0) # TODO pkt.length-len(pkt.extentions)
+      name = "payload"
+      next_offset = offset + 0
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 0)
+      pkt.payload, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.version
+   except AttributeError:
+      pass
+   else:
+      new.version = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.traffic_class
+   except AttributeError:
+      pass
+   else:
+      new.traffic_class = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flow_label
+   except AttributeError:
+      pass
+   else:
+      new.flow_label = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__version_traffic_class_flow_label
+   except AttributeError:
+      pass
+   else:
+      new._bits__version_traffic_class_flow_label = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.next_header
+   except AttributeError:
+      pass
+   else:
+      new.next_header = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.hop_limit
+   except AttributeError:
+      pass
+   else:
+      new.hop_limit = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.src_addr
+   except AttributeError:
+      pass
+   else:
+      new.src_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.dst_addr
+   except AttributeError:
+      pass
+   else:
+      new.dst_addr = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.extentions
+   except AttributeError:
+      pass
+   else:
+      new.extentions = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__extentions
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__extentions = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.payload
+   except AttributeError:
+      pass
+   else:
+      new.payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__version_traffic_class_flow_label = 0
+   pkt.version = defaults.get('version', 0)
+   pkt.traffic_class = defaults.get('traffic_class', 0)
+   pkt.flow_label = defaults.get('flow_label', 0)
+   pkt.length = defaults.get('length', 0)
+   pkt.next_header = defaults.get('next_header', 0)
+   pkt.hop_limit = defaults.get('hop_limit', 0)
+   fields[6][1].init(pkt, defaults)
+   fields[7][1].init(pkt, defaults)
+   fields[8][1].init(pkt, defaults)
+   pkt.payload = defaults.get('payload', b'')
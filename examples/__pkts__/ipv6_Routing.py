@@ -0,0 +1,118 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BBB")
+BISTURI_PACKET_COOKIE = '206602401c4f77b360e3bbaf172107fa6bd870e9'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # length       = Int(1)
+      # type         = Int(1)
+      # segment_left = Int(1)
+      name = "between 'length' and 'segment_left'"
+      fragments.append(_struct_0.pack(pkt.length, pkt.type, pkt.segment_left))
+
+
+      # options      = Ref(Option).repeated(until=lambda pkt, offset, **k: offset > (pkt.length * 8) + 4 + k['innermost-pkt-pos'])
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "length"
+      if len(raw) - offset < 3:
+         raise _incomplete_data(len(raw) - offset, 3)
+
+
+      # length       = Int(1)
+      # type         = Int(1)
+      # segment_left = Int(1)
+      name = "between 'length' and 'segment_left'"
+      pkt.length, pkt.type, pkt.segment_left, = _struct_0.unpack_from(raw, offset)
+      offset += 3
+
+
+      # options      = Ref(Option).repeated(until=lambda pkt, offset, **k: offset > (pkt.length * 8) + 4 + k['innermost-pkt-pos'])
+      name, _, _, unpack = fields[3]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.length
+   except AttributeError:
+      pass
+   else:
+      new.length = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.type
+   except AttributeError:
+      pass
+   else:
+      new.type = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.segment_left
+   except AttributeError:
+      pass
+   else:
+      new.segment_left = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.options
+   except AttributeError:
+      pass
+   else:
+      new.options = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__options
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__options = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.length = defaults.get('length', 0)
+   pkt.type = defaults.get('type', 0)
+   pkt.segment_left = defaults.get('segment_left', 0)
+   fields[3][1].init(pkt, defaults)
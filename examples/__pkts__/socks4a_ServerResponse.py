@@ -0,0 +1,127 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BBH4s")
+BISTURI_PACKET_COOKIE = 'a3539b26b6fd08d97a6aa6ee9792d0ef064dac73'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # version = Int(1, default=0x00)
+      # status  = Int(1) # see ServerStatus
+
+      # dst_port = Int(2)
+      # dst_ip   = Data(4)
+      name = "between 'version' and 'dst_ip'"
+      fragments.append(_struct_0.pack(pkt.version, pkt.status, pkt.dst_port, pkt.dst_ip))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "version"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # version = Int(1, default=0x00)
+      # status  = Int(1) # see ServerStatus
+
+      # dst_port = Int(2)
+      # dst_ip   = Data(4)
+      name = "between 'version' and 'dst_ip'"
+      pkt.version, pkt.status, pkt.dst_port, pkt.dst_ip, = _struct_0.unpack_from(raw, offset)
+      offset += 8
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # version = Int(1, default=0x00)
+      # status  = Int(1) # see ServerStatus
+
+      # dst_port = Int(2)
+      # dst_ip   = Data(4)
+      name = "between 'version' and 'dst_ip'"
+      _struct_0.pack_into(buffer, offset, pkt.version, pkt.status, pkt.dst_port, pkt.dst_ip)
+      offset += 8
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.version
+   except AttributeError:
+      pass
+   else:
+      new.version = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.status
+   except AttributeError:
+      pass
+   else:
+      new.status = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.dst_port
+   except AttributeError:
+      pass
+   else:
+      new.dst_port = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.dst_ip
+   except AttributeError:
+      pass
+   else:
+      new.dst_ip = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.version = defaults.get('version', 0)
+   pkt.status = defaults.get('status', 0)
+   pkt.dst_port = defaults.get('dst_port', 0)
+   pkt.dst_ip = defaults.get('dst_ip', b'\x00\x00\x00\x00')
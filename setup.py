@@ -46,6 +46,10 @@ install_deps=[
 optional_deps=[
         ]
 
+extras_deps={
+        'numpy': ['numpy'],  # columnar unpack (bisturi.columnar)
+        }
+
 setup(
     name='bisturi',
     version=__version__,
@@ -83,6 +87,7 @@ setup(
 
     python_requires='>=3.9',
     install_requires=install_deps + optional_deps,
+    extras_require=extras_deps,
 
     keywords='parsing parser dissector binary packet structure struct',
 
@@ -0,0 +1,102 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<II")
+BISTURI_PACKET_COOKIE = 'c96ee3d9fc00b8f6f3dd847ab3f232905fec84a1'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # first  = Int(4, endianness='little',  default=1)
+      # second = Int(4, endianness='little',  default=2)
+      name = "between 'first' and 'second'"
+      fragments.append(_struct_0.pack(pkt.first, pkt.second))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "first"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # first  = Int(4, endianness='little',  default=1)
+      # second = Int(4, endianness='little',  default=2)
+      name = "between 'first' and 'second'"
+      pkt.first, pkt.second, = _struct_0.unpack_from(raw, offset)
+      offset += 8
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # first  = Int(4, endianness='little',  default=1)
+      # second = Int(4, endianness='little',  default=2)
+      name = "between 'first' and 'second'"
+      _struct_0.pack_into(buffer, offset, pkt.first, pkt.second)
+      offset += 8
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.first
+   except AttributeError:
+      pass
+   else:
+      new.first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.second
+   except AttributeError:
+      pass
+   else:
+      new.second = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.first = defaults.get('first', 1)
+   pkt.second = defaults.get('second', 2)
@@ -0,0 +1,104 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct("<BHBH")
+BISTURI_PACKET_COOKIE = '24473e56b136f55049733127c61a100419c8b542'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # first  = Int(3, endianness='little',  default=1)
+      # second = Int(3, endianness='little',  default=2)
+      name = "between 'first' and 'second'"
+      fragments.append(_struct_0.pack(pkt.first & 0xff, pkt.first >> 8, pkt.second & 0xff, pkt.second >> 8))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "first"
+      if len(raw) - offset < 6:
+         raise _incomplete_data(len(raw) - offset, 6)
+
+
+      # first  = Int(3, endianness='little',  default=1)
+      # second = Int(3, endianness='little',  default=2)
+      name = "between 'first' and 'second'"
+      int_0_0, int_0_1, int_1_0, int_1_1, = _struct_0.unpack_from(raw, offset)
+      pkt.first = int_0_0 | (int_0_1 << 8)
+      pkt.second = int_1_0 | (int_1_1 << 8)
+      offset += 6
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # first  = Int(3, endianness='little',  default=1)
+      # second = Int(3, endianness='little',  default=2)
+      name = "between 'first' and 'second'"
+      _struct_0.pack_into(buffer, offset, pkt.first & 0xff, pkt.first >> 8, pkt.second & 0xff, pkt.second >> 8)
+      offset += 6
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.first
+   except AttributeError:
+      pass
+   else:
+      new.first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.second
+   except AttributeError:
+      pass
+   else:
+      new.second = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.first = defaults.get('first', 1)
+   pkt.second = defaults.get('second', 2)
@@ -0,0 +1,135 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BBBBB")
+BISTURI_PACKET_COOKIE = '1cee7c8d4606d6d1bd6d3e615ee04354f00cdf2d'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # clone = Int(1)
+      # iter_unpack = Int(1)
+      # unpack_many = Int(1)
+      # project = Int(1)
+      # repack = Int(1)
+      name = "between 'clone' and 'repack'"
+      fragments.append(_struct_0.pack(pkt.clone, pkt.iter_unpack, pkt.unpack_many, pkt.project, pkt.repack))
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "clone"
+      if len(raw) - offset < 5:
+         raise _incomplete_data(len(raw) - offset, 5)
+
+
+      # clone = Int(1)
+      # iter_unpack = Int(1)
+      # unpack_many = Int(1)
+      # project = Int(1)
+      # repack = Int(1)
+      name = "between 'clone' and 'repack'"
+      pkt.clone, pkt.iter_unpack, pkt.unpack_many, pkt.project, pkt.repack, = _struct_0.unpack_from(raw, offset)
+      offset += 5
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def pack_into_impl(pkt, buffer, offset, **k):
+
+   fields = pkt.get_fields()
+   try:
+
+      # clone = Int(1)
+      # iter_unpack = Int(1)
+      # unpack_many = Int(1)
+      # project = Int(1)
+      # repack = Int(1)
+      name = "between 'clone' and 'repack'"
+      _struct_0.pack_into(buffer, offset, pkt.clone, pkt.iter_unpack, pkt.unpack_many, pkt.project, pkt.repack)
+      offset += 5
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, offset, str(e))
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.clone
+   except AttributeError:
+      pass
+   else:
+      new.clone = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.iter_unpack
+   except AttributeError:
+      pass
+   else:
+      new.iter_unpack = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.unpack_many
+   except AttributeError:
+      pass
+   else:
+      new.unpack_many = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.project
+   except AttributeError:
+      pass
+   else:
+      new.project = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.repack
+   except AttributeError:
+      pass
+   else:
+      new.repack = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt.clone = defaults.get('clone', 0)
+   pkt.iter_unpack = defaults.get('iter_unpack', 0)
+   pkt.unpack_many = defaults.get('unpack_many', 0)
+   pkt.project = defaults.get('project', 0)
+   pkt.repack = defaults.get('repack', 0)
@@ -0,0 +1,129 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+BISTURI_PACKET_COOKIE = '07ef9ce97ac04b75363770bf66cde037097c4592'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # first  = Ref(SubPacket).repeated(count=4, default=[
+      #                                              SubPacket(value=1),
+      #                                              SubPacket(value=2),
+      #                                              SubPacket(value=3),
+      #                                              SubPacket(value=4)  ])
+      name, _, pack, _ = fields[0]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # second = Ref(SubPacket).repeated(count=4, default=[
+      #                                              SubPacket(value=5),
+      #                                              SubPacket(value=6),
+      #                                              SubPacket(value=7),
+      #                                              SubPacket(value=8)  ])
+      name, _, pack, _ = fields[1]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "first"
+      if len(raw) - offset < 8:
+         raise _incomplete_data(len(raw) - offset, 8)
+
+
+      # first  = Ref(SubPacket).repeated(count=4, default=[
+      #                                              SubPacket(value=1),
+      #                                              SubPacket(value=2),
+      #                                              SubPacket(value=3),
+      #                                              SubPacket(value=4)  ])
+      name = "first"
+      sequence = []
+      pkt.first = sequence
+      unpack = fields[0][1].prototype_field.unpack
+      count = 4
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__first)
+
+      # second = Ref(SubPacket).repeated(count=4, default=[
+      #                                              SubPacket(value=5),
+      #                                              SubPacket(value=6),
+      #                                              SubPacket(value=7),
+      #                                              SubPacket(value=8)  ])
+      name = "second"
+      sequence = []
+      pkt.second = sequence
+      unpack = fields[1][1].prototype_field.unpack
+      count = 4
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__second)
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.first
+   except AttributeError:
+      pass
+   else:
+      new.first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__first
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__first = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.second
+   except AttributeError:
+      pass
+   else:
+      new.second = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__second
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__second = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   fields[0][1].init(pkt, defaults)
+   fields[1][1].init(pkt, defaults)
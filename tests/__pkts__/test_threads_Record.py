@@ -0,0 +1,288 @@
+
+from struct import Struct
+from bisturi.fragments import Fragments
+from bisturi.packet import PacketError, _incomplete_data, _immutable_types, _clone_value, _default_template_of, _findable
+
+_struct_0 = Struct(">BB")
+_struct_1 = Struct(">B")
+BISTURI_PACKET_COOKIE = '2a282236fb1fc0c5660b4db19061496f131670f3'
+
+def pack_impl(pkt, fragments, **k):
+
+   k['innermost-pkt-pos'] = fragments.current_offset
+   fields = pkt.get_fields()
+   try:
+
+      # version = Bits(4)
+      # flags = Bits(4)
+      # count = Int(1)
+      name = "between 'version' and 'count'"
+      if pkt.version & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.version)
+      if pkt.flags & ~0xf:
+         raise ValueError("The value %i does not fit in 4 bits." % pkt.flags)
+      fragments.append(_struct_0.pack((pkt.version << 4) | pkt.flags, pkt.count))
+
+
+      # items = Ref(Item).repeated(count)
+      name, _, pack, _ = fields[3]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+
+      # has_extra = Int(1)
+      name = "has_extra"
+      fragments.append(_struct_1.pack(pkt.has_extra))
+
+
+      # extra = Int(2).when(has_extra)
+      name, _, pack, _ = fields[5]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # word = Data(until_marker=re.compile(b'[;,]+'))
+      name = "word"
+      value = pkt.word
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + pkt._delimiter__word)
+
+      # payload = Ref(lambda pkt, **k: Data(until_marker=re.compile(b'[.!]')), default=b'')
+      name, _, pack, _ = fields[7]
+      pack(pkt=pkt, fragments=fragments, **k)
+
+      # trailer = Data(until_marker=b'\0')
+      name = "trailer"
+      value = pkt.trailer
+      if not isinstance(value, bytes):
+         value = bytes(value)
+      fragments.append(value + b'\x00')
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(fragments.current_offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(False, name, pkt.__class__.__name__, fragments.current_offset, str(e))
+
+   return fragments
+
+def unpack_impl(pkt, raw, offset, **k):
+   k['innermost-pkt-pos'] = offset
+   fields = pkt.get_fields()
+   try:
+
+      name = "version"
+      if len(raw) - offset < 4:
+         raise _incomplete_data(len(raw) - offset, 4)
+
+
+      # version = Bits(4)
+      # flags = Bits(4)
+      # count = Int(1)
+      name = "between 'version' and 'count'"
+      bits_0, pkt.count, = _struct_0.unpack_from(raw, offset)
+      pkt._bits__version_flags = bits_0
+      pkt.version = (bits_0 & 0xf0) >> 4
+      pkt.flags = bits_0 & 0xf
+      offset += 2
+
+
+      # items = Ref(Item).repeated(count)
+      name = "items"
+      sequence = []
+      pkt.items = sequence
+      unpack = fields[3][1].prototype_field.unpack
+      count = pkt.count
+      for _ in range(count):
+         offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         sequence.append(pkt._seq_elem__items)
+
+
+      # has_extra = Int(1)
+      name = "has_extra"
+      next_offset = offset + 1
+      if next_offset > len(raw):
+         raise _incomplete_data(len(raw) - offset, 1)
+      pkt.has_extra, = _struct_1.unpack_from(raw, offset)
+      offset = next_offset
+
+
+      # extra = Int(2).when(has_extra)
+      name = "extra"
+      if bool(pkt.has_extra):
+         offset = fields[5][1].prototype_field.unpack(pkt=pkt, raw=raw, offset=offset, **k)
+         pkt.extra = pkt._opt_elem__extra
+      else:
+         pkt.extra = None
+
+      # word = Data(until_marker=re.compile(b'[;,]+'))
+      name = "word"
+      field = fields[6][1]
+      match = field.until_marker.search(raw, offset)
+      if not match:
+         raise field._marker_not_found(raw, offset)
+      count = match.start() - offset
+      extra_count = match.end() - match.start()
+      pkt._delimiter__word = bytes(match.group())
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.word = chunk
+      offset = next_offset + extra_count
+
+      # payload = Ref(lambda pkt, **k: Data(until_marker=re.compile(b'[.!]')), default=b'')
+      name, _, _, unpack = fields[7]
+      offset = unpack(pkt=pkt, raw=raw, offset=offset, **k)
+
+      # trailer = Data(until_marker=b'\0')
+      name = "trailer"
+      findable = raw if type(raw) is bytes else _findable(raw)
+      if findable is None:
+         match = fields[8][1]._until_marker_regexp.search(raw, offset)
+         position = match.start() if match else -1
+      else:
+         position = findable.find(b'\x00', offset)
+      if position < 0:
+         raise fields[8][1]._marker_not_found(raw, offset)
+      count = position - offset
+
+      extra_count = 1
+      next_offset = offset + count
+      chunk = raw[offset:next_offset]
+      if not isinstance(chunk, bytes):
+         chunk = bytes(chunk)
+      pkt.trailer = chunk
+      offset = next_offset + extra_count
+
+   except PacketError as e:
+      e.add_parent_field_and_packet(offset, name, pkt.__class__.__name__)
+      raise e
+   except Exception as e:
+      raise PacketError(True, name, pkt.__class__.__name__, offset, str(e))
+
+
+   return offset
+
+def clone_into_impl(pkt, new):
+
+   try:
+      value = pkt.version
+   except AttributeError:
+      pass
+   else:
+      new.version = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.flags
+   except AttributeError:
+      pass
+   else:
+      new.flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._bits__version_flags
+   except AttributeError:
+      pass
+   else:
+      new._bits__version_flags = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.count
+   except AttributeError:
+      pass
+   else:
+      new.count = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.items
+   except AttributeError:
+      pass
+   else:
+      new.items = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._seq_elem__items
+   except AttributeError:
+      pass
+   else:
+      new._seq_elem__items = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.has_extra
+   except AttributeError:
+      pass
+   else:
+      new.has_extra = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.extra
+   except AttributeError:
+      pass
+   else:
+      new.extra = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._opt_elem__extra
+   except AttributeError:
+      pass
+   else:
+      new._opt_elem__extra = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.word
+   except AttributeError:
+      pass
+   else:
+      new.word = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__word
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__word = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.payload
+   except AttributeError:
+      pass
+   else:
+      new.payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt._delimiter__payload
+   except AttributeError:
+      pass
+   else:
+      new._delimiter__payload = value if type(value) in _immutable_types else _clone_value(value)
+
+   try:
+      value = pkt.trailer
+   except AttributeError:
+      pass
+   else:
+      new.trailer = value if type(value) in _immutable_types else _clone_value(value)
+
+   return new
+
+def __init__(pkt, _initialize_fields=True, **defaults):
+   if not _initialize_fields:
+      return
+
+   if not defaults:
+      # all the fields take their default values: copy them
+      # from a packet already initialized
+      _default_template_of(pkt.__class__).clone_into_impl(pkt)
+      return
+
+   fields = pkt.get_fields()
+   pkt._bits__version_flags = 0
+   pkt.version = defaults.get('version', 0)
+   pkt.flags = defaults.get('flags', 0)
+   pkt.count = defaults.get('count', 0)
+   fields[3][1].init(pkt, defaults)
+   pkt.has_extra = defaults.get('has_extra', 0)
+   fields[5][1].init(pkt, defaults)
+   pkt.word = defaults.get('word', b'')
+   pkt._delimiter__word = b''
+   fields[7][1].init(pkt, defaults)
+   pkt.trailer = defaults.get('trailer', b'')
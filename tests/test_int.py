@@ -372,3 +372,99 @@ class TestInt(unittest.TestCase):
          obj_two_second_values = (6, 7)
       )
 
+
+   def test_int_in_a_subclass_of_a_packet_class(self):
+      class Parent(Packet):
+         first = Int(1)
+
+      class Child(Parent):
+         second = Int(1, default=7)
+
+      # the child does not use the methods generated for its parent
+      self.assertEqual(Child().second, 7)
+      self.assertEqual(Child(first=3).second, 7)
+      self.assertEqual(Child(second=3).clone().second, 3)
+
+      p = Child.unpack(b'\x02')
+      self.assertEqual(p.second, 2)
+      self.assertEqual(p.pack(), b'\x02')
+
+      self.assertEqual(Parent(first=3).pack(), b'\x03')
+
+   def _odd_size_int_packets(self, byte_count, signed, endianness, generate):
+      ''' Return two packet classes with an Int of the given size:
+          alone and between other Ints (within the same struct group). '''
+      if generate:
+         conf = {'generate_in_memory': True}
+      else:
+         conf = {'generate_for_pack': False, 'generate_for_unpack': False}
+
+      suffix = "%i_%s_%s_%s" % (byte_count, signed, endianness, generate)
+      Alone = type(Packet)('Alone_' + suffix, (Packet,), {
+         '__module__': __name__,
+         '__bisturi__': conf,
+         'value': Int(byte_count, signed=signed, endianness=endianness),
+         })
+
+      Between = type(Packet)('Between_' + suffix, (Packet,), {
+         '__module__': __name__,
+         '__bisturi__': conf,
+         'first': Int(1, endianness=endianness, default=0xaa),
+         'value': Int(byte_count, signed=signed, endianness=endianness),
+         'last': Int(2, endianness=endianness, default=0xbbcc),
+         })
+
+      return Alone, Between
+
+   def test_odd_size_int_generated_code(self):
+      # the Ints of 3, 5, 6 and 7 bytes are packed in pieces within
+      # a struct and the Ints of 16 bytes with int.to_bytes: the generated
+      # code must be equivalent to Int.pack/unpack
+      import inspect
+      from bisturi.packet import PacketError
+
+      for byte_count in (3, 5, 6, 7, 16):
+         for signed in (False, True):
+            for endianness in ('big', 'little'):
+               generated = self._odd_size_int_packets(byte_count, signed, endianness, True)
+               plain = self._odd_size_int_packets(byte_count, signed, endianness, False)
+
+               # the Int in between is unpacked in pieces (int_1_0, int_1_1...)
+               # with the other Ints or on its own with int.from_bytes
+               source = inspect.getsource(generated[1].unpack_impl)
+               if byte_count == 16:
+                  self.assertIn('int.from_bytes', source)
+               else:
+                  self.assertIn('pkt.first, int_1_0, int_1_1,', source)
+
+               bits = byte_count * 8
+               pattern = int.from_bytes(bytes(range(1, byte_count+1)), 'big')
+               if signed:
+                  lowest, highest = -(1 << (bits-1)), (1 << (bits-1)) - 1
+                  values = [lowest, -pattern, -1, 0, 1, pattern, highest]
+               else:
+                  lowest, highest = 0, (1 << bits) - 1
+                  values = [0, 1, pattern, highest]
+
+               for value in values:
+                  raw = value.to_bytes(byte_count, endianness, signed=signed)
+                  for Alone, Between in (generated, plain):
+                     self.assertEqual(Alone(value=value).pack(), raw)
+                     self.assertEqual(Alone.unpack(raw).value, value)
+
+                     raw_between = Between(value=value).pack()
+                     self.assertEqual(raw_between[1:-2], raw)
+                     self.assertEqual(Between.unpack(raw_between).value, value)
+
+                     buf = bytearray(byte_count)
+                     Alone(value=value).pack_into(buf)
+                     self.assertEqual(bytes(buf), raw)
+
+                  self.assertEqual(
+                        generated[1](value=value).pack(),
+                        plain[1](value=value).pack())
+
+               for value in (lowest - 1, highest + 1):
+                  for Alone, Between in (generated, plain):
+                     self.assertRaises(PacketError, Alone(value=value).pack)
+                     self.assertRaises(PacketError, Between(value=value).pack)
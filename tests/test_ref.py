@@ -366,3 +366,48 @@ class TestRef(unittest.TestCase):
       arguments_per_call.pop()
 
       # TODO add more tests on packing
+
+   def test_ref_subpacket_defaults_are_not_shared(self):
+      class RefSubPacketShared(Packet):
+         first  = Ref(SubPacket(value=1))
+         second = Ref(SubPacket).repeated(count=1)
+
+      one = RefSubPacketShared()
+      one.first.value = 2
+      one.second.append(SubPacket(value=3))
+
+      two = RefSubPacketShared()
+      assert two.first is not one.first
+      assert two.first.value == 1
+      assert two.second == []
+
+      three = one.clone()
+      assert three.first is not one.first
+      assert three.second[0] is not one.second[0]
+      assert (three.first.value, three.second[0].value) == (2, 3)
+
+   def test_ref_subpacket_with_fields_named_as_packet_methods(self):
+      class Methods(Packet):
+         clone = Int(1)
+         iter_unpack = Int(1)
+         unpack_many = Int(1)
+         project = Int(1)
+         repack = Int(1)
+
+      class RefMethods(Packet):
+         first = Ref(Methods)
+         second = Ref(Methods).repeated(count=2)
+
+      raw = bytes(range(15))
+      one = RefMethods.unpack(raw)
+      assert (one.first.clone, one.first.repack, one.second[1].repack) == (0, 4, 14)
+      assert one.pack() == raw
+
+      two = Packet.clone(one)
+      assert two.first is not one.first
+      assert two.pack() == raw
+
+      pkts, offset = Packet.unpack_many.__func__(Methods, raw)
+      assert ([p.clone for p in pkts], offset) == ([0, 5, 10], 15)
+
+      assert RefMethods().pack() == bytes(5)
@@ -0,0 +1,118 @@
+import sys, re, random
+sys.path.append("../")
+
+from concurrent.futures import ThreadPoolExecutor
+
+from bisturi.packet import Packet
+from bisturi.field  import Int, Data, Ref, Bits
+
+import unittest
+
+class Item(Packet):
+   tag = Int(1)
+   text = Data(until_marker=(b'\r\n', b'\n'))
+
+class Record(Packet):
+   version = Bits(4)
+   flags = Bits(4)
+   count = Int(1)
+   items = Ref(Item).repeated(count)
+   has_extra = Int(1)
+   extra = Int(2).when(has_extra)
+   word = Data(until_marker=re.compile(b'[;,]+'))
+   payload = Ref(lambda pkt, **k: Data(until_marker=re.compile(b'[.!]')), default=b'')
+   trailer = Data(until_marker=b'\0')
+
+# the same field returned by the callables of two Ref
+TEXT = Data(until_marker=b'\0')
+
+class Shared(Packet):
+   a = Ref(lambda **k: TEXT, default=b'')
+   b = Ref(lambda **k: TEXT, default=b'')
+
+def build_record(rnd):
+   ''' Build a random record and return it packed with the values
+       that the unpack must find. '''
+   items = []
+   for i in range(rnd.randint(0, 4)):
+      items.append((rnd.randint(0, 255), b'item%i' % rnd.randint(0, 999), rnd.choice((b'\r\n', b'\n'))))
+
+   has_extra = rnd.randint(0, 1)
+   extra = rnd.randint(0, 65535) if has_extra else None
+   word_delimiter = rnd.choice((b';', b',', b';;', b',;'))
+   payload_delimiter = rnd.choice((b'.', b'!'))
+
+   raw = bytes([(rnd.randint(0, 15) << 4) | rnd.randint(0, 15), len(items)])
+   raw += b''.join(bytes([tag]) + text + delimiter for tag, text, delimiter in items)
+   raw += bytes([has_extra]) + (extra.to_bytes(2, 'big') if has_extra else b'')
+   raw += b'w%i' % rnd.randint(0, 999) + word_delimiter
+   raw += b'p%i' % rnd.randint(0, 999) + payload_delimiter
+   raw += b't%i\0' % rnd.randint(0, 999)
+
+   return raw, (items, extra, word_delimiter, payload_delimiter)
+
+def unpack_and_check(raw, expected):
+   items, extra, word_delimiter, payload_delimiter = expected
+
+   pkt = Record.unpack(raw)
+   assert [(i.tag, i.text, i._delimiter__text) for i in pkt.items] == items
+   assert pkt.extra == extra
+   assert pkt._delimiter__word == word_delimiter
+   assert pkt._delimiter__payload == payload_delimiter
+
+   # the pack uses the delimiters of this packet, not the ones of another
+   # packet unpacked at the same time
+   assert pkt.pack() == raw
+
+   return True
+
+class TestThreads(unittest.TestCase):
+   def setUp(self):
+      # switch threads as often as possible to interleave the unpacks
+      self.switch_interval = sys.getswitchinterval()
+      sys.setswitchinterval(1e-6)
+
+   def tearDown(self):
+      sys.setswitchinterval(self.switch_interval)
+
+   def test_unpack_the_same_packet_class_from_several_threads(self):
+      rnd = random.Random(31416)
+      records = [build_record(rnd) for _ in range(500)]
+
+      # sanity check: all of them pass when they are unpacked one at time
+      for raw, expected in records:
+         unpack_and_check(raw, expected)
+
+      with ThreadPoolExecutor(max_workers=8) as executor:
+         for _ in range(4):
+            results = executor.map(lambda r: unpack_and_check(*r), records)
+            self.assertTrue(all(results))
+
+   def test_unpack_the_same_raw_with_different_delimiters(self):
+      # the same field finds a different delimiter in each buffer: each
+      # packet must keep its own
+      raws = [b'\x00\x00\x00w' + d + b'p.t\0' for d in (b';', b',', b';,;')]
+
+      def unpack_and_pack(raw):
+         return Record.unpack(raw).pack() == raw
+
+      with ThreadPoolExecutor(max_workers=6) as executor:
+         results = executor.map(unpack_and_pack, raws * 2000)
+         self.assertTrue(all(results))
+
+   def test_unpack_a_field_shared_by_several_refs(self):
+      raw = b'first\0second\0'
+
+      def unpack_and_pack(raw):
+         pkt = Shared.unpack(raw)
+         return (pkt.a, pkt.b, pkt.pack()) == (b'first', b'second', raw)
+
+      with ThreadPoolExecutor(max_workers=8) as executor:
+         results = executor.map(unpack_and_pack, [raw] * 4000)
+         self.assertTrue(all(results))
+
+      # the returned field was not modified
+      self.assertFalse(hasattr(TEXT, 'field_name'))
+
+if __name__ == '__main__':
+   unittest.main()